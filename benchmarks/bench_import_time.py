@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark de tempo de import e memória (RSS) de um worker novo.
+
+Cada módulo é importado em um interpretador limpo, várias vezes, e o
+resultado mostra a mediana do tempo, o pico de RSS e quais dependências
+pesadas acabaram carregadas.
+
+Uso:
+    python benchmarks/bench_import_time.py [--runs 5] [modulo ...]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    'src.main',
+    'src.routes.ai_advanced',
+    'src.ai_engine',
+    'src.ai_models',
+]
+
+HEAVY_MODULES = ['numpy', 'sklearn', 'scipy', 'joblib', 'openai']
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    'seconds': elapsed,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'heavy': [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+def measure(module, runs, env):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        'module': module,
+        'median_ms': round(statistics.median(s['seconds'] for s in samples) * 1000, 1),
+        'max_rss_mb': round(max(s['max_rss_mb'] for s in samples), 1),
+        'heavy': samples[-1]['heavy']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    args = parser.parse_args()
+
+    # Banco descartável: importar src.main não deve tocar no banco real
+    env = dict(os.environ)
+    env.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+    print(f"{'módulo':<28} {'mediana (ms)':>12} {'RSS (MB)':>10}  dependências pesadas")
+    for module in args.modules:
+        result = measure(module, args.runs, env)
+        print(f"{result['module']:<28} {result['median_ms']:>12} {result['max_rss_mb']:>10}  "
+              f"{', '.join(result['heavy']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,8 @@ import os
 import shutil
 import subprocess
 
+from src.static_assets import compress_assets
+
 def build_and_copy_frontend():
     frontend_path = "frontend"
     backend_static_path = "src/static"
@@ -27,6 +29,11 @@ def build_and_copy_frontend():
     frontend_dist = os.path.join(frontend_path, "dist")
     shutil.copytree(frontend_dist, backend_static_path)
 
+    # Versões .gz/.br e manifesto: o servidor só escolhe o arquivo pronto
+    assets = compress_assets(backend_static_path)
+    compressed = sum(1 for entry in assets.values() if entry['encodings'])
+    print(f"🗜️  {compressed} de {len(assets)} arquivos pré-comprimidos")
+
     print("✅ Build concluído!")
 
 if __name__ == "__main__":
@@ -16,6 +16,41 @@ errorlog = "-"
 loglevel = "info"
 
 # Performance
-preload_app = False  # deixe False a menos que tenha certeza que conexões não são criadas no import
+# Com preload a aplicação é importada uma vez no mestre e os workers herdam
+# o estado somente leitura (motor de IA, bases do tutor, catálogos) por
+# copy-on-write. Os pools de conexão são descartados antes e depois do fork
+# (ver src/prefork.py). Com GUNICORN_PRELOAD=0 não há aquecimento no mestre;
+# o app criado pelo bootstrap (on_starting) ainda é herdado, então post_fork
+# descarta os pools em qualquer caso.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1").lower() not in ("0", "false", "no")
 max_requests = 1000
 max_requests_jitter = 100
+
+
+# Hooks de inicialização
+def on_starting(server):
+    # Schema e dados padrão uma única vez, no mestre, antes de existir qualquer
+    # worker. Desative com CURIO_BOOTSTRAP=0 quando o deploy já rodar
+    # `flask --app src.main curio bootstrap` como etapa de release.
+    if os.environ.get("CURIO_BOOTSTRAP", "1").lower() in ("0", "false", "no"):
+        return
+    from src.bootstrap import bootstrap_database
+    from src.main import app
+    if not app.config["CURIO_BLUEPRINT_SETS"]:
+        return  # perfil 'static': não usa o banco
+    bootstrap_database(app)
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+    from src.prefork import warm_up
+    elapsed = warm_up(server.app.wsgi())
+    server.log.info("Estado compartilhado aquecido no mestre em %.2fs", elapsed)
+
+
+def post_fork(server, worker):
+    # Também sem preload: o mestre importou src.main no on_starting e o worker
+    # herda essa aplicação (e o que houver no pool dela)
+    from src.prefork import after_fork
+    after_fork(server.app.wsgi())
@@ -0,0 +1,155 @@
+"""
+Análise em lote dos perfis de aprendizagem (AIPersonalizationEngine).
+
+Percorre os registros de Progress (já unidos a Content, ver
+src/services/student_progress.py) em blocos de estudantes, distribui os
+blocos entre processos e grava os perfis resultantes em AIPersonalization
+em lotes, com um commit por bloco.
+
+Uso:
+    python -m src.ai_bulk_analysis --chunk-size 500 --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.models.user import db
+from src.models.ai_personalization import AIPersonalization
+from src.ai_engine import AIPersonalizationEngine, LearningProfile
+from src.services.student_progress import iter_analysis_inputs
+
+# Motor de IA de cada processo de trabalho (criado sob demanda)
+_worker_engine = None
+
+
+@dataclass
+class BulkAnalysisReport:
+    """Resumo de uma execução da análise em lote"""
+    students: int
+    progress_records: int
+    chunks: int
+    elapsed_seconds: float
+
+    @property
+    def students_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.students)
+        return self.students / self.elapsed_seconds
+
+    def to_dict(self) -> Dict:
+        return {
+            'students': self.students,
+            'progress_records': self.progress_records,
+            'chunks': self.chunks,
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'students_per_second': round(self.students_per_second, 1)
+        }
+
+
+def _analyze_chunk(chunk: List[Dict]) -> List[LearningProfile]:
+    """Executado nos processos de trabalho: analisa um bloco de estudantes"""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = AIPersonalizationEngine()
+    return [_worker_engine.analyze_student_behavior(student_data) for student_data in chunk]
+
+
+def _save_profiles(profiles: List[LearningProfile]) -> None:
+    """Grava (insere ou atualiza) um lote de perfis com um único commit"""
+    student_ids = [profile.student_id for profile in profiles]
+
+    existing = {}
+    for personalization in AIPersonalization.query.filter(
+        AIPersonalization.student_id.in_(student_ids)
+    ).order_by(AIPersonalization.id):
+        existing.setdefault(personalization.student_id, personalization)
+
+    for profile in profiles:
+        personalization = existing.get(profile.student_id)
+        if personalization is None:
+            personalization = AIPersonalization(student_id=profile.student_id)
+            db.session.add(personalization)
+        personalization.apply_learning_profile(profile)
+
+    db.session.commit()
+
+
+def run_bulk_analysis(chunk_size: int = 500, workers: Optional[int] = None) -> BulkAnalysisReport:
+    """
+    Analisa todos os estudantes com registros de progresso.
+
+    Deve ser chamada dentro de um app context. Com `workers` <= 1 a análise
+    roda no próprio processo; caso contrário os blocos são distribuídos em um
+    ProcessPoolExecutor enquanto o processo principal lê o próximo bloco e
+    grava os resultados já prontos.
+
+    Os campos persistidos não dependem dos dados de interação, por isso as
+    entradas são montadas sem as interações simuladas do endpoint HTTP.
+    """
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    started = time.perf_counter()
+    students = 0
+    records = 0
+    chunks = 0
+
+    def count(chunk):
+        nonlocal students, records, chunks
+        students += len(chunk)
+        records += sum(len(s['progress_records']) for s in chunk)
+        chunks += 1
+
+    try:
+        if workers <= 1:
+            for chunk in iter_analysis_inputs(chunk_size):
+                count(chunk)
+                _save_profiles(_analyze_chunk(chunk))
+        else:
+            # 'spawn' evita herdar as conexões do pool do SQLAlchemy no fork
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                pending = deque()
+                for chunk in iter_analysis_inputs(chunk_size):
+                    count(chunk)
+                    pending.append(executor.submit(_analyze_chunk, chunk))
+                    # Limita os blocos em voo para manter a memória estável
+                    while len(pending) >= workers * 2:
+                        _save_profiles(pending.popleft().result())
+                while pending:
+                    _save_profiles(pending.popleft().result())
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return BulkAnalysisReport(
+        students=students,
+        progress_records=records,
+        chunks=chunks,
+        elapsed_seconds=time.perf_counter() - started
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Análise em lote dos perfis de aprendizagem')
+    parser.add_argument('--chunk-size', type=int, default=500,
+                        help='estudantes por bloco (unidade de trabalho e de commit)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='processos de análise (1 = sem paralelismo)')
+    args = parser.parse_args(argv)
+
+    from src.main import app
+
+    with app.app_context():
+        report = run_bulk_analysis(chunk_size=args.chunk_size, workers=args.workers)
+
+    print(f"✅ {report.students} estudantes analisados ({report.progress_records} registros) "
+          f"em {report.elapsed_seconds:.2f}s - {report.students_per_second:.1f} estudantes/s")
+    return report
+
+
+if __name__ == '__main__':
+    main()
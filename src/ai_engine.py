@@ -3,9 +3,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics.pairwise import cosine_similarity
+from src.ai_models import CONTENT_STYLE_MAPPING, LearningStyleModel, learning_style_vector
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -37,12 +35,85 @@ class ContentRecommendation:
     estimated_time: int  # em minutos
     prerequisite_concepts: List[str]
 
+@dataclass
+class ProgressFeatures:
+    """Registros de progresso de um estudante em formato colunar (uma posição por registro)"""
+    scores: np.ndarray  # 0 quando ausente
+    times: np.ndarray  # minutos, 0 quando ausente
+    has_content: np.ndarray  # registro tem dados de conteúdo
+    type_codes: np.ndarray  # índices em content_types (-1 sem conteúdo)
+    difficulty_codes: np.ndarray  # índices em difficulty_levels
+    subject_codes: np.ndarray  # índices em subjects
+    content_types: List[str]
+    difficulty_levels: List[str]
+    subjects: List[str]
+
+    @property
+    def scored(self) -> np.ndarray:
+        """Registros com conteúdo e score preenchido"""
+        return self.has_content & (self.scores != 0)
+
+    @property
+    def timed(self) -> np.ndarray:
+        """Registros com tempo gasto preenchido"""
+        return self.times != 0
+
+def extract_progress_features(progress_records: List[Dict]) -> ProgressFeatures:
+    """
+    Converte os registros de progresso em arrays NumPy em uma única passada.
+    Os códigos categóricos seguem a ordem de primeira ocorrência dos valores.
+    """
+    type_index, difficulty_index, subject_index = {}, {}, {}
+    scores, times, has_content = [], [], []
+    type_codes, difficulty_codes, subject_codes = [], [], []
+    
+    for record in progress_records:
+        scores.append(record.get('score') or 0)
+        times.append(record.get('time_spent') or 0)
+        content = record.get('content')
+        if content:
+            has_content.append(True)
+            type_codes.append(type_index.setdefault(content.get('content_type', 'unknown'), len(type_index)))
+            difficulty_codes.append(difficulty_index.setdefault(content.get('difficulty_level', 'medium'), len(difficulty_index)))
+            subject_codes.append(subject_index.setdefault(content.get('subject', 'unknown'), len(subject_index)))
+        else:
+            has_content.append(False)
+            type_codes.append(-1)
+            difficulty_codes.append(-1)
+            subject_codes.append(-1)
+    
+    return ProgressFeatures(
+        scores=np.asarray(scores, dtype=float),
+        times=np.asarray(times, dtype=float),
+        has_content=np.asarray(has_content, dtype=bool),
+        type_codes=np.asarray(type_codes, dtype=np.int64),
+        difficulty_codes=np.asarray(difficulty_codes, dtype=np.int64),
+        subject_codes=np.asarray(subject_codes, dtype=np.int64),
+        content_types=list(type_index),
+        difficulty_levels=list(difficulty_index),
+        subjects=list(subject_index)
+    )
+
+def _grouped_means(codes: np.ndarray, values: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Média de `values` por código entre as posições de `mask`, com os grupos
+    na ordem em que aparecem pela primeira vez nos registros selecionados.
+    """
+    group_codes = codes[mask]
+    if group_codes.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=float)
+    
+    unique_codes, first_index, inverse = np.unique(group_codes, return_index=True, return_inverse=True)
+    means = np.bincount(inverse, weights=values[mask]) / np.bincount(inverse)
+    order = np.argsort(first_index, kind='stable')
+    return unique_codes[order], means[order]
+
 class AIPersonalizationEngine:
     """Motor de IA para personalização educacional"""
     
-    def __init__(self):
-        self.scaler = StandardScaler()
-        self.learning_style_classifier = None
+    def __init__(self, model_dir: Optional[str] = None):
+        # Modelo de estilos treinado offline (python -m src.ai_models), mapeado em memória
+        self.learning_style_classifier = LearningStyleModel.load(model_dir)
         self.content_recommender = None
         self.performance_predictor = None
         
@@ -54,27 +125,30 @@ class AIPersonalizationEngine:
         progress_records = student_data.get('progress_records', [])
         interaction_data = student_data.get('interactions', [])
         
+        # Registros em formato colunar: todas as estatísticas saem destes arrays
+        features = extract_progress_features(progress_records)
+        
         # Análise do estilo de aprendizagem
-        learning_style = self._detect_learning_style(progress_records, interaction_data)
+        learning_style = self._detect_learning_style(features, interaction_data)
         
         # Análise de preferência de dificuldade
-        difficulty_preference = self._analyze_difficulty_preference(progress_records)
+        difficulty_preference = self._analyze_difficulty_preference(features)
         
         # Análise de ritmo de aprendizagem
-        pace_preference = self._analyze_learning_pace(progress_records)
+        pace_preference = self._analyze_learning_pace(features)
         
         # Análise de span de atenção
         attention_span = self._estimate_attention_span(interaction_data)
         
         # Identificação de tipos de conteúdo preferidos
-        preferred_content_types = self._identify_preferred_content_types(progress_records)
+        preferred_content_types = self._identify_preferred_content_types(features)
         
         # Identificação de matérias fortes e fracas
-        strong_subjects, weak_subjects = self._analyze_subject_performance(progress_records)
+        strong_subjects, weak_subjects = self._analyze_subject_performance(features)
         
         # Cálculo de engajamento e confiança
         engagement_score = self._calculate_engagement_score(interaction_data)
-        confidence_level = self._calculate_confidence_level(progress_records)
+        confidence_level = self._calculate_confidence_level(features)
         
         return LearningProfile(
             student_id=student_id,
@@ -89,70 +163,37 @@ class AIPersonalizationEngine:
             confidence_level=confidence_level
         )
     
-    def _detect_learning_style(self, progress_records: List, interaction_data: List) -> str:
+    def _detect_learning_style(self, features: ProgressFeatures, interaction_data: List) -> str:
         """Detecta o estilo de aprendizagem baseado no desempenho por tipo de conteúdo"""
-        content_performance = {}
-        
-        for record in progress_records:
-            if record.get('content') and record.get('score'):
-                content_type = record['content'].get('content_type', 'unknown')
-                score = record['score']
-                
-                if content_type not in content_performance:
-                    content_performance[content_type] = []
-                content_performance[content_type].append(score)
-        
-        # Calcular média de desempenho por tipo de conteúdo
-        avg_performance = {}
-        for content_type, scores in content_performance.items():
-            avg_performance[content_type] = np.mean(scores)
-        
-        # Mapear tipos de conteúdo para estilos de aprendizagem
-        style_mapping = {
-            'video': 'visual',
-            'image': 'visual',
-            'audio': 'auditory',
-            'game': 'kinesthetic',
-            'simulation': 'kinesthetic',
-            'text': 'mixed'
-        }
+        # Com modelo treinado e dados suficientes, usa o cluster mais próximo
+        if self.learning_style_classifier is not None:
+            vector = learning_style_vector(features)
+            if vector is not None:
+                return self.learning_style_classifier.predict(vector)
         
-        # Encontrar o estilo com melhor desempenho
-        best_style_score = 0
-        best_style = 'mixed'
+        # Média de desempenho por tipo de conteúdo
+        type_codes, avg_scores = _grouped_means(features.type_codes, features.scores, features.scored)
         
-        for content_type, score in avg_performance.items():
-            style = style_mapping.get(content_type, 'mixed')
-            if score > best_style_score:
-                best_style_score = score
-                best_style = style
+        # Encontrar o estilo com melhor desempenho (primeiro tipo em caso de empate)
+        if avg_scores.size == 0 or avg_scores.max() <= 0:
+            return 'mixed'
         
-        return best_style
+        best_type = features.content_types[type_codes[int(np.argmax(avg_scores))]]
+        return CONTENT_STYLE_MAPPING.get(best_type, 'mixed')
     
-    def _analyze_difficulty_preference(self, progress_records: List) -> str:
+    def _analyze_difficulty_preference(self, features: ProgressFeatures) -> str:
         """Analisa a preferência de dificuldade baseada no desempenho"""
-        difficulty_performance = {'easy': [], 'medium': [], 'hard': []}
-        
-        for record in progress_records:
-            if record.get('content') and record.get('score'):
-                difficulty = record['content'].get('difficulty_level', 'medium')
-                score = record['score']
-                
-                if difficulty in difficulty_performance:
-                    difficulty_performance[difficulty].append(score)
-        
         # Calcular performance média por dificuldade
-        avg_scores = {}
-        for difficulty, scores in difficulty_performance.items():
-            if scores:
-                avg_scores[difficulty] = np.mean(scores)
+        difficulty_codes, means = _grouped_means(features.difficulty_codes, features.scores, features.scored)
+        avg_scores = {
+            features.difficulty_levels[code]: mean
+            for code, mean in zip(difficulty_codes, means)
+            if features.difficulty_levels[code] in ('easy', 'medium', 'hard')
+        }
         
         if not avg_scores:
             return 'medium'
         
-        # Encontrar o nível de dificuldade com melhor performance
-        best_difficulty = max(avg_scores, key=avg_scores.get)
-        
         # Se a performance em 'hard' for boa (>80), recomendar 'hard'
         if avg_scores.get('hard', 0) > 80:
             return 'hard'
@@ -161,18 +202,14 @@ class AIPersonalizationEngine:
         else:
             return 'easy'
     
-    def _analyze_learning_pace(self, progress_records: List) -> str:
+    def _analyze_learning_pace(self, features: ProgressFeatures) -> str:
         """Analisa o ritmo de aprendizagem baseado no tempo gasto"""
-        times = []
+        times = features.times[features.timed]
         
-        for record in progress_records:
-            if record.get('time_spent'):
-                times.append(record['time_spent'])
-        
-        if not times:
+        if times.size == 0:
             return 'normal'
         
-        avg_time = np.mean(times)
+        avg_time = times.mean()
         
         # Classificar ritmo baseado no tempo médio
         if avg_time < 15:  # menos de 15 minutos
@@ -197,61 +234,37 @@ class AIPersonalizationEngine:
         median_duration = np.median(session_durations)
         return int(min(max(median_duration, 10), 60))  # entre 10 e 60 minutos
     
-    def _identify_preferred_content_types(self, progress_records: List) -> List[str]:
+    def _identify_preferred_content_types(self, features: ProgressFeatures) -> List[str]:
         """Identifica tipos de conteúdo preferidos baseado no engajamento"""
-        content_engagement = {}
-        
-        for record in progress_records:
-            if record.get('content') and record.get('score') and record.get('time_spent'):
-                content_type = record['content'].get('content_type', 'unknown')
-                score = record['score']
-                time_spent = record['time_spent']
-                
-                # Calcular engajamento como combinação de score e tempo
-                engagement = (score / 100) * min(time_spent / 30, 1)  # normalizar tempo para 30 min
-                
-                if content_type not in content_engagement:
-                    content_engagement[content_type] = []
-                content_engagement[content_type].append(engagement)
-        
-        # Calcular engajamento médio por tipo
-        avg_engagement = {}
-        for content_type, engagements in content_engagement.items():
-            avg_engagement[content_type] = np.mean(engagements)
+        # Engajamento como combinação de score e tempo (tempo normalizado para 30 min)
+        engagement = (features.scores / 100) * np.minimum(features.times / 30, 1)
+        type_codes, avg_engagement = _grouped_means(
+            features.type_codes, engagement, features.scored & features.timed
+        )
         
         # Retornar tipos com engajamento acima da média
-        if not avg_engagement:
+        if avg_engagement.size == 0:
             return ['mixed']
         
-        overall_avg = np.mean(list(avg_engagement.values()))
-        preferred_types = [ct for ct, eng in avg_engagement.items() if eng > overall_avg]
+        overall_avg = avg_engagement.mean()
+        preferred_types = [
+            features.content_types[code]
+            for code in type_codes[avg_engagement > overall_avg]
+        ]
         
         return preferred_types if preferred_types else ['mixed']
     
-    def _analyze_subject_performance(self, progress_records: List) -> Tuple[List[str], List[str]]:
+    def _analyze_subject_performance(self, features: ProgressFeatures) -> Tuple[List[str], List[str]]:
         """Analisa performance por matéria para identificar pontos fortes e fracos"""
-        subject_performance = {}
-        
-        for record in progress_records:
-            if record.get('content') and record.get('score'):
-                subject = record['content'].get('subject', 'unknown')
-                score = record['score']
-                
-                if subject not in subject_performance:
-                    subject_performance[subject] = []
-                subject_performance[subject].append(score)
-        
         # Calcular média por matéria
-        avg_scores = {}
-        for subject, scores in subject_performance.items():
-            avg_scores[subject] = np.mean(scores)
+        subject_codes, avg_scores = _grouped_means(features.subject_codes, features.scores, features.scored)
         
-        if not avg_scores:
+        if avg_scores.size == 0:
             return [], []
         
         # Classificar como forte (>75) ou fraco (<60)
-        strong_subjects = [subj for subj, score in avg_scores.items() if score > 75]
-        weak_subjects = [subj for subj, score in avg_scores.items() if score < 60]
+        strong_subjects = [features.subjects[code] for code in subject_codes[avg_scores > 75]]
+        weak_subjects = [features.subjects[code] for code in subject_codes[avg_scores < 60]]
         
         return strong_subjects, weak_subjects
     
@@ -272,24 +285,22 @@ class AIPersonalizationEngine:
         engagement_score = (duration_score + frequency_score) / 2
         return min(max(engagement_score, 0), 1)
     
-    def _calculate_confidence_level(self, progress_records: List) -> float:
+    def _calculate_confidence_level(self, features: ProgressFeatures) -> float:
         """Calcula nível de confiança baseado no histórico de performance"""
-        if not progress_records:
+        if features.scores.size == 0:
             return 0.5
         
-        recent_scores = []
-        for record in progress_records[-10:]:  # últimos 10 registros
-            if record.get('score'):
-                recent_scores.append(record['score'])
+        recent_scores = features.scores[-10:]  # últimos 10 registros
+        recent_scores = recent_scores[recent_scores != 0]
         
-        if not recent_scores:
+        if recent_scores.size == 0:
             return 0.5
         
-        avg_score = np.mean(recent_scores)
-        score_consistency = 1 - (np.std(recent_scores) / 100)  # penalizar inconsistência
+        avg_score = recent_scores.mean()
+        score_consistency = 1 - (recent_scores.std() / 100)  # penalizar inconsistência
         
         confidence = (avg_score / 100) * score_consistency
-        return min(max(confidence, 0), 1)
+        return float(min(max(confidence, 0), 1))
     
     def generate_personalized_recommendations(self, 
                                             learning_profile: LearningProfile, 
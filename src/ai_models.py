@@ -0,0 +1,218 @@
+"""
+Modelos treináveis do motor de IA.
+
+O LearningStyleModel agrupa os estudantes (KMeans sobre vetores
+padronizados com StandardScaler) pelo desempenho em cada estilo de
+conteúdo. O treino roda offline sobre todos os estudantes; o resultado é
+gravado com joblib como arrays NumPy simples e carregado com mmap_mode='r',
+de forma que os workers compartilham as mesmas páginas em memória e a
+inferência por requisição é só uma padronização e uma distância.
+
+scikit-learn (e scipy) só são importados no treino; joblib só na gravação
+e na carga do modelo.
+
+Uso:
+    python -m src.ai_models --clusters 8
+"""
+import argparse
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+
+# Estilos de aprendizagem, na ordem das dimensões do vetor de features
+LEARNING_STYLES = ('visual', 'auditory', 'kinesthetic', 'mixed')
+
+# Mapeamento de tipo de conteúdo para estilo de aprendizagem
+CONTENT_STYLE_MAPPING = {
+    'video': 'visual',
+    'image': 'visual',
+    'audio': 'auditory',
+    'game': 'kinesthetic',
+    'simulation': 'kinesthetic',
+    'text': 'mixed'
+}
+
+# Mínimo de registros com score para usar o modelo em vez da heurística
+MIN_SCORED_RECORDS = 3
+
+MODEL_FILENAME = 'learning_style.joblib'
+MODEL_VERSION = 1
+
+
+def default_model_dir() -> str:
+    """Diretório dos modelos treinados (CURIO_MODEL_DIR ou src/database/ml_models)"""
+    return os.environ.get(
+        'CURIO_MODEL_DIR',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database', 'ml_models')
+    )
+
+
+def learning_style_vector(features) -> Optional[np.ndarray]:
+    """
+    Vetor de features de estilo de um estudante a partir de ProgressFeatures:
+    score médio (0-1) e participação nos registros para cada estilo, mais o
+    tempo médio por atividade em horas. Retorna None sem dados suficientes.
+    """
+    scored = features.scored
+    if int(scored.sum()) < MIN_SCORED_RECORDS:
+        return None
+
+    type_styles = np.array(
+        [LEARNING_STYLES.index(CONTENT_STYLE_MAPPING.get(t, 'mixed')) for t in features.content_types],
+        dtype=np.int64
+    )
+    style_codes = type_styles[features.type_codes[scored]]
+    scores = features.scores[scored] / 100
+
+    counts = np.bincount(style_codes, minlength=len(LEARNING_STYLES))
+    sums = np.bincount(style_codes, weights=scores, minlength=len(LEARNING_STYLES))
+    mean_scores = np.divide(sums, counts, out=np.zeros(len(LEARNING_STYLES)), where=counts > 0)
+    shares = counts / counts.sum()
+
+    times = features.times[features.timed]
+    avg_hours = times.mean() / 60 if times.size else 0.0
+
+    return np.concatenate([mean_scores, shares, [avg_hours]])
+
+
+class LearningStyleModel:
+    """Agrupamento de estudantes por estilo de aprendizagem (StandardScaler + KMeans)"""
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray, centers: np.ndarray,
+                 cluster_styles: np.ndarray, metadata: Optional[Dict] = None):
+        self.mean = mean
+        self.scale = scale
+        self.centers = centers  # no espaço padronizado
+        self.cluster_styles = cluster_styles  # índice em LEARNING_STYLES por cluster
+        self.metadata = metadata or {}
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray, n_clusters: int = 8, random_state: int = 42) -> 'LearningStyleModel':
+        """Treina o modelo sobre a matriz (estudantes x features)"""
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+
+        vectors = np.asarray(vectors, dtype=float)
+        n_clusters = max(1, min(n_clusters, len(vectors)))
+
+        scaler = StandardScaler()
+        scaled = scaler.fit_transform(vectors)
+        kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=random_state)
+        kmeans.fit(scaled)
+
+        # Cada cluster recebe o estilo com maior score médio no seu centróide
+        centroids = scaler.inverse_transform(kmeans.cluster_centers_)
+        cluster_styles = np.argmax(centroids[:, :len(LEARNING_STYLES)], axis=1).astype(np.int64)
+
+        return cls(
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            centers=kmeans.cluster_centers_,
+            cluster_styles=cluster_styles,
+            metadata={
+                'version': MODEL_VERSION,
+                'n_students': int(len(vectors)),
+                'n_clusters': int(n_clusters),
+                'inertia': float(kmeans.inertia_),
+                'trained_at': datetime.utcnow().isoformat()
+            }
+        )
+
+    def predict(self, vector: np.ndarray) -> str:
+        """Estilo de aprendizagem do cluster mais próximo"""
+        scaled = (vector - self.mean) / self.scale
+        distances = ((self.centers - scaled) ** 2).sum(axis=1)
+        return LEARNING_STYLES[int(self.cluster_styles[int(np.argmin(distances))])]
+
+    def save(self, model_dir: Optional[str] = None) -> str:
+        """Grava o modelo (arrays sem compressão, para permitir mmap na carga)"""
+        import joblib
+
+        model_dir = model_dir or default_model_dir()
+        os.makedirs(model_dir, exist_ok=True)
+        path = os.path.join(model_dir, MODEL_FILENAME)
+        tmp_path = f"{path}.tmp"
+        joblib.dump({
+            'mean': np.ascontiguousarray(self.mean),
+            'scale': np.ascontiguousarray(self.scale),
+            'centers': np.ascontiguousarray(self.centers),
+            'cluster_styles': np.ascontiguousarray(self.cluster_styles),
+            'metadata': self.metadata
+        }, tmp_path)
+        # Troca atômica: workers que estão carregando nunca veem um arquivo parcial
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, model_dir: Optional[str] = None) -> Optional['LearningStyleModel']:
+        """Carrega o modelo mapeado em memória; None se ainda não foi treinado"""
+        path = os.path.join(model_dir or default_model_dir(), MODEL_FILENAME)
+        if not os.path.exists(path):
+            return None
+
+        import joblib
+
+        try:
+            data = joblib.load(path, mmap_mode='r')
+        except Exception as e:
+            print(f"⚠️  Não foi possível carregar o modelo de estilos ({path}): {e}")
+            return None
+        if data.get('metadata', {}).get('version') != MODEL_VERSION:
+            return None
+        return cls(
+            mean=data['mean'],
+            scale=data['scale'],
+            centers=data['centers'],
+            cluster_styles=data['cluster_styles'],
+            metadata=data['metadata']
+        )
+
+
+def train_learning_style_model(n_clusters: int = 8, chunk_size: int = 500,
+                               model_dir: Optional[str] = None) -> Optional[LearningStyleModel]:
+    """
+    Treina e grava o modelo com os vetores de todos os estudantes.
+    Deve ser chamada dentro de um app context.
+    """
+    from src.ai_engine import extract_progress_features
+    from src.services.student_progress import iter_analysis_inputs
+
+    vectors = []
+    for chunk in iter_analysis_inputs(chunk_size):
+        for student_data in chunk:
+            vector = learning_style_vector(extract_progress_features(student_data['progress_records']))
+            if vector is not None:
+                vectors.append(vector)
+
+    if not vectors:
+        return None
+
+    model = LearningStyleModel.fit(np.vstack(vectors), n_clusters=n_clusters)
+    model.save(model_dir)
+    return model
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Treina o modelo de estilos de aprendizagem')
+    parser.add_argument('--clusters', type=int, default=8)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--model-dir', default=None)
+    args = parser.parse_args(argv)
+
+    from src.main import app
+
+    with app.app_context():
+        model = train_learning_style_model(args.clusters, args.chunk_size, args.model_dir)
+
+    if model is None:
+        print("⚠️  Nenhum estudante com dados suficientes para treinar o modelo")
+    else:
+        print(f"✅ Modelo treinado com {model.metadata['n_students']} estudantes "
+              f"em {model.metadata['n_clusters']} clusters")
+    return model
+
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,214 @@ import random
 import re
 from datetime import datetime
 import os
-import openai
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+def _openai():
+    """Importa o SDK da OpenAI só quando há chave configurada (evita o custo no boot)"""
+    import openai
+    openai.api_key = OPENAI_API_KEY
+    return openai
+
+# Bases de conhecimento do tutor: construídas uma única vez no import e
+# compartilhadas (somente leitura) por todas as instâncias. Com preload_app
+# no gunicorn elas ficam no processo mestre e os workers as herdam por
+# copy-on-write.
+TUTOR_NAME = "Curió"
+CONVERSATION_STARTERS = [
+    f"Oi! Eu sou o {TUTOR_NAME}, seu tutor virtual! 😊 Estou aqui para te ajudar com qualquer dúvida que você tiver. Sobre o que você gostaria de conversar hoje?",
+    f"Olá! Que bom te ver aqui! Sou o {TUTOR_NAME} e adoro ajudar crianças a aprender coisas novas. O que você está estudando ou tem curiosidade para saber?",
+    f"Oi, amiguinho! Eu sou o {TUTOR_NAME}, seu assistente de estudos! 🎓 Pode me perguntar sobre matemática, ciências, história, português... qualquer coisa! Do que você quer falar?"
+]
+
+ENCOURAGEMENT_PHRASES = [
+    "Que pergunta interessante! 🤔",
+    "Adorei sua curiosidade! 🌟",
+    "Você está pensando muito bem! 👏",
+    "Excelente pergunta! 💡",
+    "Que legal que você quer aprender isso! 🎉",
+    "Muito bem! Continue assim! ⭐",
+    "Você é muito esperto! 🧠",
+    "Que raciocínio incrível! 🚀"
+]
+
+# Base de conhecimento educacional para crianças
+EDUCATIONAL_KNOWLEDGE = {
+    'matematica': {
+        'adicao': {
+            'explanation': "A adição é quando juntamos números! É como juntar brinquedos: se você tem 3 carrinhos e ganha mais 2, fica com 5 carrinhos no total! 🚗",
+            'examples': ["2 + 3 = 5 (como juntar 2 maçãs com 3 maçãs)", "10 + 5 = 15 (como somar seus dedos!)"],
+            'tips': "Uma dica legal: você pode usar os dedos para contar, ou imaginar objetos que você gosta!"
+        },
+        'subtracao': {
+            'explanation': "A subtração é quando tiramos algo! É como comer biscoitos: se você tinha 8 biscoitos e comeu 3, sobraram 5! 🍪",
+            'examples': ["8 - 3 = 5 (como comer biscoitos)", "10 - 4 = 6 (como dar brinquedos para amigos)"],
+            'tips': "Imagine que você está dando ou perdendo coisas para entender melhor!"
+        },
+        'multiplicacao': {
+            'explanation': "A multiplicação é uma forma rápida de somar números iguais! É como ter grupos de coisas: 3 × 4 significa 3 grupos com 4 coisas cada! 📦",
+            'examples': ["3 × 4 = 12 (3 caixas com 4 bolas cada)", "2 × 5 = 10 (2 mãos com 5 dedos cada)"],
+            'tips': "Pense em grupos ou fileiras de objetos iguais!"
+        },
+        'divisao': {
+            'explanation': "A divisão é quando dividimos coisas igualmente! É como repartir doces entre amigos: 12 ÷ 3 = 4 significa que cada um dos 3 amigos ganha 4 doces! 🍬",
+            'examples': ["12 ÷ 3 = 4 (dividir 12 doces para 3 amigos)", "20 ÷ 4 = 5 (dividir 20 brinquedos em 4 grupos)"],
+            'tips': "Imagine que você está repartindo coisas de forma justa!"
+        },
+        'fracao': {
+            'explanation': "Frações são partes de um todo! É como dividir uma pizza: se você corta uma pizza em 4 pedaços e come 1, você comeu 1/4 da pizza! 🍕",
+            'examples': ["1/2 = metade (como meio sanduíche)", "1/4 = um quarto (como um pedaço de pizza)", "3/4 = três quartos (como 3 pedaços de uma pizza de 4)"],
+            'tips': "Pense em coisas que você pode dividir, como chocolates, pizzas ou bolos!"
+        },
+        'geometria': {
+            'explanation': "Geometria é o estudo das formas! Olhe ao seu redor - tudo tem uma forma: círculos, quadrados, triângulos! 🔺⭕🟩",
+            'examples': ["Círculo: bola, roda, moeda", "Quadrado: janela, dado, caixa", "Triângulo: fatia de pizza, telhado, cone de trânsito"],
+            'tips': "Procure formas geométricas nos objetos ao seu redor!"
+        }
+    },
+    'ciencias': {
+        'animais': {
+            'explanation': "Os animais são seres vivos incríveis! Eles respiram, se movem, comem e têm filhotes. Cada animal é especial e tem características únicas! 🐾",
+            'examples': ["Mamíferos: gatos, cachorros, elefantes", "Aves: papagaios, águias, pinguins", "Peixes: tubarões, peixe-palhaço, salmão"],
+            'tips': "Observe os animais ao seu redor e veja como eles são diferentes!"
+        },
+        'plantas': {
+            'explanation': "As plantas são seres vivos que fazem sua própria comida usando a luz do sol! Elas são super importantes porque nos dão oxigênio para respirar! 🌱",
+            'examples': ["Árvores: carvalho, pinheiro, mangueira", "Flores: rosa, girassol, margarida", "Vegetais: alface, cenoura, tomate"],
+            'tips': "Plante uma sementinha e observe ela crescer!"
+        },
+        'corpo_humano': {
+            'explanation': "Nosso corpo é uma máquina incrível! Cada parte tem uma função especial para nos manter vivos e saudáveis! ❤️",
+            'examples': ["Coração: bombeia sangue", "Pulmões: nos ajudam a respirar", "Cérebro: controla tudo"],
+            'tips': "Cuide bem do seu corpo comendo bem, bebendo água e se exercitando!"
+        },
+        'espaco': {
+            'explanation': "O espaço é gigantesco e cheio de mistérios! Lá existem planetas, estrelas, a Lua e muito mais! É como um oceano infinito de aventuras! 🚀",
+            'examples': ["Planetas: Terra, Marte, Júpiter", "Estrelas: Sol, Sirius, Polaris", "Outros: Lua, cometas, asteroides"],
+            'tips': "Olhe para o céu à noite e tente encontrar as estrelas e a Lua!"
+        },
+        'agua': {
+            'explanation': "A água é super importante para a vida! Ela pode ser líquida (como na torneira), sólida (gelo) ou gasosa (vapor)! 💧",
+            'examples': ["Líquida: chuva, rios, oceanos", "Sólida: gelo, neve, granizo", "Gasosa: vapor, nuvens"],
+            'tips': "Observe como a água muda de forma quando esquenta ou esfria!"
+        },
+        'dinossauros': {
+            'explanation': "Os dinossauros eram animais gigantes que viveram há muito, muito tempo! Alguns eram enormes, outros pequenos, alguns comiam plantas e outros comiam carne! 🦕",
+            'examples': ["Herbívoros: Brontossauro, Triceratops", "Carnívoros: Tiranossauro Rex, Velociraptor", "Voadores: Pterodáctilo"],
+            'tips': "Visite um museu para ver esqueletos de dinossauros de verdade!"
+        }
+    },
+    'historia': {
+        'brasil': {
+            'explanation': "O Brasil tem uma história muito rica e interessante! Nosso país foi formado por muitos povos diferentes: indígenas, africanos e europeus! 🇧🇷",
+            'examples': ["Povos indígenas viviam aqui primeiro", "Portugueses chegaram em 1500", "Pessoas da África vieram trabalhar aqui"],
+            'tips': "Cada região do Brasil tem suas próprias tradições especiais!"
+        },
+        'descobrimentos': {
+            'explanation': "Ao longo da história, pessoas corajosas fizeram descobertas incríveis que mudaram o mundo! 🗺️",
+            'examples': ["Cristóvão Colombo descobriu a América", "Pedro Álvares Cabral chegou ao Brasil", "Santos Dumont inventou o avião"],
+            'tips': "Você também pode ser um descobridor! Sempre faça perguntas e explore!"
+        },
+        'inventos': {
+            'explanation': "As pessoas sempre inventaram coisas para tornar a vida mais fácil! Muitas coisas que usamos hoje foram inventadas há muito tempo! 💡",
+            'examples': ["Roda: para transportar coisas", "Escrita: para guardar informações", "Telefone: para falar com pessoas longe"],
+            'tips': "Pense em como seria sua vida sem essas invenções!"
+        }
+    },
+    'portugues': {
+        'alfabeto': {
+            'explanation': "O alfabeto é formado por 26 letras que usamos para escrever todas as palavras! Cada letra tem um som especial! 📝",
+            'examples': ["Vogais: A, E, I, O, U", "Consoantes: B, C, D, F, G...", "Juntas formam palavras como CASA, BOLA, GATO"],
+            'tips': "Pratique escrevendo seu nome e palavras que você gosta!"
+        },
+        'leitura': {
+            'explanation': "Ler é como viajar para mundos mágicos! Cada livro é uma aventura nova esperando por você! 📚",
+            'examples': ["Histórias de aventura", "Contos de fadas", "Livros sobre animais"],
+            'tips': "Comece com livros que tenham figuras bonitas e histórias curtas!"
+        },
+        'escrita': {
+            'explanation': "Escrever é uma forma de expressar seus pensamentos e sentimentos! É como pintar com palavras! ✍️",
+            'examples': ["Cartas para amigos", "Histórias inventadas", "Diário pessoal"],
+            'tips': "Comece escrevendo sobre coisas que você gosta!"
+        }
+    },
+    'geografia': {
+        'brasil': {
+            'explanation': "O Brasil é um país enorme e cheio de lugares diferentes! Temos praias, florestas, montanhas e muito mais! 🏞️",
+            'examples': ["Regiões: Norte, Nordeste, Centro-Oeste, Sudeste, Sul", "Biomas: Amazônia, Cerrado, Mata Atlântica", "Cidades: São Paulo, Rio de Janeiro, Brasília"],
+            'tips': "Olhe um mapa do Brasil e encontre onde você mora!"
+        },
+        'mundo': {
+            'explanation': "Nosso planeta Terra é incrível! Existem muitos países diferentes, cada um com suas próprias culturas e tradições! 🌍",
+            'examples': ["Continentes: América, Europa, Ásia, África, Oceania, Antártida", "Oceanos: Atlântico, Pacífico, Índico", "Países: França, Japão, Egito"],
+            'tips': "Use um globo ou mapa-múndi para explorar o mundo!"
+        },
+        'natureza': {
+            'explanation': "A natureza é cheia de maravilhas! Rios, montanhas, florestas e oceanos formam nosso belo planeta! 🏔️",
+            'examples': ["Rios: Amazonas, Nilo, Mississippi", "Montanhas: Everest, Andes, Alpes", "Florestas: Amazônia, Taiga, Mata Atlântica"],
+            'tips': "Explore a natureza perto de você e observe sua beleza!"
+        }
+    }
+}
+
+# Respostas para perguntas comuns de crianças
+COMMON_QUESTIONS = {
+    'por que': [
+        "Que pergunta curiosa! Vou te explicar de um jeito fácil de entender...",
+        "Adorei sua pergunta! É assim que aprendemos coisas novas...",
+        "Excelente pergunta! Deixe-me te contar..."
+    ],
+    'como': [
+        "Vou te ensinar passo a passo!",
+        "É mais fácil do que parece! Vamos ver...",
+        "Que legal que você quer aprender como fazer isso!"
+    ],
+    'o que é': [
+        "Vou te explicar de um jeito bem simples!",
+        "É uma ótima pergunta! Deixe-me te contar...",
+        "Vou te dar uma explicação que você vai entender facilmente!"
+    ]
+}
+
+# Tópicos que o tutor pode abordar
+SUPPORTED_TOPICS = [
+    'matemática', 'ciências', 'história', 'português', 'geografia',
+    'animais', 'plantas', 'espaço', 'dinossauros', 'corpo humano',
+    'países', 'culturas', 'invenções', 'arte', 'música', 'frações',
+    'geometria', 'água', 'brasil', 'mundo', 'natureza', 'escrita', 'leitura'
+]
+
+# Palavras-chave expandidas para melhor reconhecimento
+TOPIC_KEYWORDS = {
+    'matematica': [
+        'matemática', 'conta', 'número', 'somar', 'subtrair', 'multiplicar', 'dividir', 
+        'adição', 'subtração', 'multiplicação', 'divisão', 'calcular', 'soma', 'menos',
+        'vezes', 'fração', 'metade', 'geometria', 'forma', 'círculo', 'quadrado', 
+        'triângulo', 'retângulo', 'tabuada', 'problema', 'resolver'
+    ],
+    'ciencias': [
+        'ciência', 'animal', 'planta', 'corpo', 'natureza', 'experimento', 'biologia', 
+        'física', 'química', 'espaço', 'planeta', 'estrela', 'lua', 'sol', 'dinossauro',
+        'água', 'ar', 'terra', 'fogo', 'mamífero', 'pássaro', 'peixe', 'inseto',
+        'árvore', 'flor', 'folha', 'raiz', 'coração', 'pulmão', 'cérebro', 'sangue'
+    ],
+    'historia': [
+        'história', 'brasil', 'descobrimento', 'passado', 'antigo', 'guerra', 'rei', 
+        'presidente', 'índio', 'indígena', 'português', 'africano', 'escravidão',
+        'independência', 'cabral', 'colombo', 'invenção', 'inventor', 'santos dumont'
+    ],
+    'portugues': [
+        'português', 'palavra', 'letra', 'escrever', 'ler', 'alfabeto', 'texto', 
+        'história', 'livro', 'frase', 'vogal', 'consoante', 'sílaba', 'rima',
+        'poesia', 'conto', 'fábula', 'redação', 'gramática', 'leitura', 'escrita'
+    ],
+    'geografia': [
+        'geografia', 'mapa', 'país', 'cidade', 'estado', 'região', 'continente',
+        'oceano', 'rio', 'montanha', 'floresta', 'praia', 'clima', 'cultura',
+        'população', 'capital', 'bandeira', 'mundo', 'terra', 'globo'
+    ]
+}
+
 
 class AITutorEngine:
     """
@@ -13,200 +218,13 @@ class AITutorEngine:
     """
     
     def __init__(self):
-        self.tutor_name = "Curió"
-        self.conversation_starters = [
-            f"Oi! Eu sou o {self.tutor_name}, seu tutor virtual! 😊 Estou aqui para te ajudar com qualquer dúvida que você tiver. Sobre o que você gostaria de conversar hoje?",
-            f"Olá! Que bom te ver aqui! Sou o {self.tutor_name} e adoro ajudar crianças a aprender coisas novas. O que você está estudando ou tem curiosidade para saber?",
-            f"Oi, amiguinho! Eu sou o {self.tutor_name}, seu assistente de estudos! 🎓 Pode me perguntar sobre matemática, ciências, história, português... qualquer coisa! Do que você quer falar?"
-        ]
-        
-        self.encouragement_phrases = [
-            "Que pergunta interessante! 🤔",
-            "Adorei sua curiosidade! 🌟",
-            "Você está pensando muito bem! 👏",
-            "Excelente pergunta! 💡",
-            "Que legal que você quer aprender isso! 🎉",
-            "Muito bem! Continue assim! ⭐",
-            "Você é muito esperto! 🧠",
-            "Que raciocínio incrível! 🚀"
-        ]
-        
-        # Base de conhecimento educacional para crianças
-        self.educational_knowledge = {
-            'matematica': {
-                'adicao': {
-                    'explanation': "A adição é quando juntamos números! É como juntar brinquedos: se você tem 3 carrinhos e ganha mais 2, fica com 5 carrinhos no total! 🚗",
-                    'examples': ["2 + 3 = 5 (como juntar 2 maçãs com 3 maçãs)", "10 + 5 = 15 (como somar seus dedos!)"],
-                    'tips': "Uma dica legal: você pode usar os dedos para contar, ou imaginar objetos que você gosta!"
-                },
-                'subtracao': {
-                    'explanation': "A subtração é quando tiramos algo! É como comer biscoitos: se você tinha 8 biscoitos e comeu 3, sobraram 5! 🍪",
-                    'examples': ["8 - 3 = 5 (como comer biscoitos)", "10 - 4 = 6 (como dar brinquedos para amigos)"],
-                    'tips': "Imagine que você está dando ou perdendo coisas para entender melhor!"
-                },
-                'multiplicacao': {
-                    'explanation': "A multiplicação é uma forma rápida de somar números iguais! É como ter grupos de coisas: 3 × 4 significa 3 grupos com 4 coisas cada! 📦",
-                    'examples': ["3 × 4 = 12 (3 caixas com 4 bolas cada)", "2 × 5 = 10 (2 mãos com 5 dedos cada)"],
-                    'tips': "Pense em grupos ou fileiras de objetos iguais!"
-                },
-                'divisao': {
-                    'explanation': "A divisão é quando dividimos coisas igualmente! É como repartir doces entre amigos: 12 ÷ 3 = 4 significa que cada um dos 3 amigos ganha 4 doces! 🍬",
-                    'examples': ["12 ÷ 3 = 4 (dividir 12 doces para 3 amigos)", "20 ÷ 4 = 5 (dividir 20 brinquedos em 4 grupos)"],
-                    'tips': "Imagine que você está repartindo coisas de forma justa!"
-                },
-                'fracao': {
-                    'explanation': "Frações são partes de um todo! É como dividir uma pizza: se você corta uma pizza em 4 pedaços e come 1, você comeu 1/4 da pizza! 🍕",
-                    'examples': ["1/2 = metade (como meio sanduíche)", "1/4 = um quarto (como um pedaço de pizza)", "3/4 = três quartos (como 3 pedaços de uma pizza de 4)"],
-                    'tips': "Pense em coisas que você pode dividir, como chocolates, pizzas ou bolos!"
-                },
-                'geometria': {
-                    'explanation': "Geometria é o estudo das formas! Olhe ao seu redor - tudo tem uma forma: círculos, quadrados, triângulos! 🔺⭕🟩",
-                    'examples': ["Círculo: bola, roda, moeda", "Quadrado: janela, dado, caixa", "Triângulo: fatia de pizza, telhado, cone de trânsito"],
-                    'tips': "Procure formas geométricas nos objetos ao seu redor!"
-                }
-            },
-            'ciencias': {
-                'animais': {
-                    'explanation': "Os animais são seres vivos incríveis! Eles respiram, se movem, comem e têm filhotes. Cada animal é especial e tem características únicas! 🐾",
-                    'examples': ["Mamíferos: gatos, cachorros, elefantes", "Aves: papagaios, águias, pinguins", "Peixes: tubarões, peixe-palhaço, salmão"],
-                    'tips': "Observe os animais ao seu redor e veja como eles são diferentes!"
-                },
-                'plantas': {
-                    'explanation': "As plantas são seres vivos que fazem sua própria comida usando a luz do sol! Elas são super importantes porque nos dão oxigênio para respirar! 🌱",
-                    'examples': ["Árvores: carvalho, pinheiro, mangueira", "Flores: rosa, girassol, margarida", "Vegetais: alface, cenoura, tomate"],
-                    'tips': "Plante uma sementinha e observe ela crescer!"
-                },
-                'corpo_humano': {
-                    'explanation': "Nosso corpo é uma máquina incrível! Cada parte tem uma função especial para nos manter vivos e saudáveis! ❤️",
-                    'examples': ["Coração: bombeia sangue", "Pulmões: nos ajudam a respirar", "Cérebro: controla tudo"],
-                    'tips': "Cuide bem do seu corpo comendo bem, bebendo água e se exercitando!"
-                },
-                'espaco': {
-                    'explanation': "O espaço é gigantesco e cheio de mistérios! Lá existem planetas, estrelas, a Lua e muito mais! É como um oceano infinito de aventuras! 🚀",
-                    'examples': ["Planetas: Terra, Marte, Júpiter", "Estrelas: Sol, Sirius, Polaris", "Outros: Lua, cometas, asteroides"],
-                    'tips': "Olhe para o céu à noite e tente encontrar as estrelas e a Lua!"
-                },
-                'agua': {
-                    'explanation': "A água é super importante para a vida! Ela pode ser líquida (como na torneira), sólida (gelo) ou gasosa (vapor)! 💧",
-                    'examples': ["Líquida: chuva, rios, oceanos", "Sólida: gelo, neve, granizo", "Gasosa: vapor, nuvens"],
-                    'tips': "Observe como a água muda de forma quando esquenta ou esfria!"
-                },
-                'dinossauros': {
-                    'explanation': "Os dinossauros eram animais gigantes que viveram há muito, muito tempo! Alguns eram enormes, outros pequenos, alguns comiam plantas e outros comiam carne! 🦕",
-                    'examples': ["Herbívoros: Brontossauro, Triceratops", "Carnívoros: Tiranossauro Rex, Velociraptor", "Voadores: Pterodáctilo"],
-                    'tips': "Visite um museu para ver esqueletos de dinossauros de verdade!"
-                }
-            },
-            'historia': {
-                'brasil': {
-                    'explanation': "O Brasil tem uma história muito rica e interessante! Nosso país foi formado por muitos povos diferentes: indígenas, africanos e europeus! 🇧🇷",
-                    'examples': ["Povos indígenas viviam aqui primeiro", "Portugueses chegaram em 1500", "Pessoas da África vieram trabalhar aqui"],
-                    'tips': "Cada região do Brasil tem suas próprias tradições especiais!"
-                },
-                'descobrimentos': {
-                    'explanation': "Ao longo da história, pessoas corajosas fizeram descobertas incríveis que mudaram o mundo! 🗺️",
-                    'examples': ["Cristóvão Colombo descobriu a América", "Pedro Álvares Cabral chegou ao Brasil", "Santos Dumont inventou o avião"],
-                    'tips': "Você também pode ser um descobridor! Sempre faça perguntas e explore!"
-                },
-                'inventos': {
-                    'explanation': "As pessoas sempre inventaram coisas para tornar a vida mais fácil! Muitas coisas que usamos hoje foram inventadas há muito tempo! 💡",
-                    'examples': ["Roda: para transportar coisas", "Escrita: para guardar informações", "Telefone: para falar com pessoas longe"],
-                    'tips': "Pense em como seria sua vida sem essas invenções!"
-                }
-            },
-            'portugues': {
-                'alfabeto': {
-                    'explanation': "O alfabeto é formado por 26 letras que usamos para escrever todas as palavras! Cada letra tem um som especial! 📝",
-                    'examples': ["Vogais: A, E, I, O, U", "Consoantes: B, C, D, F, G...", "Juntas formam palavras como CASA, BOLA, GATO"],
-                    'tips': "Pratique escrevendo seu nome e palavras que você gosta!"
-                },
-                'leitura': {
-                    'explanation': "Ler é como viajar para mundos mágicos! Cada livro é uma aventura nova esperando por você! 📚",
-                    'examples': ["Histórias de aventura", "Contos de fadas", "Livros sobre animais"],
-                    'tips': "Comece com livros que tenham figuras bonitas e histórias curtas!"
-                },
-                'escrita': {
-                    'explanation': "Escrever é uma forma de expressar seus pensamentos e sentimentos! É como pintar com palavras! ✍️",
-                    'examples': ["Cartas para amigos", "Histórias inventadas", "Diário pessoal"],
-                    'tips': "Comece escrevendo sobre coisas que você gosta!"
-                }
-            },
-            'geografia': {
-                'brasil': {
-                    'explanation': "O Brasil é um país enorme e cheio de lugares diferentes! Temos praias, florestas, montanhas e muito mais! 🏞️",
-                    'examples': ["Regiões: Norte, Nordeste, Centro-Oeste, Sudeste, Sul", "Biomas: Amazônia, Cerrado, Mata Atlântica", "Cidades: São Paulo, Rio de Janeiro, Brasília"],
-                    'tips': "Olhe um mapa do Brasil e encontre onde você mora!"
-                },
-                'mundo': {
-                    'explanation': "Nosso planeta Terra é incrível! Existem muitos países diferentes, cada um com suas próprias culturas e tradições! 🌍",
-                    'examples': ["Continentes: América, Europa, Ásia, África, Oceania, Antártida", "Oceanos: Atlântico, Pacífico, Índico", "Países: França, Japão, Egito"],
-                    'tips': "Use um globo ou mapa-múndi para explorar o mundo!"
-                },
-                'natureza': {
-                    'explanation': "A natureza é cheia de maravilhas! Rios, montanhas, florestas e oceanos formam nosso belo planeta! 🏔️",
-                    'examples': ["Rios: Amazonas, Nilo, Mississippi", "Montanhas: Everest, Andes, Alpes", "Florestas: Amazônia, Taiga, Mata Atlântica"],
-                    'tips': "Explore a natureza perto de você e observe sua beleza!"
-                }
-            }
-        }
-        
-        # Respostas para perguntas comuns de crianças
-        self.common_questions = {
-            'por que': [
-                "Que pergunta curiosa! Vou te explicar de um jeito fácil de entender...",
-                "Adorei sua pergunta! É assim que aprendemos coisas novas...",
-                "Excelente pergunta! Deixe-me te contar..."
-            ],
-            'como': [
-                "Vou te ensinar passo a passo!",
-                "É mais fácil do que parece! Vamos ver...",
-                "Que legal que você quer aprender como fazer isso!"
-            ],
-            'o que é': [
-                "Vou te explicar de um jeito bem simples!",
-                "É uma ótima pergunta! Deixe-me te contar...",
-                "Vou te dar uma explicação que você vai entender facilmente!"
-            ]
-        }
-        
-        # Tópicos que o tutor pode abordar
-        self.supported_topics = [
-            'matemática', 'ciências', 'história', 'português', 'geografia',
-            'animais', 'plantas', 'espaço', 'dinossauros', 'corpo humano',
-            'países', 'culturas', 'invenções', 'arte', 'música', 'frações',
-            'geometria', 'água', 'brasil', 'mundo', 'natureza', 'escrita', 'leitura'
-        ]
-        
-        # Palavras-chave expandidas para melhor reconhecimento
-        self.topic_keywords = {
-            'matematica': [
-                'matemática', 'conta', 'número', 'somar', 'subtrair', 'multiplicar', 'dividir', 
-                'adição', 'subtração', 'multiplicação', 'divisão', 'calcular', 'soma', 'menos',
-                'vezes', 'fração', 'metade', 'geometria', 'forma', 'círculo', 'quadrado', 
-                'triângulo', 'retângulo', 'tabuada', 'problema', 'resolver'
-            ],
-            'ciencias': [
-                'ciência', 'animal', 'planta', 'corpo', 'natureza', 'experimento', 'biologia', 
-                'física', 'química', 'espaço', 'planeta', 'estrela', 'lua', 'sol', 'dinossauro',
-                'água', 'ar', 'terra', 'fogo', 'mamífero', 'pássaro', 'peixe', 'inseto',
-                'árvore', 'flor', 'folha', 'raiz', 'coração', 'pulmão', 'cérebro', 'sangue'
-            ],
-            'historia': [
-                'história', 'brasil', 'descobrimento', 'passado', 'antigo', 'guerra', 'rei', 
-                'presidente', 'índio', 'indígena', 'português', 'africano', 'escravidão',
-                'independência', 'cabral', 'colombo', 'invenção', 'inventor', 'santos dumont'
-            ],
-            'portugues': [
-                'português', 'palavra', 'letra', 'escrever', 'ler', 'alfabeto', 'texto', 
-                'história', 'livro', 'frase', 'vogal', 'consoante', 'sílaba', 'rima',
-                'poesia', 'conto', 'fábula', 'redação', 'gramática', 'leitura', 'escrita'
-            ],
-            'geografia': [
-                'geografia', 'mapa', 'país', 'cidade', 'estado', 'região', 'continente',
-                'oceano', 'rio', 'montanha', 'floresta', 'praia', 'clima', 'cultura',
-                'população', 'capital', 'bandeira', 'mundo', 'terra', 'globo'
-            ]
-        }
+        self.tutor_name = TUTOR_NAME
+        self.conversation_starters = CONVERSATION_STARTERS
+        self.encouragement_phrases = ENCOURAGEMENT_PHRASES
+        self.educational_knowledge = EDUCATIONAL_KNOWLEDGE
+        self.common_questions = COMMON_QUESTIONS
+        self.supported_topics = SUPPORTED_TOPICS
+        self.topic_keywords = TOPIC_KEYWORDS
     
     def generate_response(self, student_message, conversation_history, problem_context=None):
         """
@@ -214,7 +232,7 @@ class AITutorEngine:
         Agora funciona como um ChatGPT educacional amigável para crianças.
         """
         # Se não houver chave da OpenAI, use a lógica antiga
-        if not openai.api_key:
+        if not OPENAI_API_KEY:
             student_message = student_message.lower().strip()
             response_type = self._analyze_student_message(student_message)
 
@@ -257,7 +275,7 @@ class AITutorEngine:
             messages.append({"role": "system", "content": context_text})
 
         try:
-            completion = openai.ChatCompletion.create(
+            completion = _openai().ChatCompletion.create(
                 model="gpt-3.5-turbo",
                 messages=messages,
                 max_tokens=200,
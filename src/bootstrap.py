@@ -0,0 +1,254 @@
+"""
+Inicialização explícita do banco de dados (schema + dados padrão).
+
+Roda uma única vez por deploy, fora do caminho de import da aplicação:
+
+    flask --app src.main curio bootstrap
+
+ou automaticamente no hook `on_starting` do gunicorn (processo mestre,
+antes de qualquer worker existir). É idempotente: tabelas são criadas só
+se não existirem e as conquistas padrão são inseridas pelo nome apenas
+quando faltam.
+
+`create_all` não altera tabelas existentes; colunas anuláveis novas e
+índices novos dos modelos são adicionados por add_missing_columns, então
+mudanças aditivas de schema não precisam de migração manual. Índices
+únicos novos sobre dados antigos precisam de uma limpeza antes (ex.:
+release_duplicate_idempotency_keys).
+"""
+from typing import Dict
+
+from sqlalchemy import Column, Index, MetaData, String, Table, inspect, text
+from sqlalchemy.schema import CreateColumn
+
+from src.models.user import db
+
+DEFAULT_ACHIEVEMENTS = [
+    {
+        'name': 'Primeiro Passo',
+        'description': 'Complete seu primeiro exercício na plataforma Curió',
+        'icon': 'play',
+        'category': 'progress',
+        'requirement_type': 'exercises_completed',
+        'requirement_value': 1,
+        'points': 10,
+        'rarity': 'common'
+    },
+    {
+        'name': 'Curioso',
+        'description': 'Faça sua primeira pergunta ao tutor Curió',
+        'icon': 'brain',
+        'category': 'interaction',
+        'requirement_type': 'chat_messages',
+        'requirement_value': 1,
+        'points': 5,
+        'rarity': 'common'
+    },
+    {
+        'name': 'Dedicado',
+        'description': 'Estude por 3 dias consecutivos',
+        'icon': 'calendar',
+        'category': 'streak',
+        'requirement_type': 'streak_days',
+        'requirement_value': 3,
+        'points': 25,
+        'rarity': 'common'
+    },
+    {
+        'name': 'Persistente',
+        'description': 'Mantenha uma sequência de 7 dias de estudo',
+        'icon': 'target',
+        'category': 'streak',
+        'requirement_type': 'streak_days',
+        'requirement_value': 7,
+        'points': 50,
+        'rarity': 'rare'
+    },
+    {
+        'name': 'Explorador da Matemática',
+        'description': 'Complete 10 exercícios de matemática',
+        'icon': 'calculator',
+        'category': 'subject',
+        'requirement_type': 'subject_exercises',
+        'requirement_value': 10,
+        'points': 30,
+        'rarity': 'common'
+    },
+    {
+        'name': 'Cientista Curioso',
+        'description': 'Complete 10 atividades de ciências',
+        'icon': 'microscope',
+        'category': 'subject',
+        'requirement_type': 'subject_exercises',
+        'requirement_value': 10,
+        'points': 30,
+        'rarity': 'common'
+    },
+    {
+        'name': 'Maratonista',
+        'description': 'Estude por 30 dias consecutivos - um verdadeiro campeão!',
+        'icon': 'trophy',
+        'category': 'streak',
+        'requirement_type': 'streak_days',
+        'requirement_value': 30,
+        'points': 200,
+        'rarity': 'legendary'
+    },
+    {
+        'name': 'Mestre dos Pontos',
+        'description': 'Acumule 1000 pontos na plataforma',
+        'icon': 'zap',
+        'category': 'points',
+        'requirement_type': 'total_points',
+        'requirement_value': 1000,
+        'points': 100,
+        'rarity': 'rare'
+    },
+    {
+        'name': 'Tempo é Ouro',
+        'description': 'Dedique 10 horas aos estudos',
+        'icon': 'clock',
+        'category': 'time',
+        'requirement_type': 'study_time_hours',
+        'requirement_value': 10,
+        'points': 75,
+        'rarity': 'rare'
+    },
+    {
+        'name': 'Lenda do Curió',
+        'description': 'Conquista especial para os maiores estudiosos',
+        'icon': 'crown',
+        'category': 'special',
+        'requirement_type': 'total_points',
+        'requirement_value': 5000,
+        'points': 500,
+        'rarity': 'legendary'
+    }
+]
+
+
+def _import_models():
+    """Importa todos os modelos na ordem correta para evitar erros de foreign key"""
+    from src.models.user import User  # noqa: F401
+    from src.models.teacher import Teacher  # noqa: F401  ANTES de content
+    from src.models.student import Student  # noqa: F401
+    from src.models.content import Content  # noqa: F401  DEPOIS de teacher
+    from src.models.progress import Progress  # noqa: F401
+    from src.models.ai_personalization import AIPersonalization  # noqa: F401
+    from src.models.problem_of_day import (  # noqa: F401
+        DailyProblemAssignment, HintReveal, ProblemOfDay, ProblemSchedule, ProblemStats
+    )
+    from src.models.ai_tutor_chat import ChatMessage  # noqa: F401
+    from src.models.gamification import (  # noqa: F401
+        StudentProgress, Achievement, StudentAchievement,
+        StudyStreak, StudentPoints, DashboardVersion, ActivityLog
+    )
+    from src.models.reporting import ReportCubeCell, ReportCubeState  # noqa: F401
+    from src.models.notification import Notification, NotificationCounter  # noqa: F401
+
+
+def seed_default_achievements() -> int:
+    """Insere as conquistas padrão que ainda não existem; retorna quantas foram criadas"""
+    from src.models.gamification import Achievement
+
+    existing = {name for (name,) in db.session.query(Achievement.name)}
+    missing = [data for data in DEFAULT_ACHIEVEMENTS if data['name'] not in existing]
+    db.session.add_all(Achievement(**data) for data in missing)
+    db.session.commit()
+    return len(missing)
+
+
+def add_missing_columns(engine=None) -> int:
+    """
+    Adiciona às tabelas existentes as colunas e índices declarados nos modelos
+    que ainda não existem no banco. Só colunas anuláveis (ou com
+    server_default) podem ser adicionadas assim; as demais geram um aviso.
+    Retorna quantas colunas foram adicionadas.
+    """
+    engine = engine or db.engine
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    preparer = engine.dialect.identifier_preparer
+    added = 0
+
+    with engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            columns = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    print(f"⚠️  Coluna {table.name}.{column.name} não pode ser adicionada "
+                          f"automaticamente (NOT NULL sem server_default)")
+                    continue
+                # O dialeto monta nome, tipo, DEFAULT (com os literais entre aspas) e NOT NULL
+                column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {column_ddl}"))
+                added += 1
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+    return added
+
+
+def release_duplicate_idempotency_keys(engine=None) -> int:
+    """
+    Prepara problem_submissions para o índice único da chave de idempotência:
+    chaves repetidas (reenvios fora da janela, gravados antes do índice)
+    ficam só na submissão mais recente, e o índice antigo, não único, é
+    removido. Retorna quantas submissões perderam a chave.
+    """
+    engine = engine or db.engine
+    inspector = inspect(engine)
+    if 'problem_submissions' not in inspector.get_table_names():
+        return 0
+    if 'idempotency_key' not in {column['name'] for column in inspector.get_columns('problem_submissions')}:
+        return 0
+
+    with engine.begin() as conn:
+        released = conn.execute(text(
+            "UPDATE problem_submissions SET idempotency_key = NULL "
+            "WHERE idempotency_key IS NOT NULL AND id NOT IN ("
+            "SELECT latest_id FROM (SELECT MAX(id) AS latest_id FROM problem_submissions "
+            "WHERE idempotency_key IS NOT NULL GROUP BY idempotency_key) AS latest)"
+        )).rowcount
+        legacy_index = 'ix_problem_submissions_idempotency_key'
+        if legacy_index in {index['name'] for index in inspector.get_indexes('problem_submissions')}:
+            # Tabela avulsa: um Index sobre a do modelo passaria a fazer parte dele
+            table = Table('problem_submissions', MetaData(), Column('idempotency_key', String(64)))
+            Index(legacy_index, table.c.idempotency_key).drop(conn)
+    return released
+
+
+def bootstrap_database(app) -> Dict:
+    """Cria as tabelas que faltam e popula os dados padrão"""
+    with app.app_context():
+        try:
+            _import_models()
+            db.create_all()
+            print("✅ Tabelas do banco de dados criadas com sucesso!")
+
+            keys_released = release_duplicate_idempotency_keys()
+            if keys_released:
+                print(f"✅ {keys_released} chaves de idempotência repetidas liberadas!")
+
+            columns_added = add_missing_columns()
+            if columns_added:
+                print(f"✅ {columns_added} colunas novas adicionadas!")
+
+            created = seed_default_achievements()
+            if created:
+                print(f"✅ {created} conquistas padrão criadas!")
+
+            print("🎉 Banco de dados inicializado com sucesso!")
+            return {'achievements_created': created, 'columns_added': columns_added}
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.remove()
+            # Roda no mestre do gunicorn: nenhuma conexão aberta aqui pode ser
+            # herdada pelos workers (com ou sem preload)
+            for engine in db.engines.values():
+                engine.dispose()
@@ -0,0 +1,97 @@
+"""
+Comandos de linha de comando da plataforma (`flask --app src.main curio ...`).
+"""
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+curio_cli = AppGroup('curio', help='Comandos de manutenção da Plataforma Curió')
+
+
+@curio_cli.command('bootstrap')
+def bootstrap_command():
+    """Cria as tabelas e popula os dados padrão (idempotente)"""
+    from src.bootstrap import bootstrap_database
+
+    result = bootstrap_database(current_app._get_current_object())
+    click.echo(f"Bootstrap concluído: {result['achievements_created']} conquistas criadas")
+
+
+@curio_cli.command('refresh-cube')
+@click.option('--full', is_flag=True, help='Reconstrói todas as semanas em vez das alteradas')
+def refresh_cube_command(full):
+    """Atualiza o cubo de relatórios (rode periodicamente, ex.: a cada 5 minutos)"""
+    from src.services.reporting_cube import refresh_cube
+
+    result = refresh_cube(full=full)
+    click.echo(f"Cubo atualizado: {result['weeks']} semanas, {result['cells']} células")
+
+
+@curio_cli.command('schedule-problems')
+@click.option('--days', default=30, show_default=True, help='Dias a agendar a partir de hoje')
+def schedule_problems_command(days):
+    """Agenda o problema do dia das próximas datas (datas já agendadas são mantidas)"""
+    from src.services.problem_of_day import schedule_problems, utc_today
+
+    created = schedule_problems(utc_today(), days)
+    click.echo(f"{created} datas agendadas")
+
+
+@curio_cli.command('assign-problems')
+@click.option('--date', 'day', type=click.DateTime(formats=['%Y-%m-%d']), default=None,
+              help='Data das atribuições (padrão: hoje)')
+@click.option('--chunk-size', default=1000, show_default=True, help='Estudantes por lote (e por commit)')
+def assign_problems_command(day, chunk_size):
+    """Atribui o problema do dia a cada estudante (rode uma vez por dia, antes das aulas)"""
+    from src.services.problem_of_day import assign_daily_problems
+
+    created = assign_daily_problems(day.date() if day else None, chunk_size=chunk_size)
+    click.echo(f"{created} atribuições criadas")
+
+
+@curio_cli.command('grade-pending')
+@click.option('--batch-size', default=20, show_default=True, help='Submissões reivindicadas por vez')
+def grade_pending_command(batch_size):
+    """Corrige as submissões pendentes da fila até esvaziá-la (worker avulso ou cron)"""
+    from src.services.grading_queue import drain
+
+    result = drain(batch_size)
+    click.echo(f"{result['graded']} submissões corrigidas, {result['failed']} com erro")
+
+
+@curio_cli.command('rebuild-problem-stats')
+def rebuild_problem_stats_command():
+    """Recalcula os contadores de estatísticas dos problemas a partir das submissões"""
+    from src.services.problem_stats import rebuild_problem_stats
+
+    rows = rebuild_problem_stats()
+    click.echo(f"Estatísticas recalculadas: {rows} linhas")
+
+
+# Avisos disponíveis para `curio notify`: (título, mensagem, seleção de estudantes)
+REMINDERS = {
+    'streak': (
+        'Hora de estudar!',
+        'Você ainda não estudou hoje. Que tal manter sua sequência?',
+        'students_without_study_today'
+    ),
+    'problem_of_day': (
+        'Novo problema do dia!',
+        'Tem um desafio novo esperando por você. Vamos resolver?',
+        'all_student_ids'
+    ),
+}
+
+
+@curio_cli.command('notify')
+@click.argument('kind', type=click.Choice(sorted(REMINDERS)))
+@click.option('--batch-size', default=1000, show_default=True, help='Notificações por lote (e por commit)')
+def notify_command(kind, batch_size):
+    """Cria lembretes em lote (streak: quem não estudou hoje; problem_of_day: todos)"""
+    from src.services import notifications
+
+    title, message, selector = REMINDERS[kind]
+    notification_type = 'problem_of_day' if kind == 'problem_of_day' else 'reminder'
+    created = notifications.fan_out(getattr(notifications, selector)(chunk_size=batch_size),
+                                    notification_type, title, message, batch_size=batch_size)
+    click.echo(f"{created} notificações criadas")
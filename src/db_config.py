@@ -0,0 +1,133 @@
+"""
+Configuração da conexão com o banco de dados.
+
+- URL: DATABASE_URL (postgres:// é normalizado para postgresql://) ou um
+  SQLite local em src/database/curio_app.db (fallback em /tmp).
+- SQLite: cada conexão nova recebe os PRAGMAs de concorrência (WAL,
+  synchronous=NORMAL, busy_timeout e mmap_size) via evento `connect`. Com
+  WAL leitores não bloqueiam o escritor, e o busy_timeout faz as escritas
+  concorrentes dos threads do gthread esperarem a vez em vez de falharem
+  com "database is locked".
+- Bancos servidor (PostgreSQL/MySQL): pool dimensionado por todos os
+  threads do worker que usam o banco (requisições, seções do dashboard e
+  correção em fila), com pool_pre_ping e reciclagem de conexões.
+- Réplica de leitura opcional: DATABASE_READ_URL vira o bind 'replica'
+  (roteamento em src/db_routing.py).
+
+Todos os valores podem ser ajustados por variáveis de ambiente (ver abaixo).
+"""
+import os
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from src.db_routing import REPLICA_BIND
+
+# PRAGMAs aplicados em cada conexão SQLite
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+
+
+def database_uri() -> str:
+    """URL do banco principal"""
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        return normalize_database_url(database_url)
+
+    # Tentar criar banco na pasta do projeto, senão usar /tmp
+    try:
+        db_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database')
+        os.makedirs(db_dir, exist_ok=True)
+        db_path = os.path.join(db_dir, 'curio_app.db')
+        # Testar se consegue escrever no diretório
+        test_file = os.path.join(db_dir, 'test.tmp')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.remove(test_file)
+    except Exception as e:
+        print(f"⚠️  Não foi possível criar banco na pasta do projeto: {e}")
+        db_path = '/tmp/curio_app.db'
+
+    print(f"✅ Banco de dados configurado em: {db_path}")
+    return f"sqlite:///{db_path}"
+
+
+def normalize_database_url(url: str) -> str:
+    """Heroku/Render ainda entregam postgres://, que o SQLAlchemy 2 não aceita"""
+    if url.startswith('postgres://'):
+        return 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == 'sqlite'
+
+
+def worker_db_threads() -> int:
+    """
+    Threads de um worker que podem segurar uma conexão ao mesmo tempo.
+
+    Cada thread usa no máximo uma conexão por vez, mas não são só os do
+    gthread: a requisição de /dashboard/bootstrap segura a sua enquanto as
+    seções rodam no pool compartilhado do processo (DASHBOARD_SECTION_WORKERS
+    threads, ver src/services/dashboard_bootstrap.py), e a fila de correção
+    tem os seus GRADING_WORKERS threads (src/services/grading_queue.py).
+    """
+    return (
+        int(os.environ.get('WEB_THREADS', '2'))
+        + int(os.environ.get('DASHBOARD_SECTION_WORKERS', '4'))
+        + int(os.environ.get('GRADING_WORKERS', '2'))
+    )
+
+
+def engine_options(url: str) -> Dict:
+    """Opções de create_engine adequadas ao tipo de banco"""
+    if is_sqlite(url):
+        # Timeout do driver em segundos; o busy_timeout do PRAGMA é o efetivo
+        return {'connect_args': {'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000}}
+
+    threads = worker_db_threads()
+    return {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', str(threads))),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', str(threads))),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '1').lower() not in ('0', 'false', 'no'),
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+    """Listener do evento `connect`: aplica os PRAGMAs em uma conexão SQLite nova"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    finally:
+        cursor.close()
+
+
+def configure_database(app) -> None:
+    """Define URL e opções de engine no app (antes de db.init_app)"""
+    uri = database_uri()
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(uri)
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    read_url = os.environ.get('DATABASE_READ_URL')
+    if read_url:
+        read_url = normalize_database_url(read_url)
+        app.config['SQLALCHEMY_BINDS'] = {REPLICA_BIND: {'url': read_url, **engine_options(read_url)}}
+        print(f"✅ Réplica de leitura configurada: {make_url(read_url).render_as_string(hide_password=True)}")
+
+
+def install_engine_events(app, db) -> None:
+    """Registra os listeners de conexão em todos os engines do app (depois de db.init_app)"""
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == 'sqlite' and not event.contains(engine, 'connect', set_sqlite_pragmas):
+                event.listen(engine, 'connect', set_sqlite_pragmas)
@@ -0,0 +1,77 @@
+"""
+Roteamento de leituras para uma réplica (DATABASE_READ_URL).
+
+Quando DATABASE_READ_URL está configurada, o engine da réplica é registrado
+como o bind 'replica' e a sessão do Flask-SQLAlchemy passa a ser uma
+RoutingSession. Consultas vão para a réplica apenas quando a requisição
+(ou um trecho de código) foi marcada como somente leitura:
+
+- blueprints inteiros: `bp.before_request(route_reads_to_replica)`
+  (vale só para GET/HEAD);
+- uma view: decorador `@use_read_replica`;
+- um trecho: `with read_replica(): ...`.
+
+Read-your-writes: assim que a sessão faz um flush ou executa um
+INSERT/UPDATE/DELETE, ela fica presa ao primário até o fim da requisição
+(a sessão é descartada no teardown do app context). Sem réplica
+configurada tudo continua no primário.
+"""
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import g, has_app_context, request
+from flask_sqlalchemy.session import Session
+
+REPLICA_BIND = 'replica'
+
+# Chave em Session.info que prende a sessão ao primário
+_PINNED_TO_PRIMARY = 'pinned_to_primary'
+
+
+def replica_requested() -> bool:
+    return has_app_context() and g.get('_use_read_replica', False)
+
+
+class RoutingSession(Session):
+    """Sessão que envia as leituras marcadas para o bind da réplica"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._route_to_replica(clause):
+            return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _route_to_replica(self, clause) -> bool:
+        if self._flushing or getattr(clause, 'is_dml', False):
+            self.info[_PINNED_TO_PRIMARY] = True
+            return False
+        return (
+            not self.info.get(_PINNED_TO_PRIMARY)
+            and replica_requested()
+            and REPLICA_BIND in self._db.engines
+        )
+
+
+@contextmanager
+def read_replica():
+    """Marca as consultas do bloco como elegíveis para a réplica"""
+    previous = g.get('_use_read_replica', False)
+    g._use_read_replica = True
+    try:
+        yield
+    finally:
+        g._use_read_replica = previous
+
+
+def use_read_replica(view):
+    """Decorador de view somente leitura"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with read_replica():
+            return view(*args, **kwargs)
+    return wrapper
+
+
+def route_reads_to_replica():
+    """before_request para blueprints somente leitura (apenas GET/HEAD)"""
+    if request.method in ('GET', 'HEAD'):
+        g._use_read_replica = True
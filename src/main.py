@@ -3,123 +3,142 @@ import sys
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory, jsonify, make_response
-from flask_cors import CORS
+import importlib
 import pathlib
 
-ROOT = pathlib.Path(__file__).resolve().parent
-app = Flask(
-    __name__,
-    static_folder=str(ROOT / "static"),  # aponta para src/static
-    static_url_path="/"
-)
+from flask import Flask, abort, current_app, jsonify, make_response, request
+from flask_cors import CORS
+
 from src.models.user import db
-from src.routes.user import user_bp
-from src.routes.student import student_bp
-from src.routes.content import content_bp
-from src.routes.ai_personalization import ai_bp
-from src.routes.ai_simple import ai_simple_bp
-from src.routes.problem_of_day import problem_bp as problem_day_bp
-from src.routes.ai_tutor_chat_optimized import tutor_chat_bp
-from src.routes.gamification import gamification_bp
-from src.routes.dashboard import dashboard_bp
-from src.routes.cpa_demo import cpa_demo_bp
-from src.routes.metacognition import metacognition_bp
-from src.routes.reports import reports_bp
-
-app = Flask(__name__)
-
-# Configuração de produção
-app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "curio_secret_key_2024_#FGSgvasgf$5$WGT")
-app.config["ENV"] = os.environ.get("FLASK_ENV", "production")
-
-# Habilitar CORS para todas as rotas
-CORS(app, resources={r"/api/*": {"origins": "*"}})
-
-# Configurar banco de dados
-database_url = os.environ.get("DATABASE_URL")
-if database_url:
-    app.config["SQLALCHEMY_DATABASE_URI"] = database_url
-else:
-    # Tentar criar banco na pasta do projeto, senão usar /tmp
-    try:
-        db_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database")
-        os.makedirs(db_dir, exist_ok=True)
-        db_path = os.path.join(db_dir, "curio_app.db")
-        # Testar se consegue escrever no diretório
-        test_file = os.path.join(db_dir, "test.tmp")
-        with open(test_file, 'w') as f:
-            f.write("test")
-        os.remove(test_file)
-        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
-        print(f"✅ Banco de dados configurado em: {db_path}")
-    except Exception as e:
-        print(f"⚠️  Não foi possível criar banco na pasta do projeto: {e}")
-        # Fallback para /tmp
-        db_path = "/tmp/curio_app.db"
-        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path}"
-        print(f"✅ Banco de dados configurado em: {db_path}")
-
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-# Inicializar banco de dados
-db.init_app(app)
-
-# Registrar blueprints
-app.register_blueprint(user_bp, url_prefix="/api")
-app.register_blueprint(student_bp, url_prefix="/api")
-app.register_blueprint(content_bp, url_prefix="/api")
-app.register_blueprint(ai_bp, url_prefix="/api")
-app.register_blueprint(ai_simple_bp, url_prefix="/api")
-app.register_blueprint(problem_day_bp, url_prefix='/api')
-app.register_blueprint(tutor_chat_bp, url_prefix="/api")
-app.register_blueprint(gamification_bp, url_prefix="/api/gamification")
-app.register_blueprint(dashboard_bp, url_prefix="/api")
-app.register_blueprint(cpa_demo_bp, url_prefix="/api")
-app.register_blueprint(metacognition_bp, url_prefix="/api")
-app.register_blueprint(reports_bp, url_prefix="/api")
+from src.db_config import configure_database, install_engine_events
+from src.cli import curio_cli
+from src.static_assets import StaticAssets
+
+ROOT = pathlib.Path(__file__).resolve().parent
+
+# Conjuntos de blueprints: (módulo, atributo, prefixo). Os módulos só são
+# importados quando o perfil inclui o conjunto, então um worker de chat não
+# carrega as rotas de catálogo (nem as dependências delas) e vice-versa.
+BLUEPRINT_SETS = {
+    'core': (
+        ('src.routes.user', 'user_bp', '/api'),
+        ('src.routes.student', 'student_bp', '/api'),
+        ('src.routes.content', 'content_bp', '/api'),
+        ('src.routes.ai_personalization', 'ai_bp', '/api'),
+        ('src.routes.ai_simple', 'ai_simple_bp', '/api'),
+        ('src.routes.problem_of_day', 'problem_bp', '/api'),
+        ('src.routes.gamification', 'gamification_bp', '/api/gamification'),
+        ('src.routes.dashboard', 'dashboard_bp', '/api'),
+        ('src.routes.cpa_demo', 'cpa_demo_bp', '/api'),
+        ('src.routes.metacognition', 'metacognition_bp', '/api'),
+        ('src.routes.reports', 'reports_bp', '/api'),
+    ),
+    'chat': (
+        ('src.routes.ai_tutor_chat', 'tutor_chat_bp', '/api'),
+    ),
+}
+
+# Perfis de deploy: quais conjuntos cada tipo de worker registra e se ele
+# também entrega o frontend (SPA)
+PROFILES = {
+    'full': {'blueprints': ('core', 'chat'), 'spa': True},
+    'api-core': {'blueprints': ('core',), 'spa': False},
+    'api-chat': {'blueprints': ('chat',), 'spa': False},
+    'static': {'blueprints': (), 'spa': True},
+}
+DEFAULT_PROFILE = 'full'
+
+
+def register_blueprint_sets(app, names):
+    for name in names:
+        for module_name, attribute, url_prefix in BLUEPRINT_SETS[name]:
+            module = importlib.import_module(module_name)
+            app.register_blueprint(getattr(module, attribute), url_prefix=url_prefix)
+
+
+def create_app(profile=None):
+    """
+    Monta a aplicação para um perfil de deploy (CURIO_APP_PROFILE, padrão
+    'full'). Ex.: `gunicorn "src.main:create_app('api-chat')"`.
+    """
+    profile = profile or os.environ.get("CURIO_APP_PROFILE", DEFAULT_PROFILE)
+    if profile not in PROFILES:
+        raise ValueError(f"Perfil desconhecido: {profile} (use um de: {', '.join(PROFILES)})")
+    settings = PROFILES[profile]
+
+    app = Flask(__name__, static_folder=str(ROOT / "static"))  # aponta para src/static
+
+    # Configuração de produção
+    app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "curio_secret_key_2024_#FGSgvasgf$5$WGT")
+    app.config["ENV"] = os.environ.get("FLASK_ENV", "production")
+    app.config["CURIO_PROFILE"] = profile
+    app.config["CURIO_BLUEPRINT_SETS"] = settings['blueprints']
+
+    # Habilitar CORS para todas as rotas
+    CORS(app, resources={r"/api/*": {"origins": "*"}})
+
+    # Configurar banco de dados (URL, pool e PRAGMAs do SQLite: ver src/db_config.py)
+    configure_database(app)
+
+    # Inicializar banco de dados
+    db.init_app(app)
+    install_engine_events(app, db)
+
+    # Registrar blueprints
+    register_blueprint_sets(app, settings['blueprints'])
+
+    # Comandos `flask curio ...` (o schema é criado por `flask curio bootstrap`,
+    # nunca no import: os workers sobem sem tocar no banco)
+    app.cli.add_command(curio_cli)
+
+    app.add_url_rule('/health', view_func=health_check)
+    if settings['blueprints']:
+        app.add_url_rule('/api', view_func=api_info)
+    if settings['spa']:
+        app.extensions['static_assets'] = StaticAssets(app.static_folder)
+        app.add_url_rule('/', defaults={'path': ''}, view_func=spa)
+        app.add_url_rule('/<path:path>', view_func=spa)
+
+    return app
+
 
 # Servir arquivos estáticos do frontend (se existirem)
-# Helpers de cache
+# Helpers de cache: index.html é revalidado a cada acesso (o ETag responde
+# 304); os demais arquivos do build têm hash no nome e podem ficar em cache
 def _set_no_cache(resp):
-    resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+    resp.headers["Cache-Control"] = "no-cache, must-revalidate, max-age=0"
     return resp
 
 def _set_long_cache(resp):
     resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
     return resp
 
-# SPA fallback: entrega arquivos estáticos se existirem;
+# SPA fallback: entrega arquivos estáticos se existirem (índice em memória,
+# versões .br/.gz pré-comprimidas: ver src/static_assets.py);
 # senão, devolve index.html (exceto para /api/*)
-@app.route("/", defaults={"path": ""})
-@app.route("/<path:path>")
 def spa(path):
     # Nunca interceptar rotas da API
     if path.startswith("api/"):
         return jsonify({"error": "not found"}), 404
 
-    static_folder = app.static_folder
+    assets = current_app.extensions["static_assets"]
+    asset = assets.get(path) if path else None
 
-    # Se pediu explicitamente index.html, devolve sem cache
-    if path == "" or path == "index.html":
-        resp = send_from_directory(static_folder, "index.html")
-        return _set_no_cache(resp)
-
-    # Tenta servir o arquivo estático solicitado
-    try:
-        resp = send_from_directory(static_folder, path)
-        # Se tem extensão (ex: .js, .css, .png), usar cache longo
+    # Arquivo do build (ex: .js, .css, .png): cache longo
+    if asset is not None and path != "index.html":
+        resp = assets.response(asset, request)
         if "." in path:
             return _set_long_cache(resp)
         # Caso raro: rota sem ponto, mas existente -> no-cache
         return _set_no_cache(resp)
-    except Exception:
-        # Fallback para SPA
-        resp = send_from_directory(static_folder, "index.html")
-        return _set_no_cache(resp)
+
+    # index.html (em memória), pedido explicitamente ou como fallback para rotas da SPA
+    index = assets.get("index.html")
+    if index is None:
+        abort(404)
+    return _set_no_cache(assets.response(index, request))
 
 # Rota de health check
-@app.route('/health')
 def health_check():
     return jsonify({
         "status": "healthy",
@@ -130,7 +149,6 @@ def health_check():
     })
 
 # Rota de informações da API
-@app.route('/api')
 def api_info():
     return jsonify({
         "api_name": "Curió Educational Platform API",
@@ -155,153 +173,22 @@ def api_info():
         ]
     })
 
-# Inicializar banco de dados e dados padrão
-def init_database():
-    """Inicializa banco de dados e popula com dados padrão"""
-    with app.app_context():
-        try:
-            # Importar todos os modelos na ordem correta para evitar erros de foreign key
-            from src.models.user import User
-            from src.models.teacher import Teacher  # ANTES de content
-            from src.models.student import Student
-            from src.models.content import Content  # DEPOIS de teacher
-            from src.models.progress import Progress
-            from src.models.ai_personalization import AIPersonalization
-            from src.models.problem_of_day import ProblemOfDay
-            from src.models.ai_tutor_chat import ChatMessage
-            from src.models.gamification import (
-                StudentProgress, Achievement, StudentAchievement, 
-                StudyStreak, StudentPoints, ActivityLog
-            )
-            
-            # Criar todas as tabelas
-            db.create_all()
-            print("✅ Tabelas do banco de dados criadas com sucesso!")
-            
-            # Verificar se já existem conquistas
-            existing_achievements = Achievement.query.count()
-            if existing_achievements == 0:
-                # Criar conquistas padrão
-                default_achievements = [
-                    {
-                        'name': 'Primeiro Passo',
-                        'description': 'Complete seu primeiro exercício na plataforma Curió',
-                        'icon': 'play',
-                        'category': 'progress',
-                        'requirement_type': 'exercises_completed',
-                        'requirement_value': 1,
-                        'points': 10,
-                        'rarity': 'common'
-                    },
-                    {
-                        'name': 'Curioso',
-                        'description': 'Faça sua primeira pergunta ao tutor Curió',
-                        'icon': 'brain',
-                        'category': 'interaction',
-                        'requirement_type': 'chat_messages',
-                        'requirement_value': 1,
-                        'points': 5,
-                        'rarity': 'common'
-                    },
-                    {
-                        'name': 'Dedicado',
-                        'description': 'Estude por 3 dias consecutivos',
-                        'icon': 'calendar',
-                        'category': 'streak',
-                        'requirement_type': 'streak_days',
-                        'requirement_value': 3,
-                        'points': 25,
-                        'rarity': 'common'
-                    },
-                    {
-                        'name': 'Persistente',
-                        'description': 'Mantenha uma sequência de 7 dias de estudo',
-                        'icon': 'target',
-                        'category': 'streak',
-                        'requirement_type': 'streak_days',
-                        'requirement_value': 7,
-                        'points': 50,
-                        'rarity': 'rare'
-                    },
-                    {
-                        'name': 'Explorador da Matemática',
-                        'description': 'Complete 10 exercícios de matemática',
-                        'icon': 'calculator',
-                        'category': 'subject',
-                        'requirement_type': 'subject_exercises',
-                        'requirement_value': 10,
-                        'points': 30,
-                        'rarity': 'common'
-                    },
-                    {
-                        'name': 'Cientista Curioso',
-                        'description': 'Complete 10 atividades de ciências',
-                        'icon': 'microscope',
-                        'category': 'subject',
-                        'requirement_type': 'subject_exercises',
-                        'requirement_value': 10,
-                        'points': 30,
-                        'rarity': 'common'
-                    },
-                    {
-                        'name': 'Maratonista',
-                        'description': 'Estude por 30 dias consecutivos - um verdadeiro campeão!',
-                        'icon': 'trophy',
-                        'category': 'streak',
-                        'requirement_type': 'streak_days',
-                        'requirement_value': 30,
-                        'points': 200,
-                        'rarity': 'legendary'
-                    },
-                    {
-                        'name': 'Mestre dos Pontos',
-                        'description': 'Acumule 1000 pontos na plataforma',
-                        'icon': 'zap',
-                        'category': 'points',
-                        'requirement_type': 'total_points',
-                        'requirement_value': 1000,
-                        'points': 100,
-                        'rarity': 'rare'
-                    },
-                    {
-                        'name': 'Tempo é Ouro',
-                        'description': 'Dedique 10 horas aos estudos',
-                        'icon': 'clock',
-                        'category': 'time',
-                        'requirement_type': 'study_time_hours',
-                        'requirement_value': 10,
-                        'points': 75,
-                        'rarity': 'rare'
-                    },
-                    {
-                        'name': 'Lenda do Curió',
-                        'description': 'Conquista especial para os maiores estudiosos',
-                        'icon': 'crown',
-                        'category': 'special',
-                        'requirement_type': 'total_points',
-                        'requirement_value': 5000,
-                        'points': 500,
-                        'rarity': 'legendary'
-                    }
-                ]
-                
-                for achievement_data in default_achievements:
-                    achievement = Achievement(**achievement_data)
-                    db.session.add(achievement)
-                
-                db.session.commit()
-                print(f"✅ {len(default_achievements)} conquistas padrão criadas!")
-            
-            print("🎉 Banco de dados inicializado com sucesso!")
-            
-        except Exception as e:
-            print(f"❌ Erro ao inicializar banco de dados: {e}")
-            db.session.rollback()
-
-# Inicializar banco de dados e criar tabelas
-init_database()
+_app = None
+
+
+def __getattr__(name):
+    # `src.main:app` (gunicorn, flask --app) monta a aplicação do perfil de
+    # CURIO_APP_PROFILE no primeiro acesso, não no import do módulo
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
+    app = create_app()
+
     # Configuração para desenvolvimento local e produção
     port = int(os.environ.get("PORT", 5000))
     host = os.environ.get("HOST", "0.0.0.0")
@@ -313,4 +200,8 @@ if __name__ == "__main__":
     print(f"🔧 Debug: {debug}")
     print(f"🐦 Curió está pronto para voar!")
     
+    # Em desenvolvimento o servidor local também prepara o banco
+    from src.bootstrap import bootstrap_database
+    bootstrap_database(app)
+    
     app.run(host=host, port=port, debug=debug)
@@ -1,5 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+import json
 from src.models.user import db
 
 class AIPersonalization(db.Model):
@@ -17,6 +18,17 @@ class AIPersonalization(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    def apply_learning_profile(self, profile):
+        """Atualiza os campos persistidos a partir de um LearningProfile do motor de IA"""
+        self.learning_style_detected = profile.learning_style
+        self.preferred_content_types = json.dumps(profile.preferred_content_types)
+        self.difficulty_preference = profile.difficulty_preference
+        self.pace_preference = profile.pace_preference
+        self.strengths = json.dumps(profile.strong_subjects)
+        self.weaknesses = json.dumps(profile.weak_subjects)
+        self.ai_confidence_score = profile.confidence_level
+        self.last_analysis_date = datetime.utcnow()
+    
     def __repr__(self):
         return f'<AIPersonalization Student:{self.student_id} - {self.learning_style_detected}>'
     
@@ -198,6 +198,14 @@ class StudentPoints(db.Model):
             'points_to_next_level': (self.level * 100) - self.experience_points
         }
 
+class DashboardVersion(db.Model):
+    """Versão dos dados de dashboard do estudante, incrementada junto com cada escrita"""
+    __tablename__ = 'dashboard_versions'
+
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class ActivityLog(db.Model):
     __tablename__ = 'activity_logs'
     
@@ -342,6 +350,10 @@ class GamificationEngine:
                 if points_data:
                     points_data.add_points(achievement.points, 'achievement')
         
+        if new_achievements:
+            # Import local: src.services.dashboard importa este módulo
+            from src.services.dashboard import bump_dashboard_version
+            bump_dashboard_version(student_id)
         db.session.commit()
         return new_achievements
     
@@ -0,0 +1,42 @@
+from datetime import datetime
+from src.models.user import db
+
+
+class Notification(db.Model):
+    __tablename__ = 'notifications'
+    __table_args__ = (
+        # Leitura paginada por keyset: WHERE student_id = ? AND id < ? ORDER BY id DESC
+        db.Index('ix_notifications_student_id_id', 'student_id', 'id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False)
+    type = db.Column(db.String(30), nullable=False)  # achievement, reminder, problem_of_day, tip
+    title = db.Column(db.String(200), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    icon = db.Column(db.String(50), nullable=True)
+    color = db.Column(db.String(20), nullable=True)
+    is_read = db.Column(db.Boolean, nullable=False, default=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    read_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'type': self.type,
+            'title': self.title,
+            'message': self.message,
+            'icon': self.icon,
+            'color': self.color,
+            'timestamp': self.created_at.isoformat() if self.created_at else None,
+            'read': self.is_read
+        }
+
+
+class NotificationCounter(db.Model):
+    """Contador de não lidas por estudante, mantido junto com cada escrita"""
+    __tablename__ = 'notification_counters'
+
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), primary_key=True)
+    unread_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
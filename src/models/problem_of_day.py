@@ -12,6 +12,7 @@ class ProblemOfDay(db.Model):
     expected_answer = db.Column(db.Text, nullable=True)  # Optional expected answer
     solution_hints = db.Column(db.Text, nullable=True)  # JSON string with hints
     resources = db.Column(db.Text, nullable=True)  # JSON string with additional resources
+    rubric = db.Column(db.Text, nullable=True)  # JSON string with the grading rubric (see src/services/answer_rubric.py)
     date_created = db.Column(db.DateTime, default=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
     
@@ -34,15 +35,30 @@ class ProblemOfDay(db.Model):
 
 class ProblemSubmission(db.Model):
     __tablename__ = 'problem_submissions'
+    __table_args__ = (
+        db.Index('ix_problem_submissions_status_id', 'status', 'id'),
+        # Uma submissão por chave: reenvios simultâneos esbarram no índice (src/services/idempotency.py)
+        db.Index('uq_problem_submissions_idempotency_key', 'idempotency_key', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False, index=True)
     problem_id = db.Column(db.Integer, db.ForeignKey('problems_of_day.id'), nullable=False)
     answer = db.Column(db.Text, nullable=False)
     is_correct = db.Column(db.Boolean, nullable=True)  # Can be evaluated later
     time_spent = db.Column(db.Integer, nullable=True)  # Time in minutes
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     feedback = db.Column(db.Text, nullable=True)  # AI-generated feedback
+    confidence = db.Column(db.Float, nullable=True)  # Pontuação da rubrica (0-1)
+    # Fila de correção (src/services/grading_queue.py): pending -> grading -> graded | failed.
+    # NULL = corrigida na própria requisição (linhas anteriores à fila)
+    status = db.Column(db.String(20), nullable=True)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    graded_at = db.Column(db.DateTime, nullable=True)
+    attempts = db.Column(db.Integer, nullable=True)
+    grading_error = db.Column(db.Text, nullable=True)
+    # Hash da chave de idempotência (src/services/idempotency.py)
+    idempotency_key = db.Column(db.String(64), nullable=True)
     
     def to_dict(self):
         return {
@@ -53,6 +69,93 @@ class ProblemSubmission(db.Model):
             'is_correct': self.is_correct,
             'time_spent': self.time_spent,
             'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
-            'feedback': self.feedback
+            'feedback': self.feedback,
+            'status': self.status or 'graded',
+            'graded_at': self.graded_at.isoformat() if self.graded_at else None
         }
 
+
+class ProblemSchedule(db.Model):
+    """Problema do dia agendado para uma data (uma linha por data)"""
+    __tablename__ = 'problem_schedule'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    scheduled_date = db.Column(db.Date, nullable=False, unique=True, index=True)
+    problem_id = db.Column(db.Integer, db.ForeignKey('problems_of_day.id'), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    problem = db.relationship('ProblemOfDay', lazy='joined')
+    
+    def to_dict(self):
+        return {
+            'date': self.scheduled_date.isoformat(),
+            'problem_id': self.problem_id
+        }
+
+class DailyProblemAssignment(db.Model):
+    """Problema do dia atribuído a um estudante (gerado em lote pelo job diário)"""
+    __tablename__ = 'daily_problem_assignments'
+    __table_args__ = (
+        db.UniqueConstraint('assignment_date', 'student_id', name='uq_daily_problem_assignment'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    assignment_date = db.Column(db.Date, nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False, index=True)
+    problem_id = db.Column(db.Integer, db.ForeignKey('problems_of_day.id'), nullable=False)
+    grade_band = db.Column(db.String(20), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'date': self.assignment_date.isoformat(),
+            'student_id': self.student_id,
+            'problem_id': self.problem_id,
+            'grade_band': self.grade_band
+        }
+
+
+class ProblemStats(db.Model):
+    """
+    Contadores de submissões por problema, atualizados na mesma transação da
+    correção (src/services/problem_stats.py). problem_id = 0 guarda o total
+    de todos os problemas.
+    """
+    __tablename__ = 'problem_stats'
+    
+    problem_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    submissions = db.Column(db.Integer, nullable=False, default=0)
+    correct = db.Column(db.Integer, nullable=False, default=0)
+    timed_submissions = db.Column(db.Integer, nullable=False, default=0)  # com time_spent > 0
+    total_time = db.Column(db.Integer, nullable=False, default=0)  # minutos
+    # Histograma da confiança da avaliação em faixas de 0.2 (0-0.2, ..., 0.8-1.0)
+    confidence_0 = db.Column(db.Integer, nullable=False, default=0)
+    confidence_1 = db.Column(db.Integer, nullable=False, default=0)
+    confidence_2 = db.Column(db.Integer, nullable=False, default=0)
+    confidence_3 = db.Column(db.Integer, nullable=False, default=0)
+    confidence_4 = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        success_rate = self.correct / self.submissions * 100 if self.submissions else 0
+        return {
+            'problem_id': self.problem_id or None,
+            'total_submissions': self.submissions,
+            'correct_submissions': self.correct,
+            'success_rate': round(success_rate, 1),
+            'avg_time_spent': round(self.total_time / self.timed_submissions, 1) if self.timed_submissions else None,
+            'confidence_histogram': [
+                self.confidence_0, self.confidence_1, self.confidence_2,
+                self.confidence_3, self.confidence_4
+            ]
+        }
+
+
+class HintReveal(db.Model):
+    """Quantas dicas da escada de um problema o estudante já abriu"""
+    __tablename__ = 'hint_reveals'
+    
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), primary_key=True)
+    problem_id = db.Column(db.Integer, db.ForeignKey('problems_of_day.id'), primary_key=True)
+    revealed = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
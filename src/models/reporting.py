@@ -0,0 +1,50 @@
+from datetime import datetime
+from src.models.user import db
+
+# Métricas aditivas do cubo (médias e taxas são derivadas na consulta)
+CUBE_METRICS = (
+    'progress_records', 'progress_completed', 'score_sum', 'score_count', 'progress_minutes',
+    'activities', 'activity_points', 'activity_minutes',
+    'submissions', 'correct_submissions'
+)
+
+# Dimensões do cubo ('' = não informado)
+CUBE_DIMENSIONS = ('week_start', 'grade_level', 'subject', 'singapore_stage')
+
+
+class ReportCubeCell(db.Model):
+    """Agregados de uma semana para uma combinação série x matéria x etapa do Método de Singapura"""
+    __tablename__ = 'report_cube'
+    __table_args__ = (
+        db.UniqueConstraint('week_start', 'grade_level', 'subject', 'singapore_stage',
+                            name='uq_report_cube_cell'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    week_start = db.Column(db.Date, nullable=False, index=True)  # segunda-feira da semana
+    grade_level = db.Column(db.String(10), nullable=False, default='')
+    subject = db.Column(db.String(50), nullable=False, default='')
+    singapore_stage = db.Column(db.String(20), nullable=False, default='')
+
+    progress_records = db.Column(db.Integer, nullable=False, default=0)
+    progress_completed = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    score_count = db.Column(db.Integer, nullable=False, default=0)
+    progress_minutes = db.Column(db.Integer, nullable=False, default=0)
+    activities = db.Column(db.Integer, nullable=False, default=0)
+    activity_points = db.Column(db.Integer, nullable=False, default=0)
+    activity_minutes = db.Column(db.Integer, nullable=False, default=0)
+    submissions = db.Column(db.Integer, nullable=False, default=0)
+    correct_submissions = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<ReportCubeCell {self.week_start} {self.grade_level}/{self.subject}/{self.singapore_stage}>'
+
+
+class ReportCubeState(db.Model):
+    """Marca d'água da última atualização incremental do cubo (linha única, id=1)"""
+    __tablename__ = 'report_cube_state'
+
+    id = db.Column(db.Integer, primary_key=True)
+    refreshed_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
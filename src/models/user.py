@@ -1,6 +1,9 @@
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
+from src.db_routing import RoutingSession
+
+# RoutingSession envia leituras marcadas para a réplica (DATABASE_READ_URL)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
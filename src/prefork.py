@@ -0,0 +1,79 @@
+"""
+Inicialização compatível com fork (gunicorn com preload_app).
+
+O processo mestre importa a aplicação uma única vez e, antes de criar os
+workers, monta o estado somente leitura que todos compartilham por
+copy-on-write: motor de IA (NumPy + modelo de estilos mapeado em memória),
+bases de conhecimento do tutor, catálogo de conquistas e escadas de dicas
+dos problemas. Conexões de banco nunca atravessam o fork: o mestre descarta
+o pool depois do aquecimento e cada worker descarta o que herdou antes de
+atender requisições.
+"""
+import gc
+import time
+
+from src.models.user import db
+
+
+def _dispose_engines(app, close=True):
+    """Descarta os pools de conexão de todos os engines (binds) da aplicação"""
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=close)
+
+
+def warm_up(app, freeze_gc=True):
+    """
+    Executado no processo mestre, antes do fork dos workers.
+    Retorna o tempo gasto em segundos.
+    """
+    started = time.perf_counter()
+    blueprint_sets = app.config.get('CURIO_BLUEPRINT_SETS', ('core', 'chat'))
+
+    # Cada perfil (ver create_app em src/main.py) aquece só o que as suas rotas usam
+    if 'chat' in blueprint_sets:
+        from src.ai_tutor_engine import EDUCATIONAL_KNOWLEDGE  # noqa: F401
+
+    if 'core' in blueprint_sets:
+        from src.routes.ai_advanced import get_ai_engine
+        from src.services.achievement_catalog import load_achievement_catalog
+        from src.services.hints import load_hint_ladders
+
+        with app.app_context():
+            get_ai_engine()
+            try:
+                load_achievement_catalog()
+                load_hint_ladders()
+            except Exception as e:
+                # Banco ainda sem tabelas: os workers carregam catálogo e dicas sob demanda
+                print(f"⚠️  Catálogo de conquistas/dicas não carregado no pré-fork: {e}")
+                db.session.rollback()
+            db.session.remove()
+
+    # Nenhuma conexão aberta no mestre pode ser herdada pelos workers
+    _dispose_engines(app)
+
+    if freeze_gc:
+        # Move os objetos já criados para a geração permanente: o GC dos
+        # workers não os percorre e não suja as páginas compartilhadas
+        gc.collect()
+        gc.freeze()
+
+    return time.perf_counter() - started
+
+
+def after_fork(app):
+    """
+    Executado em cada worker logo após o fork. close=False descarta as
+    referências do pool sem fechar conexões que pertencem ao processo pai.
+    Com GRADING_MODE=queue, inicia as threads da fila de correção nos
+    perfis que servem as rotas de problemas (threads não sobrevivem ao
+    fork, por isso nunca são criadas no mestre).
+    """
+    _dispose_engines(app, close=False)
+
+    if 'core' not in app.config.get('CURIO_BLUEPRINT_SETS', ('core',)):
+        return
+    from src.services.grading_queue import queue_enabled, start_grading_workers
+    if queue_enabled():
+        start_grading_workers(app)
@@ -3,46 +3,58 @@ from src.models.student import Student, db
 from src.models.progress import Progress
 from src.models.content import Content
 from src.models.ai_personalization import AIPersonalization
-from src.ai_engine import AIPersonalizationEngine, LearningProfile
+from src.services.student_progress import get_progress_rows, load_analysis_input
 from datetime import datetime
 import json
+import threading
 
 ai_advanced_bp = Blueprint('ai_advanced', __name__)
 
-# Instância global do motor de IA
-ai_engine = AIPersonalizationEngine()
+# Instância global do motor de IA, criada no primeiro uso: numpy e o modelo
+# de estilos só são carregados por workers que realmente atendem estas rotas
+_ai_engine = None
+_ai_engine_lock = threading.Lock()
+
+def get_ai_engine():
+    """Retorna o motor de IA do processo, criando-o na primeira chamada"""
+    global _ai_engine
+    if _ai_engine is None:
+        with _ai_engine_lock:
+            if _ai_engine is None:
+                from src.ai_engine import AIPersonalizationEngine
+                _ai_engine = AIPersonalizationEngine()
+    return _ai_engine
+
+def _learning_profile_from_personalization(student_id, personalization):
+    """Reconstrói o LearningProfile a partir do registro salvo"""
+    from src.ai_engine import LearningProfile
+    
+    return LearningProfile(
+        student_id=student_id,
+        learning_style=personalization.learning_style_detected or 'mixed',
+        difficulty_preference=personalization.difficulty_preference or 'medium',
+        pace_preference=personalization.pace_preference or 'normal',
+        attention_span=30,  # padrão
+        preferred_content_types=json.loads(personalization.preferred_content_types) if personalization.preferred_content_types else ['mixed'],
+        strong_subjects=json.loads(personalization.strengths) if personalization.strengths else [],
+        weak_subjects=json.loads(personalization.weaknesses) if personalization.weaknesses else [],
+        engagement_score=0.7,  # padrão
+        confidence_level=personalization.ai_confidence_score or 0.5
+    )
 
 @ai_advanced_bp.route('/ai/advanced/analyze/<int:student_id>', methods=['POST'])
 def advanced_student_analysis(student_id):
     """Análise avançada do estudante usando o motor de IA"""
     student = Student.query.get_or_404(student_id)
     
-    # Coletar dados do estudante
-    progress_records = Progress.query.filter_by(student_id=student_id).all()
+    # Coletar dados do estudante (progresso + conteúdo em uma única consulta)
+    student_data = load_analysis_input(student_id)
     
     # Simular dados de interação (em produção, viria de logs reais)
-    interaction_data = _generate_mock_interaction_data(student_id, len(progress_records))
-    
-    # Preparar dados para análise
-    student_data = {
-        'student_id': student_id,
-        'progress_records': [
-            {
-                'content': {
-                    'content_type': record.content.content_type if record.content else 'text',
-                    'difficulty_level': record.content.difficulty_level if record.content else 'medium',
-                    'subject': record.content.subject if record.content else 'General'
-                },
-                'score': record.score,
-                'time_spent': record.time_spent,
-                'status': record.status
-            } for record in progress_records
-        ],
-        'interactions': interaction_data
-    }
+    student_data['interactions'] = _generate_mock_interaction_data(student_id, len(student_data['progress_records']))
     
     # Executar análise avançada
-    learning_profile = ai_engine.analyze_student_behavior(student_data)
+    learning_profile = get_ai_engine().analyze_student_behavior(student_data)
     
     # Salvar perfil no banco de dados
     personalization = AIPersonalization.query.filter_by(student_id=student_id).first()
@@ -51,14 +63,7 @@ def advanced_student_analysis(student_id):
         db.session.add(personalization)
     
     # Atualizar com dados avançados
-    personalization.learning_style_detected = learning_profile.learning_style
-    personalization.preferred_content_types = json.dumps(learning_profile.preferred_content_types)
-    personalization.difficulty_preference = learning_profile.difficulty_preference
-    personalization.pace_preference = learning_profile.pace_preference
-    personalization.strengths = json.dumps(learning_profile.strong_subjects)
-    personalization.weaknesses = json.dumps(learning_profile.weak_subjects)
-    personalization.ai_confidence_score = learning_profile.confidence_level
-    personalization.last_analysis_date = datetime.utcnow()
+    personalization.apply_learning_profile(learning_profile)
     
     db.session.commit()
     
@@ -96,18 +101,7 @@ def advanced_content_recommendations(student_id):
         return jsonify({'error': 'No learning profile found. Please run advanced analysis first.'}), 400
     
     # Reconstruir perfil de aprendizagem
-    learning_profile = LearningProfile(
-        student_id=student_id,
-        learning_style=personalization.learning_style_detected or 'mixed',
-        difficulty_preference=personalization.difficulty_preference or 'medium',
-        pace_preference=personalization.pace_preference or 'normal',
-        attention_span=30,  # padrão
-        preferred_content_types=json.loads(personalization.preferred_content_types) if personalization.preferred_content_types else ['mixed'],
-        strong_subjects=json.loads(personalization.strengths) if personalization.strengths else [],
-        weak_subjects=json.loads(personalization.weaknesses) if personalization.weaknesses else [],
-        engagement_score=0.7,  # padrão
-        confidence_level=personalization.ai_confidence_score or 0.5
-    )
+    learning_profile = _learning_profile_from_personalization(student_id, personalization)
     
     # Obter conteúdo disponível
     available_content = Content.query.filter_by(
@@ -118,7 +112,7 @@ def advanced_content_recommendations(student_id):
     content_dicts = [content.to_dict() for content in available_content]
     
     # Gerar recomendações avançadas
-    recommendations = ai_engine.generate_personalized_recommendations(
+    recommendations = get_ai_engine().generate_personalized_recommendations(
         learning_profile, 
         content_dicts, 
         num_recommendations=8
@@ -163,18 +157,7 @@ def generate_advanced_learning_path(student_id, subject):
         return jsonify({'error': 'No learning profile found. Please run advanced analysis first.'}), 400
     
     # Reconstruir perfil
-    learning_profile = LearningProfile(
-        student_id=student_id,
-        learning_style=personalization.learning_style_detected or 'mixed',
-        difficulty_preference=personalization.difficulty_preference or 'medium',
-        pace_preference=personalization.pace_preference or 'normal',
-        attention_span=30,
-        preferred_content_types=json.loads(personalization.preferred_content_types) if personalization.preferred_content_types else ['mixed'],
-        strong_subjects=json.loads(personalization.strengths) if personalization.strengths else [],
-        weak_subjects=json.loads(personalization.weaknesses) if personalization.weaknesses else [],
-        engagement_score=0.7,
-        confidence_level=personalization.ai_confidence_score or 0.5
-    )
+    learning_profile = _learning_profile_from_personalization(student_id, personalization)
     
     # Obter conteúdo da matéria
     subject_content = Content.query.filter_by(
@@ -186,7 +169,7 @@ def generate_advanced_learning_path(student_id, subject):
     content_dicts = [content.to_dict() for content in subject_content]
     
     # Gerar caminho de aprendizagem
-    learning_path = ai_engine.generate_learning_path(
+    learning_path = get_ai_engine().generate_learning_path(
         learning_profile, 
         subject, 
         content_dicts
@@ -216,21 +199,10 @@ def predict_student_performance(student_id, content_id):
         return jsonify({'error': 'No learning profile found. Please run advanced analysis first.'}), 400
     
     # Reconstruir perfil
-    learning_profile = LearningProfile(
-        student_id=student_id,
-        learning_style=personalization.learning_style_detected or 'mixed',
-        difficulty_preference=personalization.difficulty_preference or 'medium',
-        pace_preference=personalization.pace_preference or 'normal',
-        attention_span=30,
-        preferred_content_types=json.loads(personalization.preferred_content_types) if personalization.preferred_content_types else ['mixed'],
-        strong_subjects=json.loads(personalization.strengths) if personalization.strengths else [],
-        weak_subjects=json.loads(personalization.weaknesses) if personalization.weaknesses else [],
-        engagement_score=0.7,
-        confidence_level=personalization.ai_confidence_score or 0.5
-    )
+    learning_profile = _learning_profile_from_personalization(student_id, personalization)
     
     # Predizer performance
-    prediction = ai_engine.predict_performance(learning_profile, content.to_dict())
+    prediction = get_ai_engine().predict_performance(learning_profile, content.to_dict())
     
     return jsonify({
         'student_id': student_id,
@@ -251,7 +223,7 @@ def get_metacognition_tools(student_id):
     student = Student.query.get_or_404(student_id)
     
     # Obter dados de progresso recente
-    recent_progress = Progress.query.filter_by(student_id=student_id).order_by(Progress.created_at.desc()).limit(10).all()
+    recent_progress = get_progress_rows(student_id, limit=10, newest_first=True)
     
     # Analisar padrões de aprendizagem
     learning_patterns = _analyze_learning_patterns(recent_progress)
@@ -293,7 +265,7 @@ def _generate_mock_interaction_data(student_id: int, num_records: int) -> list:
     
     return interactions
 
-def _get_study_approach_recommendation(profile: LearningProfile, content) -> str:
+def _get_study_approach_recommendation(profile, content) -> str:
     """Recomenda abordagem de estudo baseada no perfil"""
     if profile.learning_style == 'visual':
         return "Use diagramas, mapas mentais e recursos visuais. Faça anotações coloridas e organizadas."
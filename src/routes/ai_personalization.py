@@ -1,8 +1,8 @@
 from flask import Blueprint, jsonify, request
 from src.models.ai_personalization import AIPersonalization, db
 from src.models.student import Student
-from src.models.progress import Progress
 from src.models.content import Content
+from src.services.student_progress import get_progress_rows, has_content
 from datetime import datetime
 import json
 
@@ -22,11 +22,9 @@ def analyze_student(student_id):
     student = Student.query.get(student_id)
     if not student:
         return jsonify({'error': 'Student not found'}), 404
-    analysis = perform_ai_analysis(student)
-    return jsonify(analysis)
 
-    # Obter dados de progresso do estudante
-    progress_records = Progress.query.filter_by(student_id=student_id).all()
+    # Obter dados de progresso do estudante (com o conteúdo, em uma consulta)
+    progress_records = get_progress_rows(student_id)
     if not progress_records:
         return jsonify({'message': 'No progress data available for analysis'}), 400
 
@@ -123,8 +121,8 @@ def _analyze_student_performance(progress_records):
     # Análise de estilo de aprendizagem (simplificada)
     content_types = {}
     for record in progress_records:
-        if record.content and record.score and record.score > 70:
-            content_type = record.content.content_type
+        if has_content(record) and record.score and record.score > 70:
+            content_type = record.content_type
             content_types[content_type] = content_types.get(content_type, 0) + 1
     preferred_content_type = max(content_types, key=content_types.get) if content_types else 'mixed'
 
@@ -157,8 +155,8 @@ def _analyze_student_performance(progress_records):
     # Identificar pontos fortes e fracos por matéria
     subjects = {}
     for record in progress_records:
-        if record.content and record.score:
-            subject = record.content.subject
+        if has_content(record) and record.score:
+            subject = record.subject
             subjects.setdefault(subject, []).append(record.score)
 
     strengths, weaknesses = [], []
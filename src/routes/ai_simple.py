@@ -3,6 +3,7 @@ from src.models.student import Student, db
 from src.models.progress import Progress
 from src.models.content import Content
 from src.models.ai_personalization import AIPersonalization
+from src.services.student_progress import get_progress_rows, has_content
 from datetime import datetime
 import json
 import random
@@ -209,7 +210,7 @@ def generate_simple_learning_path(student_id, subject):
 def get_dashboard_data(student_id):
     """Fornece dados para o dashboard do estudante"""
     student = Student.query.get_or_404(student_id)
-    progress_records = Progress.query.filter_by(student_id=student_id).order_by(Progress.created_at.desc()).limit(10).all()
+    progress_records = get_progress_rows(student_id, limit=10, newest_first=True)
     
     # Calcular métricas
     if progress_records:
@@ -227,11 +228,11 @@ def get_dashboard_data(student_id):
     # Atividades recentes
     activities = []
     for record in progress_records[:5]:
-        if record.content:
+        if has_content(record):
             activities.append({
                 'id': record.id,
-                'subject': record.content.subject,
-                'topic': record.content.title,
+                'subject': record.subject,
+                'topic': record.title,
                 'progress': record.score or 0,
                 'time_spent': record.time_spent or 25,
                 'status': record.status,
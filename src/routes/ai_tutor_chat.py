@@ -1,11 +1,15 @@
 from flask import Blueprint, request, jsonify
-from src.models.ai_tutor_chat import ChatSession, ChatMessage, db
-from src.models.problem_of_day import ProblemOfDay
-from src.ai_tutor_engine import AITutorEngine
-from datetime import datetime
+from src.models.ai_tutor_chat import db
+from src.services import tutor
+from src.services.tutor import SessionClosed, SessionNotFound
 
 tutor_chat_bp = Blueprint('tutor_chat', __name__)
-ai_tutor = AITutorEngine()
+
+def _session_not_found():
+    return jsonify({
+        'success': False,
+        'error': 'Sessão de chat não encontrada'
+    }), 404
 
 @tutor_chat_bp.route('/tutor/chat/start', methods=['POST'])
 def start_chat_session():
@@ -13,39 +17,14 @@ def start_chat_session():
     Inicia uma nova sessão de chat com o tutor de IA.
     """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         student_id = data.get('student_id', 1)  # Default student for demo
-        problem_id = data.get('problem_id')
-        
-        # Cria nova sessão de chat
-        session = ChatSession(
-            student_id=student_id,
-            problem_id=problem_id
-        )
-        
-        db.session.add(session)
-        db.session.commit()
-        
-        # Gera mensagem de boas-vindas do tutor
-        welcome_response = ai_tutor.generate_response("", [], None)
-        
-        # Salva a mensagem de boas-vindas
-        welcome_message = ChatMessage(
-            session_id=session.id,
-            sender='tutor',
-            message=welcome_response['message'],
-            message_type=welcome_response['type']
-        )
-        
-        db.session.add(welcome_message)
-        db.session.commit()
-        
+
         return jsonify({
             'success': True,
-            'session': session.to_dict(),
-            'welcome_message': welcome_message.to_dict()
+            **tutor.start_session(student_id, data.get('problem_id'))
         })
-        
+
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -56,95 +35,38 @@ def start_chat_session():
 @tutor_chat_bp.route('/tutor/chat/<int:session_id>/message', methods=['POST'])
 def send_message(session_id):
     """
-    Envia uma mensagem do estudante e recebe resposta do tutor.
+    Envia uma mensagem do estudante e recebe resposta do tutor
+    (ver src/services/tutor.py).
     """
     try:
-        data = request.get_json()
-        
+        data = request.get_json(silent=True)
+
         if not data or 'message' not in data:
             return jsonify({
                 'success': False,
                 'error': 'Mensagem não fornecida'
             }), 400
-        
-        student_message = data['message'].strip()
-        
+
+        student_message = (data['message'] or '').strip()
+
         if not student_message:
             return jsonify({
                 'success': False,
                 'error': 'Mensagem não pode estar vazia'
             }), 400
-        
-        # Verifica se a sessão existe
-        session = ChatSession.query.get(session_id)
-        if not session:
-            return jsonify({
-                'success': False,
-                'error': 'Sessão de chat não encontrada'
-            }), 404
-        
-        if not session.is_active:
-            return jsonify({
-                'success': False,
-                'error': 'Sessão de chat não está ativa'
-            }), 400
-        
-        # Salva a mensagem do estudante
-        student_msg = ChatMessage(
-            session_id=session_id,
-            sender='student',
-            message=student_message,
-            message_type='text'
-        )
-        
-        db.session.add(student_msg)
-        db.session.commit()
-        
-        # Busca o histórico da conversa
-        conversation_history = []
-        for msg in session.messages:
-            conversation_history.append({
-                'sender': msg.sender,
-                'message': msg.message,
-                'type': msg.message_type,
-                'timestamp': msg.timestamp
-            })
-        
-        # Busca contexto do problema se disponível
-        problem_context = None
-        if session.problem_id:
-            problem = ProblemOfDay.query.get(session.problem_id)
-            if problem:
-                problem_context = {
-                    'category': problem.category,
-                    'difficulty': problem.difficulty,
-                    'title': problem.title
-                }
-        
-        # Gera resposta do tutor
-        tutor_response = ai_tutor.generate_response(
-            student_message, 
-            conversation_history[:-1],  # Exclui a mensagem atual
-            problem_context
-        )
-        
-        # Salva a resposta do tutor
-        tutor_msg = ChatMessage(
-            session_id=session_id,
-            sender='tutor',
-            message=tutor_response['message'],
-            message_type=tutor_response['type']
-        )
-        
-        db.session.add(tutor_msg)
-        db.session.commit()
-        
+
         return jsonify({
             'success': True,
-            'student_message': student_msg.to_dict(),
-            'tutor_response': tutor_msg.to_dict()
+            **tutor.send_message(session_id, student_message)
         })
-        
+
+    except SessionNotFound:
+        return _session_not_found()
+    except SessionClosed:
+        return jsonify({
+            'success': False,
+            'error': 'Sessão de chat não está ativa'
+        }), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -155,24 +77,42 @@ def send_message(session_id):
 @tutor_chat_bp.route('/tutor/chat/<int:session_id>/history', methods=['GET'])
 def get_chat_history(session_id):
     """
-    Retorna o histórico completo de uma sessão de chat.
+    Retorna o histórico de uma sessão de chat, paginado (?page=, ?per_page=).
     """
     try:
-        session = ChatSession.query.get(session_id)
-        if not session:
-            return jsonify({
-                'success': False,
-                'error': 'Sessão de chat não encontrada'
-            }), 404
-        
-        messages = [msg.to_dict() for msg in session.messages]
-        
         return jsonify({
             'success': True,
-            'session': session.to_dict(),
-            'messages': messages
+            **tutor.get_history(
+                session_id,
+                page=request.args.get('page', 1, type=int),
+                per_page=request.args.get('per_page', 20, type=int)
+            )
+        })
+
+    except SessionNotFound:
+        return _session_not_found()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@tutor_chat_bp.route('/tutor/chat/<int:session_id>/summary', methods=['GET'])
+def get_session_summary(session_id):
+    """
+    Retorna o resumo de uma sessão de chat.
+    """
+    try:
+        summary, cached = tutor.get_summary(session_id)
+
+        return jsonify({
+            'success': True,
+            'summary': summary,
+            'cached': cached
         })
-        
+
+    except SessionNotFound:
+        return _session_not_found()
     except Exception as e:
         return jsonify({
             'success': False,
@@ -185,28 +125,13 @@ def end_chat_session(session_id):
     Encerra uma sessão de chat.
     """
     try:
-        session = ChatSession.query.get(session_id)
-        if not session:
-            return jsonify({
-                'success': False,
-                'error': 'Sessão de chat não encontrada'
-            }), 404
-        
-        session.is_active = False
-        session.session_end = datetime.utcnow()
-        
-        db.session.commit()
-        
-        # Gera resumo da conversa
-        conversation_history = [msg.to_dict() for msg in session.messages]
-        summary = ai_tutor.generate_summary(conversation_history)
-        
         return jsonify({
             'success': True,
-            'session': session.to_dict(),
-            'summary': summary
+            **tutor.end_session(session_id)
         })
-        
+
+    except SessionNotFound:
+        return _session_not_found()
     except Exception as e:
         db.session.rollback()
         return jsonify({
@@ -220,26 +145,30 @@ def get_student_chat_sessions(student_id):
     Retorna todas as sessões de chat de um estudante.
     """
     try:
-        sessions = ChatSession.query.filter_by(student_id=student_id).order_by(ChatSession.session_start.desc()).all()
-        
-        sessions_data = []
-        for session in sessions:
-            session_dict = session.to_dict()
-            # Adiciona informação do problema se disponível
-            if session.problem_id:
-                problem = ProblemOfDay.query.get(session.problem_id)
-                if problem:
-                    session_dict['problem_title'] = problem.title
-            sessions_data.append(session_dict)
-        
         return jsonify({
             'success': True,
-            'sessions': sessions_data
+            'sessions': tutor.student_sessions(student_id)
         })
-        
+
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@tutor_chat_bp.route('/tutor/performance', methods=['GET'])
+def get_tutor_performance():
+    """
+    Retorna métricas do cache de respostas e do tempo de resposta do tutor.
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'performance': tutor.performance_metrics()
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
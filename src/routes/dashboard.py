@@ -1,132 +1,34 @@
-from flask import Blueprint, jsonify
-from src.models.user import User, db
+from flask import Blueprint, jsonify, request
+from src.models.user import db
 from src.models.student import Student
-from src.models.progress import Progress
-from src.models.gamification import StudentProgress, StudentPoints, StudyStreak, StudentAchievement, Achievement
-from datetime import datetime, timedelta
-import random
+from src.services.dashboard import QUICK_ACTIONS, get_student_dashboard
+from src.services.dashboard_bootstrap import invalidate_section, load_dashboard_sections
+from src.services.notifications import DEFAULT_PAGE_SIZE, list_notifications, mark_read, unread_count
+import time
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
 @dashboard_bp.route('/dashboard/stats', methods=['GET'])
 def get_dashboard_stats():
-    """Retorna estatísticas para o dashboard"""
+    """Retorna estatísticas para o dashboard (?student_id=)"""
+    student_id = request.args.get('student_id', type=int)
+    if student_id is None:
+        return jsonify({
+            'status': 'error',
+            'message': 'Parâmetro student_id é obrigatório'
+        }), 400
+    return get_student_dashboard_stats(student_id)
+
+@dashboard_bp.route('/dashboard/students/<int:student_id>/stats', methods=['GET'])
+def get_student_dashboard_stats(student_id):
+    """Retorna as estatísticas do dashboard de um estudante (cache por estudante)"""
     try:
-        # Dados simulados para demonstração (baseados no usuário Victor Pires)
-        user_stats = {
-            'user': {
-                'name': 'Victor Pires',
-                'grade': '7º Ano',
-                'level': 13,
-                'points': 1250,
-                'streak': 7
-            },
-            'progress': {
-                'exercises_completed': 47,
-                'total_study_time': 12.5,  # horas
-                'subjects_studied': 4,
-                'current_streak': 7,
-                'best_streak': 12,
-                'weekly_goal': 5,  # horas
-                'weekly_progress': 3.2  # horas completadas esta semana
-            },
-            'recent_activities': [
-                {
-                    'id': 1,
-                    'type': 'exercise',
-                    'subject': 'Matemática',
-                    'title': 'Frações Equivalentes',
-                    'points': 15,
-                    'completed_at': '2025-01-24T10:30:00Z',
-                    'status': 'completed'
-                },
-                {
-                    'id': 2,
-                    'type': 'chat',
-                    'subject': 'Ciências',
-                    'title': 'Pergunta sobre fotossíntese',
-                    'points': 5,
-                    'completed_at': '2025-01-24T09:15:00Z',
-                    'status': 'completed'
-                },
-                {
-                    'id': 3,
-                    'type': 'problem',
-                    'subject': 'Matemática',
-                    'title': 'Problema do Dia - Geometria',
-                    'points': 25,
-                    'completed_at': '2025-01-23T16:45:00Z',
-                    'status': 'completed'
-                },
-                {
-                    'id': 4,
-                    'type': 'achievement',
-                    'subject': 'Geral',
-                    'title': 'Conquistou: Dedicado',
-                    'points': 25,
-                    'completed_at': '2025-01-23T16:45:00Z',
-                    'status': 'unlocked'
-                }
-            ],
-            'subjects': {
-                'matematica': {
-                    'name': 'Matemática',
-                    'progress': 68,
-                    'exercises_completed': 23,
-                    'last_activity': '2025-01-24T10:30:00Z',
-                    'color': '#3B82F6'
-                },
-                'ciencias': {
-                    'name': 'Ciências',
-                    'progress': 45,
-                    'exercises_completed': 12,
-                    'last_activity': '2025-01-24T09:15:00Z',
-                    'color': '#10B981'
-                },
-                'historia': {
-                    'name': 'História',
-                    'progress': 32,
-                    'exercises_completed': 8,
-                    'last_activity': '2025-01-22T14:20:00Z',
-                    'color': '#F59E0B'
-                },
-                'portugues': {
-                    'name': 'Português',
-                    'progress': 55,
-                    'exercises_completed': 15,
-                    'last_activity': '2025-01-23T11:10:00Z',
-                    'color': '#EF4444'
-                }
-            },
-            'achievements': {
-                'total': 8,
-                'recent': [
-                    {
-                        'name': 'Dedicado',
-                        'description': 'Estude por 3 dias consecutivos',
-                        'icon': 'calendar',
-                        'unlocked_at': '2025-01-23T16:45:00Z',
-                        'rarity': 'common'
-                    },
-                    {
-                        'name': 'Explorador da Matemática',
-                        'description': 'Complete 10 exercícios de matemática',
-                        'icon': 'calculator',
-                        'unlocked_at': '2025-01-22T18:30:00Z',
-                        'rarity': 'common'
-                    }
-                ]
-            },
-            'weekly_chart': [
-                {'day': 'Seg', 'hours': 1.5, 'exercises': 3},
-                {'day': 'Ter', 'hours': 2.0, 'exercises': 5},
-                {'day': 'Qua', 'hours': 1.8, 'exercises': 4},
-                {'day': 'Qui', 'hours': 2.2, 'exercises': 6},
-                {'day': 'Sex', 'hours': 1.9, 'exercises': 4},
-                {'day': 'Sáb', 'hours': 1.2, 'exercises': 2},
-                {'day': 'Dom', 'hours': 0.8, 'exercises': 1}
-            ]
-        }
+        user_stats = get_student_dashboard(student_id)
+        if user_stats is None:
+            return jsonify({
+                'status': 'error',
+                'message': 'Estudante não encontrado'
+            }), 404
         
         return jsonify({
             'status': 'success',
@@ -139,48 +41,56 @@ def get_dashboard_stats():
             'message': f'Erro ao buscar estatísticas: {str(e)}'
         }), 500
 
+@dashboard_bp.route('/dashboard/bootstrap', methods=['GET'])
+def get_dashboard_bootstrap():
+    """
+    Retorna em uma única requisição as seções do dashboard
+    (stats, progress, activities, notifications, problem_of_day, quick_actions).
+    
+    Parâmetros: student_id (obrigatório) e sections (lista separada por
+    vírgulas para atualizar só algumas seções).
+    """
+    started = time.perf_counter()
+    student_id = request.args.get('student_id', type=int)
+    if student_id is None:
+        return jsonify({
+            'status': 'error',
+            'message': 'Parâmetro student_id é obrigatório'
+        }), 400
+    
+    try:
+        if db.session.get(Student, student_id) is None:
+            return jsonify({
+                'status': 'error',
+                'message': 'Estudante não encontrado'
+            }), 404
+        
+        names = [name for name in request.args.get('sections', '').split(',') if name]
+        sections = load_dashboard_sections(student_id, names)
+        
+        return jsonify({
+            'status': 'success',
+            'student_id': student_id,
+            'sections': sections,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+        })
+        
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Erro ao montar o dashboard: {str(e)}'
+        }), 500
+
 @dashboard_bp.route('/dashboard/quick-actions', methods=['GET'])
 def get_quick_actions():
     """Retorna ações rápidas para o dashboard"""
     try:
-        quick_actions = [
-            {
-                'id': 'tutor',
-                'title': 'Conversar com Curió',
-                'description': 'Tire suas dúvidas com o tutor de IA',
-                'icon': 'message-circle',
-                'color': 'blue',
-                'action': 'navigate',
-                'target': '/tutor'
-            },
-            {
-                'id': 'problem',
-                'title': 'Problema do Dia',
-                'description': 'Resolva o desafio diário',
-                'icon': 'target',
-                'color': 'green',
-                'action': 'navigate',
-                'target': '/problem'
-            },
-            {
-                'id': 'mathematics',
-                'title': 'Estudar Matemática',
-                'description': 'Continue seus exercícios',
-                'icon': 'calculator',
-                'color': 'purple',
-                'action': 'navigate',
-                'target': '/mathematics'
-            },
-            {
-                'id': 'science',
-                'title': 'Explorar Ciências',
-                'description': 'Descubra o mundo científico',
-                'icon': 'microscope',
-                'color': 'teal',
-                'action': 'navigate',
-                'target': '/science'
-            }
-        ]
+        quick_actions = QUICK_ACTIONS
         
         return jsonify({
             'status': 'success',
@@ -195,44 +105,54 @@ def get_quick_actions():
 
 @dashboard_bp.route('/dashboard/notifications', methods=['GET'])
 def get_notifications():
-    """Retorna notificações para o usuário"""
+    """
+    Retorna notificações do estudante, mais recentes primeiro.
+    
+    Parâmetros: student_id (obrigatório), before (cursor da página anterior),
+    limit (padrão 20, máx. 100) e unread (1 = só não lidas).
+    """
+    student_id = request.args.get('student_id', type=int)
+    if student_id is None:
+        return jsonify({
+            'status': 'error',
+            'message': 'Parâmetro student_id é obrigatório'
+        }), 400
+    
     try:
-        notifications = [
-            {
-                'id': 1,
-                'type': 'achievement',
-                'title': 'Nova conquista desbloqueada!',
-                'message': 'Parabéns! Você conquistou "Dedicado" por estudar 3 dias seguidos!',
-                'icon': 'trophy',
-                'color': 'yellow',
-                'timestamp': '2025-01-24T10:30:00Z',
-                'read': False
-            },
-            {
-                'id': 2,
-                'type': 'reminder',
-                'title': 'Hora de estudar!',
-                'message': 'Que tal resolver o problema do dia? Você ainda não tentou hoje!',
-                'icon': 'clock',
-                'color': 'blue',
-                'timestamp': '2025-01-24T09:00:00Z',
-                'read': False
-            },
-            {
-                'id': 3,
-                'type': 'tip',
-                'title': 'Dica do Curió',
-                'message': 'Sabia que estudar um pouco todo dia é melhor que estudar muito de uma vez?',
-                'icon': 'lightbulb',
-                'color': 'green',
-                'timestamp': '2025-01-23T20:00:00Z',
-                'read': True
-            }
-        ]
+        notifications, next_cursor = list_notifications(
+            student_id,
+            before=request.args.get('before', type=int),
+            limit=request.args.get('limit', DEFAULT_PAGE_SIZE, type=int),
+            unread_only=request.args.get('unread') in ('1', 'true')
+        )
+        
+        return jsonify({
+            'status': 'success',
+            'data': notifications,
+            'unread_count': unread_count(student_id),
+            'next_cursor': next_cursor
+        })
         
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Erro ao buscar notificações: {str(e)}'
+        }), 500
+
+@dashboard_bp.route('/dashboard/notifications/unread-count', methods=['GET'])
+def get_unread_notifications_count():
+    """Retorna só o contador de não lidas (badge)"""
+    student_id = request.args.get('student_id', type=int)
+    if student_id is None:
+        return jsonify({
+            'status': 'error',
+            'message': 'Parâmetro student_id é obrigatório'
+        }), 400
+    
+    try:
         return jsonify({
             'status': 'success',
-            'data': notifications
+            'unread_count': unread_count(student_id)
         })
         
     except Exception as e:
@@ -241,3 +161,29 @@ def get_notifications():
             'message': f'Erro ao buscar notificações: {str(e)}'
         }), 500
 
+@dashboard_bp.route('/dashboard/notifications/read', methods=['POST'])
+def mark_notifications_read():
+    """Marca notificações como lidas ({student_id, ids?}; sem ids marca todas)"""
+    data = request.get_json() or {}
+    student_id = data.get('student_id')
+    if student_id is None:
+        return jsonify({
+            'status': 'error',
+            'message': 'Campo student_id é obrigatório'
+        }), 400
+    
+    try:
+        changed = mark_read(student_id, data.get('ids'))
+        invalidate_section('notifications', student_id)
+        
+        return jsonify({
+            'status': 'success',
+            'marked_read': changed,
+            'unread_count': unread_count(student_id)
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Erro ao marcar notificações: {str(e)}'
+        }), 500
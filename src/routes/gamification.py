@@ -4,6 +4,10 @@ from src.models.gamification import (
     db, StudentProgress, Achievement, StudentAchievement, 
     StudyStreak, StudentPoints, ActivityLog, GamificationEngine
 )
+from src.db_routing import use_read_replica
+from src.services.dashboard import bump_dashboard_version, invalidate_student_dashboard
+from src.services.notifications import create_notification
+from src.services.achievement_catalog import get_achievement_catalog, invalidate_achievement_catalog
 
 gamification_bp = Blueprint('gamification', __name__)
 
@@ -56,10 +60,16 @@ def update_progress(student_id):
         ).first()
         
         if not progress:
+            # Defaults das colunas só valem no INSERT: os contadores são
+            # incrementados abaixo, então começam explicitamente em zero
             progress = StudentProgress(
                 student_id=student_id,
                 subject=data.get('subject'),
-                topic=data.get('topic')
+                topic=data.get('topic'),
+                progress_percentage=0.0,
+                time_spent_minutes=0,
+                exercises_completed=0,
+                exercises_correct=0
             )
             db.session.add(progress)
         
@@ -97,7 +107,8 @@ def update_progress(student_id):
         
         student_points = StudentPoints.query.filter_by(student_id=student_id).first()
         if not student_points:
-            student_points = StudentPoints(student_id=student_id)
+            student_points = StudentPoints(student_id=student_id, total_points=0, experience_points=0,
+                                           points_this_week=0, points_this_month=0, level=1)
             db.session.add(student_points)
         
         student_points.add_points(points_earned, data.get('activity_type', 'exercise'))
@@ -114,11 +125,20 @@ def update_progress(student_id):
         )
         activity_log.set_extra_data(data.get('extra_data', {}))
         db.session.add(activity_log)
+        bump_dashboard_version(student_id)
         
         db.session.commit()
         
         # Verifica novas conquistas
         new_achievements = GamificationEngine.check_achievements(student_id)
+        if new_achievements:
+            for achievement in new_achievements:
+                create_notification(
+                    student_id, 'achievement', 'Nova conquista desbloqueada!',
+                    f'Parabéns! Você conquistou "{achievement.name}": {achievement.description}',
+                    commit=False
+                )
+            db.session.commit()
         
         return jsonify({
             'success': True,
@@ -131,6 +151,8 @@ def update_progress(student_id):
         
     except Exception as e:
         db.session.rollback()
+        # O progresso pode ter sido gravado antes da falha
+        invalidate_student_dashboard(student_id)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -267,6 +289,7 @@ def get_activity_history(student_id):
         }), 500
 
 @gamification_bp.route('/leaderboard', methods=['GET'])
+@use_read_replica
 def get_leaderboard():
     """Retorna ranking de estudantes"""
     try:
@@ -340,19 +363,19 @@ def get_leaderboard():
 def get_all_achievements():
     """Retorna todas as conquistas disponíveis"""
     try:
-        achievements = Achievement.query.filter_by(is_active=True).all()
+        achievements = get_achievement_catalog()
         
         # Agrupa por categoria
         by_category = {}
         for achievement in achievements:
-            category = achievement.category
+            category = achievement['category']
             if category not in by_category:
                 by_category[category] = []
-            by_category[category].append(achievement.to_dict())
+            by_category[category].append(achievement)
         
         return jsonify({
             'success': True,
-            'achievements': [achievement.to_dict() for achievement in achievements],
+            'achievements': list(achievements),
             'by_category': by_category
         })
         
@@ -478,6 +501,7 @@ def seed_achievements():
                 db.session.add(achievement)
         
         db.session.commit()
+        invalidate_achievement_catalog()
         
         return jsonify({
             'success': True,
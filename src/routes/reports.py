@@ -1,38 +1,62 @@
 # src/routes/reports.py
-from flask import Blueprint, jsonify
-from src.models.student import Student
-from src.models.progress import Progress
-from src.models.gamification import Achievement
+import os
+from datetime import date
+
+from flask import Blueprint, jsonify, request
+from src.cache import TTLCache
+from src.db_routing import route_reads_to_replica
+from src.services.reports import build_overview
+from src.services.reporting_cube import query_cube
 
 reports_bp = Blueprint('reports', __name__)
 
+# Relatórios são somente leitura: GETs vão para a réplica, se configurada
+reports_bp.before_request(route_reads_to_replica)
+
+# Snapshot curto: o overview é o mesmo para todos os usuários
+_reports_cache = TTLCache(ttl_seconds=float(os.environ.get('REPORTS_CACHE_TTL', '60')))
+
 @reports_bp.route('/reports/overview', methods=['GET'])
 def overview():
     """
-    Retorna estatísticas agregadas:
-    - número total de alunos
-    - número total de conquistas cadastradas
-    - total de registros de progresso
-    - média de progresso (se disponível)
+    Retorna estatísticas agregadas (calculadas no banco, ver src/services/reports.py):
+    - número total de alunos, conquistas e registros de progresso
+    - média de progresso (StudentProgress.progress_percentage) e de score
+    - quebras por status, matéria e série
     """
-    total_students = Student.query.count()
-    total_achievements = Achievement.query.count()
-    total_progress_records = Progress.query.count()
+    try:
+        return jsonify(_reports_cache.get_or_set('overview', build_overview))
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-    # Calcular média de progresso, se houver campo progress_percentage
-    avg_progress = 0
-    progress_list = Progress.query.all()
-    percentages = []
-    for record in progress_list:
-        # Caso exista o atributo 'progress_percentage' no modelo de progresso
-        if hasattr(record, 'progress_percentage') and record.progress_percentage is not None:
-            percentages.append(record.progress_percentage)
-    if percentages:
-        avg_progress = sum(percentages) / len(percentages)
+@reports_bp.route('/reports/cube', methods=['GET'])
+def cube():
+    """
+    Fatias do cubo de relatórios (dados pré-agregados por semana).
 
-    return jsonify({
-        'total_students': total_students,
-        'total_achievements': total_achievements,
-        'total_progress_records': total_progress_records,
-        'avg_progress_percentage': avg_progress
-    })
+    Parâmetros:
+    - group_by: dimensões separadas por vírgula
+      (week_start, grade_level, subject, singapore_stage)
+    - grade_level, subject, singapore_stage: filtros
+    - from, to: intervalo de datas (YYYY-MM-DD)
+    """
+    try:
+        group_by = [d for d in request.args.get('group_by', '').split(',') if d]
+        filters = {
+            dimension: request.args[dimension]
+            for dimension in ('grade_level', 'subject', 'singapore_stage')
+            if dimension in request.args
+        }
+        date_from = request.args.get('from')
+        date_to = request.args.get('to')
+        rows = query_cube(
+            group_by=group_by,
+            filters=filters,
+            date_from=date.fromisoformat(date_from) if date_from else None,
+            date_to=date.fromisoformat(date_to) if date_to else None
+        )
+        return jsonify({'success': True, 'group_by': group_by, 'filters': filters, 'rows': rows})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,40 @@
+"""
+Catálogo de conquistas ativas.
+
+As conquistas quase nunca mudam, então o catálogo é lido uma vez e mantido
+em memória como uma tupla de dicts já serializados. Com o preload do
+gunicorn o snapshot é montado no processo mestre (ver src/prefork.py) e
+herdado pelos workers; depois do TTL cada worker relê do banco.
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+from src.models.gamification import Achievement
+
+CATALOG_TTL_SECONDS = 300
+
+_catalog_cache = {'achievements': None, 'loaded_at': 0.0}
+
+
+def load_achievement_catalog() -> Tuple[Dict, ...]:
+    """Relê as conquistas ativas do banco e substitui o snapshot em memória"""
+    achievements = tuple(
+        achievement.to_dict()
+        for achievement in Achievement.query.filter_by(is_active=True).order_by(Achievement.id)
+    )
+    _catalog_cache['achievements'] = achievements
+    _catalog_cache['loaded_at'] = time.monotonic()
+    return achievements
+
+
+def get_achievement_catalog(ttl_seconds: Optional[float] = CATALOG_TTL_SECONDS) -> Tuple[Dict, ...]:
+    """Conquistas ativas (snapshot em memória, relido após `ttl_seconds`)"""
+    achievements = _catalog_cache['achievements']
+    if achievements is None or time.monotonic() - _catalog_cache['loaded_at'] > ttl_seconds:
+        achievements = load_achievement_catalog()
+    return achievements
+
+
+def invalidate_achievement_catalog() -> None:
+    """Descarta o snapshot (a próxima leitura volta ao banco)"""
+    _catalog_cache['achievements'] = None
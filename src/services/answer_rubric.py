@@ -0,0 +1,224 @@
+"""
+Avaliação de respostas do problema do dia por rubricas.
+
+Cada problema pode guardar uma rubrica (JSON em ProblemOfDay.rubric);
+sem ela vale a rubrica padrão da categoria ou, por fim, DEFAULT_RUBRIC.
+Formato:
+
+    {
+        "groups": [
+            {"name": "calculations", "numbers": [900, 450, 1350], "tolerance": 0.01},
+            {"name": "concepts", "terms": ["deficit", "econom*"], "weight": 2}
+        ],
+        "pass_score": 0.4,
+        "min_words": 0
+    }
+
+- terms: palavras ou expressões, comparadas sem acento e sem caixa, no
+  início de palavra; com '*' no fim casam também as derivadas
+  ("econom*" casa "economizar", "economia").
+- numbers: valores esperados; "R$ 1.350,00", "1350" e "1350.0" casam
+  1350. tolerance é relativa (0.01 = 1%), padrão 0.
+- score do grupo = itens encontrados / itens; score geral = média
+  ponderada pelos pesos. Grupos vazios contam a quantidade de palavras em
+  relação a min_words (resposta dissertativa sem gabarito).
+
+A rubrica é compilada uma vez (uma expressão regular por termo e uma para
+os números) e guardada em cache por id do problema. Cada termo é buscado
+separadamente, então termos que se sobrepõem ("econom*" e "economia")
+casam na mesma palavra.
+
+As rubricas são editadas direto no banco (a API não altera
+ProblemOfDay.rubric), então o TTL do cache é a única invalidação: uma
+rubrica editada ou um problema removido passam a valer em cada worker em
+até RUBRIC_CACHE_TTL segundos.
+"""
+import json
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.cache import TTLCache
+from src.models.user import db
+from src.models.problem_of_day import ProblemOfDay
+
+RUBRIC_CACHE_TTL = 300
+
+# Usada quando nem o problema nem a categoria têm rubrica: avalia pelo tamanho
+DEFAULT_RUBRIC = {'groups': [], 'pass_score': 0.4, 'min_words': 20}
+
+# Rubricas padrão por categoria, para problemas cadastrados sem rubrica
+CATEGORY_RUBRICS = {
+    'personal_finance': {
+        'groups': [
+            {'name': 'calculations', 'numbers': [900, 450, 1350, 800, 550]},
+            {'name': 'concepts', 'terms': ['deficit', 'sobra*', 'econom*', 'cort*', 'ajust*', 'reduz*']},
+            {'name': 'solutions', 'terms': ['lazer', 'transporte', 'alimentacao', 'plano', 'orcamento']}
+        ],
+        'pass_score': 0.4
+    }
+}
+
+# Números no formato brasileiro ou internacional: 1.350,00 / 1350.5 / 1350
+NUMBER_PATTERN = r'(?<![\w.,])\d+(?:[.,]\d+)*'
+WORD_PATTERN = re.compile(r'\w+')
+
+_rubric_cache = TTLCache(ttl_seconds=RUBRIC_CACHE_TTL, maxsize=2048)
+
+
+def fold(text: str) -> str:
+    """Minúsculas e sem acentos ('Alimentação' -> 'alimentacao')"""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def parse_number(token: str) -> Optional[float]:
+    """Converte '1.350,50', '1,350.50', '1,5', '1350.5', '1.350' ou '1,350' em float"""
+    if ',' in token and '.' in token:
+        decimal = ',' if token.rfind(',') > token.rfind('.') else '.'
+    elif ',' in token or '.' in token:
+        # Um só tipo de separador seguido só de grupos de 3 dígitos é separador de
+        # milhar ('1.350', '1,350'); senão (ou depois de um 0: '0,350') é decimal
+        separator = ',' if ',' in token else '.'
+        head, *groups = token.split(separator)
+        decimal = None if head != '0' and all(len(part) == 3 for part in groups) else separator
+    else:
+        decimal = None
+    thousands = {',': '.', '.': ',', None: '.,'}[decimal]
+    normalized = token.translate({ord(char): None for char in thousands})
+    if decimal:
+        normalized = normalized.replace(decimal, '.')
+    try:
+        return float(normalized)
+    except ValueError:
+        return None
+
+
+@dataclass
+class Evaluation:
+    """Resultado da avaliação de uma resposta"""
+    is_correct: bool
+    confidence: float
+    score: float
+    groups: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _Group:
+    name: str
+    weight: float
+    size: int
+
+
+class CompiledRubric:
+    """Rubrica pronta para avaliar: uma regex por termo e uma para os números"""
+
+    def __init__(self, spec: Dict):
+        self.pass_score = float(spec.get('pass_score', 0.4))
+        self.min_words = int(spec.get('min_words', 0))
+        self.groups: List[_Group] = []
+        self._terms = []  # (regex do termo, grupo, item)
+        self._numbers = []  # (valor esperado, tolerância absoluta, grupo, item)
+
+        for g, group_spec in enumerate(spec.get('groups', [])):
+            terms = [fold(str(term)) for term in group_spec.get('terms', [])]
+            numbers = [float(number) for number in group_spec.get('numbers', [])]
+            self.groups.append(_Group(
+                name=group_spec.get('name', f'group_{g}'),
+                weight=float(group_spec.get('weight', 1)),
+                size=len(terms) + len(numbers),
+            ))
+            for t, term in enumerate(terms):
+                if term.endswith('*'):
+                    body = re.escape(term[:-1].strip()) + r'\w*'
+                else:
+                    body = re.escape(term) + r'\b'
+                self._terms.append((re.compile(r'\b' + body), g, t))
+            tolerance = float(group_spec.get('tolerance', 0))
+            for n, number in enumerate(numbers):
+                self._numbers.append((number, abs(number) * tolerance, g, len(terms) + n))
+
+        self._number_pattern = re.compile(NUMBER_PATTERN) if self._numbers else None
+
+    def _match_number(self, value: float, found: set) -> None:
+        for number, tolerance, g, item in self._numbers:
+            if abs(value - number) <= tolerance + 1e-9:
+                found.add((g, item))
+
+    def evaluate(self, answer: str) -> Evaluation:
+        text = fold(answer)
+        found = {(g, item) for pattern, g, item in self._terms if pattern.search(text)}
+        if self._number_pattern is not None:
+            for match in self._number_pattern.finditer(text):
+                value = parse_number(match.group())
+                if value is not None:
+                    self._match_number(value, found)
+
+        scores = {}
+        for g, group in enumerate(self.groups):
+            if group.size:
+                scores[group.name] = sum(1 for (owner, _item) in found if owner == g) / group.size
+
+        words = len(WORD_PATTERN.findall(text)) if self.min_words or not scores else 0
+        if scores:
+            total_weight = sum(group.weight for group in self.groups if group.size) or 1.0
+            score = sum(scores[group.name] * group.weight for group in self.groups if group.size) / total_weight
+            confidence = min(score * 2, 1.0)
+        else:
+            # Sem gabarito: proporção do tamanho mínimo esperado
+            score = min(words / self.min_words, 1.0) if self.min_words else 1.0
+            confidence = min(words / 50, 1.0)
+
+        is_correct = words >= self.min_words and score >= self.pass_score
+        return Evaluation(
+            is_correct=is_correct,
+            confidence=round(confidence, 2),
+            score=round(score, 2),
+            groups={name: round(value, 2) for name, value in scores.items()}
+        )
+
+
+def feedback_for(evaluation: Evaluation) -> str:
+    """Feedback ao estudante conforme o resultado e a confiança da avaliação"""
+    if evaluation.is_correct:
+        if evaluation.confidence > 0.8:
+            return "🎉 Excelente! Sua análise está muito completa e demonstra ótima compreensão dos conceitos."
+        elif evaluation.confidence > 0.6:
+            return "👏 Muito bem! Você captou os pontos principais. Sua abordagem está correta."
+        return "✅ Bom trabalho! Você está no caminho certo, mas pode detalhar mais alguns aspectos."
+    if evaluation.confidence > 0.3:
+        return "🤔 Boa tentativa! Você tocou em alguns pontos importantes, mas considere revisar os cálculos e usar as dicas."
+    return "💡 Continue tentando! Que tal começar organizando as informações do enunciado? Use as dicas para te guiar."
+
+
+def rubric_spec(rubric: Optional[str], category: Optional[str]) -> Dict:
+    """Rubrica do problema, da categoria ou a padrão"""
+    if rubric:
+        try:
+            return json.loads(rubric)
+        except (TypeError, ValueError):
+            print(f"⚠️  Rubrica inválida, usando a padrão da categoria {category}")
+    return CATEGORY_RUBRICS.get(category, DEFAULT_RUBRIC)
+
+
+def get_rubric(problem_id: int) -> Optional[CompiledRubric]:
+    """Rubrica compilada do problema (cache por id); None se o problema não existe"""
+    compiled = _rubric_cache.get(problem_id)
+    if compiled is not None:
+        return compiled
+    row = db.session.query(ProblemOfDay.rubric, ProblemOfDay.category)\
+        .filter(ProblemOfDay.id == problem_id).first()
+    if row is None:
+        return None
+    compiled = CompiledRubric(rubric_spec(row.rubric, row.category))
+    _rubric_cache.set(problem_id, compiled)
+    return compiled
+
+
+def evaluate_answer(problem_id: int, answer: str) -> Evaluation:
+    """Avalia a resposta com a rubrica do problema"""
+    rubric = get_rubric(problem_id)
+    if rubric is None:
+        rubric = CompiledRubric(DEFAULT_RUBRIC)
+    return rubric.evaluate(answer)
@@ -0,0 +1,291 @@
+"""
+Dashboard do estudante montado a partir das tabelas de resumo
+(StudentProgress, StudentPoints, StudyStreak, StudentAchievement) e do
+ActivityLog agregado por dia.
+
+São cinco consultas por estudante, independentemente do volume de
+histórico. O resultado fica em um cache por estudante (TTL) guardado junto
+com a versão dos dados do estudante (tabela dashboard_versions). Toda
+escrita que muda o dashboard (progresso, pontos, conquistas, submissões do
+problema do dia, notificações) chama `bump_dashboard_version` na mesma
+transação; cada
+leitura confere a versão com uma busca pela chave primária, então os
+outros workers do gunicorn deixam de servir o cache antigo assim que a
+escrita é confirmada, sem esperar o TTL.
+"""
+import os
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.exc import IntegrityError
+
+from src.cache import TTLCache
+from src.models.user import User, db
+from src.models.student import Student
+from src.models.gamification import (
+    ActivityLog, Achievement, DashboardVersion, StudentAchievement, StudentPoints, StudentProgress, StudyStreak
+)
+
+WEEKDAY_LABELS = ('Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom')
+SUBJECT_COLORS = ('#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#14B8A6')
+WEEKLY_GOAL_HOURS = 5
+RECENT_ACTIVITIES = 5
+RECENT_ACHIEVEMENTS = 3
+
+# Ações rápidas exibidas para todos os estudantes
+QUICK_ACTIONS = [
+    {
+        'id': 'tutor',
+        'title': 'Conversar com Curió',
+        'description': 'Tire suas dúvidas com o tutor de IA',
+        'icon': 'message-circle',
+        'color': 'blue',
+        'action': 'navigate',
+        'target': '/tutor'
+    },
+    {
+        'id': 'problem',
+        'title': 'Problema do Dia',
+        'description': 'Resolva o desafio diário',
+        'icon': 'target',
+        'color': 'green',
+        'action': 'navigate',
+        'target': '/problem'
+    },
+    {
+        'id': 'mathematics',
+        'title': 'Estudar Matemática',
+        'description': 'Continue seus exercícios',
+        'icon': 'calculator',
+        'color': 'purple',
+        'action': 'navigate',
+        'target': '/mathematics'
+    },
+    {
+        'id': 'science',
+        'title': 'Explorar Ciências',
+        'description': 'Descubra o mundo científico',
+        'icon': 'microscope',
+        'color': 'teal',
+        'action': 'navigate',
+        'target': '/science'
+    }
+]
+
+_dashboard_cache = TTLCache(
+    ttl_seconds=float(os.environ.get('DASHBOARD_CACHE_TTL', '300')),
+    maxsize=int(os.environ.get('DASHBOARD_CACHE_SIZE', '5000'))
+)
+
+
+def _iso(value) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _hours(minutes) -> float:
+    return round((minutes or 0) / 60, 1)
+
+
+def _weekly_chart(student_id: int, today: date):
+    """Horas e atividades por dia da semana atual (segunda a domingo)"""
+    monday = today - timedelta(days=today.weekday())
+    start = datetime.combine(monday, datetime.min.time())
+    day = func.date(ActivityLog.created_at)
+    totals = {
+        str(activity_day)[:10]: (minutes, activities)
+        for activity_day, minutes, activities in db.session.query(
+            day, func.sum(ActivityLog.time_spent_minutes), func.count(ActivityLog.id)
+        ).filter(
+            ActivityLog.student_id == student_id,
+            ActivityLog.created_at >= start,
+            ActivityLog.created_at < start + timedelta(days=7)
+        ).group_by(day)
+    }
+
+    chart = []
+    for offset, label in enumerate(WEEKDAY_LABELS):
+        minutes, activities = totals.get((monday + timedelta(days=offset)).isoformat(), (0, 0))
+        chart.append({'day': label, 'hours': _hours(minutes), 'exercises': activities})
+    return chart
+
+
+def build_student_dashboard(student_id: int, today: Optional[date] = None) -> Optional[Dict]:
+    """Dados do dashboard do estudante; None se o estudante não existe"""
+    today = today or datetime.utcnow().date()
+
+    header = db.session.query(
+        User.username, Student.grade_level,
+        StudentPoints.level, StudentPoints.total_points,
+        StudyStreak.current_streak, StudyStreak.longest_streak
+    ).select_from(Student).join(User, User.id == Student.user_id)\
+     .outerjoin(StudentPoints, StudentPoints.student_id == Student.id)\
+     .outerjoin(StudyStreak, StudyStreak.student_id == Student.id)\
+     .filter(Student.id == student_id).first()
+    if header is None:
+        return None
+    name, grade, level, points, current_streak, longest_streak = header
+
+    subject_rows = db.session.query(
+        StudentProgress.subject,
+        func.avg(StudentProgress.progress_percentage),
+        func.sum(StudentProgress.exercises_completed),
+        func.sum(StudentProgress.time_spent_minutes),
+        func.max(StudentProgress.last_activity)
+    ).filter(StudentProgress.student_id == student_id)\
+     .group_by(StudentProgress.subject).order_by(StudentProgress.subject).all()
+
+    subjects = {}
+    for index, (subject, progress, exercises, _minutes, last_activity) in enumerate(subject_rows):
+        subjects[subject.lower()] = {
+            'name': subject,
+            'progress': round(progress or 0),
+            'exercises_completed': exercises or 0,
+            'last_activity': _iso(last_activity),
+            'color': SUBJECT_COLORS[index % len(SUBJECT_COLORS)]
+        }
+
+    recent_activities = [
+        {
+            'id': activity.id,
+            'type': activity.activity_type,
+            'subject': activity.subject,
+            'title': activity.topic,
+            'points': activity.points_earned,
+            'completed_at': _iso(activity.created_at),
+            'status': 'completed'
+        }
+        for activity in ActivityLog.query.filter_by(student_id=student_id)
+        .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+        .limit(RECENT_ACTIVITIES)
+    ]
+
+    # earned_at tem default no modelo, então "conquistada" é progresso completo
+    earned = db.session.query(
+        Achievement.name, Achievement.description, Achievement.icon, Achievement.rarity,
+        StudentAchievement.earned_at
+    ).join(Achievement, Achievement.id == StudentAchievement.achievement_id)\
+     .filter(StudentAchievement.student_id == student_id, StudentAchievement.progress >= 100)\
+     .order_by(StudentAchievement.earned_at.desc()).all()
+
+    weekly_chart = _weekly_chart(student_id, today)
+
+    return {
+        'user': {
+            'name': name,
+            'grade': grade,
+            'level': level or 1,
+            'points': points or 0,
+            'streak': current_streak or 0
+        },
+        'progress': {
+            'exercises_completed': sum(s['exercises_completed'] for s in subjects.values()),
+            'total_study_time': _hours(sum(row[3] or 0 for row in subject_rows)),
+            'subjects_studied': len(subjects),
+            'current_streak': current_streak or 0,
+            'best_streak': longest_streak or 0,
+            'weekly_goal': WEEKLY_GOAL_HOURS,
+            'weekly_progress': round(sum(day['hours'] for day in weekly_chart), 1)
+        },
+        'recent_activities': recent_activities,
+        'subjects': subjects,
+        'achievements': {
+            'total': len(earned),
+            'recent': [
+                {
+                    'name': name,
+                    'description': description,
+                    'icon': icon,
+                    'unlocked_at': _iso(earned_at),
+                    'rarity': rarity
+                }
+                for name, description, icon, rarity, earned_at in earned[:RECENT_ACHIEVEMENTS]
+            ]
+        },
+        'weekly_chart': weekly_chart
+    }
+
+
+def dashboard_version(student_id: int) -> int:
+    """Versão atual dos dados de dashboard do estudante (0 se nunca houve escrita)"""
+    version = db.session.query(DashboardVersion.version)\
+        .filter(DashboardVersion.student_id == student_id).scalar()
+    return version or 0
+
+
+def bump_dashboard_version(student_id: int) -> None:
+    """
+    Marca os dados de dashboard do estudante como alterados (sem commit: vai
+    junto com a escrita) e descarta os caches deste processo.
+    """
+    bump_dashboard_versions([student_id])
+
+
+def bump_dashboard_versions(student_ids: List[int]) -> None:
+    """
+    bump_dashboard_version para vários estudantes (ex.: fan_out de
+    notificações): um UPDATE e, para quem ainda não tem versão, um INSERT
+    multi-linha.
+    """
+    student_ids = list(dict.fromkeys(student_ids))
+    if not student_ids:
+        return
+    statement = update(DashboardVersion).where(DashboardVersion.student_id.in_(student_ids))\
+        .values(version=DashboardVersion.version + 1).execution_options(synchronize_session=False)
+    if db.session.execute(statement).rowcount < len(student_ids):
+        existing = {
+            student_id for (student_id,) in db.session.query(DashboardVersion.student_id)
+            .filter(DashboardVersion.student_id.in_(student_ids))
+        }
+        missing = [student_id for student_id in student_ids if student_id not in existing]
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(DashboardVersion),
+                                   [{'student_id': student_id, 'version': 1} for student_id in missing])
+        except IntegrityError:
+            # Outra transação criou alguma das linhas no meio do caminho: uma a uma
+            for student_id in missing:
+                single = update(DashboardVersion).where(DashboardVersion.student_id == student_id)\
+                    .values(version=DashboardVersion.version + 1).execution_options(synchronize_session=False)
+                if db.session.execute(single).rowcount:
+                    continue
+                try:
+                    with db.session.begin_nested():
+                        db.session.add(DashboardVersion(student_id=student_id, version=1))
+                except IntegrityError:
+                    db.session.execute(single)
+    for student_id in student_ids:
+        invalidate_student_dashboard(student_id)
+
+
+def cached_for_version(cache: TTLCache, student_id: int, version: int, loader):
+    """Valor em cache se foi gerado na versão atual; senão recalcula com `loader()`"""
+    entry = cache.get(student_id)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    value = loader()
+    if value is not None:
+        cache.set(student_id, (version, value))
+    return value
+
+
+def get_student_dashboard(student_id: int) -> Optional[Dict]:
+    """Dashboard do estudante via cache (estudantes inexistentes não são cacheados)"""
+    return cached_for_version(_dashboard_cache, student_id, dashboard_version(student_id),
+                              lambda: build_student_dashboard(student_id))
+
+
+# Caches indexados por student_id invalidados junto com o dashboard
+_student_caches = [_dashboard_cache]
+
+
+def register_student_cache(cache: TTLCache) -> TTLCache:
+    """Inclui um cache por estudante na invalidação de `invalidate_student_dashboard`"""
+    _student_caches.append(cache)
+    return cache
+
+
+def invalidate_student_dashboard(student_id: int) -> None:
+    """Descarta os caches do estudante neste processo (os demais conferem a versão)"""
+    for cache in _student_caches:
+        cache.invalidate(student_id)
@@ -0,0 +1,143 @@
+"""
+Endpoint composto do dashboard (`/dashboard/bootstrap`).
+
+Reúne em uma requisição as seções que o SPA carrega ao abrir o dashboard.
+As seções independentes rodam em paralelo em um pool de threads
+compartilhado (cada uma com o seu app context e, portanto, a sua sessão
+do banco) e cada uma tem o seu cache e os seus metadados, de forma que o
+cliente pode atualizar só uma parte com `?sections=`.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional
+
+from flask import current_app
+
+from src.cache import TTLCache
+from src.models.gamification import ActivityLog, GamificationEngine
+from src.services.dashboard import (
+    QUICK_ACTIONS, build_student_dashboard, dashboard_version, register_student_cache
+)
+from src.services.notifications import list_notifications, unread_count
+from src.services.problem_of_day import get_todays_problem, utc_today
+
+SECTION_WORKERS = int(os.environ.get('DASHBOARD_SECTION_WORKERS', '4'))
+RECENT_ACTIVITIES = 10
+
+
+@dataclass
+class Section:
+    """Seção do dashboard: `loader(student_id)` + cache próprio (por dia, se `daily`)"""
+    name: str
+    loader: Callable[[int], object]
+    ttl_seconds: float
+    per_student: bool = True
+    daily: bool = False
+
+    def __post_init__(self):
+        self.cache = TTLCache(ttl_seconds=self.ttl_seconds, maxsize=5000 if self.per_student else 1)
+        if self.per_student:
+            register_student_cache(self.cache)
+
+    def cache_key(self, student_id: int):
+        key = student_id if self.per_student else self.name
+        return (utc_today(), key) if self.daily else key
+
+
+def _recent_activities(student_id: int):
+    return [
+        activity.to_dict()
+        for activity in ActivityLog.query.filter_by(student_id=student_id)
+        .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+        .limit(RECENT_ACTIVITIES)
+    ]
+
+
+def _notifications(student_id: int):
+    items, next_cursor = list_notifications(student_id)
+    return {'items': items, 'unread_count': unread_count(student_id), 'next_cursor': next_cursor}
+
+
+SECTIONS = {
+    section.name: section
+    for section in (
+        Section('stats', build_student_dashboard, ttl_seconds=300),
+        Section('progress', GamificationEngine.get_student_summary, ttl_seconds=300),
+        Section('activities', _recent_activities, ttl_seconds=300),
+        Section('notifications', _notifications, ttl_seconds=60),
+        # O problema atribuído ao estudante (ou o global) muda à meia-noite
+        Section('problem_of_day', get_todays_problem, ttl_seconds=300, daily=True),
+        Section('quick_actions', lambda student_id: QUICK_ACTIONS, ttl_seconds=3600, per_student=False),
+    )
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Pool criado sob demanda (depois do fork, nunca no processo mestre)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=SECTION_WORKERS,
+                                               thread_name_prefix='dashboard-section')
+    return _executor
+
+
+def _load_section(app, section: Section, student_id: int, version: int) -> Dict:
+    started = time.perf_counter()
+    key = section.cache_key(student_id)
+    entry = section.cache.get(key)
+    # Seções por estudante só valem na versão atual dos dados dele (ver dashboard_version)
+    cached = entry is not None and (not section.per_student or entry['version'] == version)
+
+    if not cached:
+        with app.app_context():
+            entry = {'data': section.loader(student_id), 'generated_at': datetime.utcnow().isoformat(),
+                     'version': version}
+        section.cache.set(key, entry)
+
+    return {
+        'data': entry['data'],
+        'cached': cached,
+        'generated_at': entry['generated_at'],
+        'ttl_seconds': section.ttl_seconds,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)
+    }
+
+
+def invalidate_section(name: str, student_id: int) -> None:
+    """Descarta o cache de uma seção para o estudante (ex.: após marcar notificações como lidas)"""
+    section = SECTIONS[name]
+    section.cache.invalidate(section.cache_key(student_id))
+
+
+def load_dashboard_sections(student_id: int, names: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+    """Carrega as seções pedidas (todas por padrão) em paralelo; falhas ficam na própria seção"""
+    names = list(names) if names else list(SECTIONS)
+    unknown = [name for name in names if name not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Seções inválidas: {', '.join(unknown)}")
+
+    app = current_app._get_current_object()
+    version = dashboard_version(student_id)
+    executor = _get_executor()
+    futures = {
+        name: executor.submit(_load_section, app, SECTIONS[name], student_id, version)
+        for name in names
+    }
+
+    sections = {}
+    for name, future in futures.items():
+        try:
+            sections[name] = future.result()
+        except Exception as e:
+            sections[name] = {'data': None, 'error': str(e), 'cached': False,
+                              'ttl_seconds': SECTIONS[name].ttl_seconds}
+    return sections
@@ -0,0 +1,291 @@
+"""
+Fila de correção das submissões do problema do dia.
+
+A fila é a própria tabela problem_submissions: a submissão é gravada com
+status 'pending' e a requisição responde na hora; threads de correção em
+cada worker (ou o comando `flask curio grade-pending`, em um processo à
+parte) reivindicam as pendentes e gravam resultado e feedback.
+
+    pending -> grading -> graded
+                       -> pending (erro, nova tentativa) -> ... -> failed
+
+A reivindicação é um UPDATE condicional (status = 'pending'), então vários
+processos podem consumir a mesma fila sem corrigir duas vezes a mesma
+submissão. Submissões presas em 'grading' (worker morto no meio) voltam a
+ser reivindicáveis depois de GRADING_CLAIM_TIMEOUT segundos; por isso o
+resultado também é gravado por um UPDATE condicional à própria
+reivindicação (claimed_at), e as estatísticas só contam quem gravou.
+
+Por padrão a correção continua síncrona (o frontend espera o resultado na
+resposta); GRADING_MODE=queue, ou `"async": true` no corpo da submissão,
+usa a fila.
+"""
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, or_, update
+
+from src.models.user import db
+from src.models.problem_of_day import ProblemSubmission
+from src.services.answer_rubric import evaluate_answer, feedback_for
+from src.services.dashboard import bump_dashboard_version
+from src.services.problem_stats import record_submission
+
+GRADING_MODE = os.environ.get('GRADING_MODE', 'inline')
+GRADING_WORKERS = int(os.environ.get('GRADING_WORKERS', '2'))
+GRADING_BATCH_SIZE = int(os.environ.get('GRADING_BATCH_SIZE', '20'))
+GRADING_POLL_INTERVAL = float(os.environ.get('GRADING_POLL_INTERVAL', '2'))
+GRADING_CLAIM_TIMEOUT = int(os.environ.get('GRADING_CLAIM_TIMEOUT', '300'))
+GRADING_MAX_ATTEMPTS = 3
+
+# Janela das métricas de latência (submissões corrigidas pela fila)
+LATENCY_SAMPLE_SIZE = 500
+
+# Sinaliza submissões novas para as threads de correção deste processo
+_wake = threading.Event()
+
+
+def queue_enabled(requested: Optional[bool] = None) -> bool:
+    """Se a submissão deve ir para a fila (pedido explícito ou GRADING_MODE=queue)"""
+    if requested is not None:
+        return bool(requested)
+    return GRADING_MODE == 'queue'
+
+
+def _owned(submission_id: int, claimed_at: datetime):
+    """Condição de que a submissão ainda está na reivindicação feita em `claimed_at`"""
+    return (
+        (ProblemSubmission.id == submission_id)
+        & (ProblemSubmission.status == 'grading')
+        & (ProblemSubmission.claimed_at == claimed_at)
+    )
+
+
+def grade(submission: ProblemSubmission, claimed_at: datetime) -> bool:
+    """
+    Avalia a submissão e grava resultado e feedback se ela ainda é desta
+    reivindicação; só então soma nas estatísticas (sem commit). Retorna
+    False se outro processo a reivindicou de novo (claim vencido) no meio.
+    """
+    evaluation = evaluate_answer(submission.problem_id, submission.answer)
+    result = db.session.execute(
+        update(ProblemSubmission)
+        .where(_owned(submission.id, claimed_at))
+        .values(
+            is_correct=evaluation.is_correct,
+            confidence=evaluation.confidence,
+            feedback=feedback_for(evaluation),
+            status='graded',
+            graded_at=datetime.utcnow(),
+            grading_error=None
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        return False
+    record_submission(submission.problem_id, evaluation.is_correct, submission.time_spent, evaluation.confidence)
+    bump_dashboard_version(submission.student_id)
+    return True
+
+
+def enqueue_submission(student_id: int, problem_id: int, answer: str, time_spent: int = 0,
+                       idempotency_key: Optional[str] = None) -> ProblemSubmission:
+    """Grava a submissão como pendente e acorda as threads de correção"""
+    submission = ProblemSubmission(
+        student_id=student_id,
+        problem_id=problem_id,
+        answer=answer,
+        time_spent=time_spent,
+        status='pending',
+        attempts=0,
+        idempotency_key=idempotency_key
+    )
+    try:
+        db.session.add(submission)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    _wake.set()
+    return submission
+
+
+def claim_pending(limit: int = GRADING_BATCH_SIZE, now: Optional[datetime] = None) -> List[int]:
+    """Reivindica até `limit` submissões pendentes (ou abandonadas); retorna os ids"""
+    now = now or datetime.utcnow()
+    stale = now - timedelta(seconds=GRADING_CLAIM_TIMEOUT)
+    claimable = or_(
+        ProblemSubmission.status == 'pending',
+        (ProblemSubmission.status == 'grading') & (ProblemSubmission.claimed_at < stale)
+    )
+    candidates = [
+        submission_id for (submission_id,) in db.session.query(ProblemSubmission.id)
+        .filter(claimable).order_by(ProblemSubmission.id).limit(limit)
+    ]
+
+    claimed = []
+    for submission_id in candidates:
+        result = db.session.execute(
+            update(ProblemSubmission)
+            .where(ProblemSubmission.id == submission_id, claimable)
+            .values(status='grading', claimed_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            claimed.append(submission_id)
+    db.session.commit()
+    return claimed
+
+
+def process_pending(limit: int = GRADING_BATCH_SIZE) -> Dict:
+    """Corrige um lote da fila; retorna quantas foram corrigidas e quantas falharam"""
+    graded = failed = 0
+    claimed_at = datetime.utcnow()
+    for submission_id in claim_pending(limit, now=claimed_at):
+        submission = db.session.get(ProblemSubmission, submission_id)
+        if submission is None:
+            continue
+        try:
+            if grade(submission, claimed_at):
+                db.session.commit()
+                graded += 1
+            else:
+                db.session.rollback()
+                print(f"⚠️  Submissão {submission_id} reivindicada por outro processo, descartando a correção")
+        except Exception as e:
+            db.session.rollback()
+            submission = db.session.get(ProblemSubmission, submission_id)
+            attempts = (submission.attempts or 0) + 1
+            result = db.session.execute(
+                update(ProblemSubmission)
+                .where(_owned(submission_id, claimed_at))
+                .values(
+                    attempts=attempts,
+                    grading_error=str(e),
+                    status='failed' if attempts >= GRADING_MAX_ATTEMPTS else 'pending'
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            if result.rowcount == 1:
+                failed += 1
+                print(f"⚠️  Erro ao corrigir a submissão {submission_id}: {e}")
+    return {'graded': graded, 'failed': failed}
+
+
+def drain(limit: int = GRADING_BATCH_SIZE) -> Dict:
+    """Corrige lotes até a fila esvaziar (usado pelo comando grade-pending)"""
+    totals = {'graded': 0, 'failed': 0}
+    while True:
+        result = process_pending(limit)
+        totals['graded'] += result['graded']
+        totals['failed'] += result['failed']
+        if not result['graded'] and not result['failed']:
+            return totals
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def queue_metrics(now: Optional[datetime] = None) -> Dict:
+    """Profundidade da fila e latência de correção (envio -> corrigida) das últimas submissões"""
+    now = now or datetime.utcnow()
+    depth = dict(
+        db.session.query(ProblemSubmission.status, func.count(ProblemSubmission.id))
+        .filter(ProblemSubmission.status.in_(('pending', 'grading', 'failed')))
+        .group_by(ProblemSubmission.status).all()
+    )
+    oldest = db.session.query(func.min(ProblemSubmission.submitted_at))\
+        .filter(ProblemSubmission.status == 'pending').scalar()
+
+    rows = db.session.query(ProblemSubmission.submitted_at, ProblemSubmission.graded_at)\
+        .filter(ProblemSubmission.status == 'graded', ProblemSubmission.claimed_at.isnot(None))\
+        .order_by(ProblemSubmission.id.desc()).limit(LATENCY_SAMPLE_SIZE).all()
+    latencies = [
+        (graded_at - submitted_at).total_seconds()
+        for submitted_at, graded_at in rows if submitted_at and graded_at
+    ]
+
+    def rounded(value):
+        return round(value, 3) if value is not None else None
+
+    return {
+        'mode': GRADING_MODE,
+        'workers': len(_worker.threads) if _worker is not None else 0,
+        'pending': depth.get('pending', 0),
+        'grading': depth.get('grading', 0),
+        'failed': depth.get('failed', 0),
+        'oldest_pending_seconds': rounded((now - oldest).total_seconds()) if oldest else None,
+        'latency_seconds': {
+            'samples': len(latencies),
+            'avg': rounded(sum(latencies) / len(latencies)) if latencies else None,
+            'p50': rounded(_percentile(latencies, 0.5)),
+            'p95': rounded(_percentile(latencies, 0.95)),
+            'max': rounded(max(latencies)) if latencies else None
+        }
+    }
+
+
+class GradingWorker:
+    """Threads de correção de um processo; dormem até uma submissão nova ou o intervalo de polling"""
+
+    def __init__(self, app, workers: int = GRADING_WORKERS):
+        self.app = app
+        self._stop = threading.Event()
+        self.threads = [
+            threading.Thread(target=self._run, name=f'grading-{i}', daemon=True)
+            for i in range(max(1, workers))
+        ]
+
+    def start(self) -> 'GradingWorker':
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        _wake.set()
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with self.app.app_context():
+                    result = process_pending()
+                    db.session.remove()
+            except Exception as e:
+                print(f"⚠️  Erro na fila de correção: {e}")
+                result = {'graded': 0, 'failed': 0}
+            if not result['graded'] and not result['failed']:
+                _wake.wait(GRADING_POLL_INTERVAL)
+                _wake.clear()
+
+
+# Threads do processo atual (iniciadas sob demanda, depois do fork)
+_worker: Optional[GradingWorker] = None
+_worker_lock = threading.Lock()
+
+
+def start_grading_workers(app, workers: int = GRADING_WORKERS) -> GradingWorker:
+    """Inicia as threads de correção deste processo (uma vez)"""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = GradingWorker(app, workers).start()
+    return _worker
+
+
+def stop_grading_workers() -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is not None:
+            _worker.stop()
+            _worker = None
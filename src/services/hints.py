@@ -0,0 +1,120 @@
+"""
+Escada de dicas do problema do dia.
+
+As dicas de cada problema (JSON em ProblemOfDay.solution_hints) são lidas
+e convertidas uma vez em uma tupla ordenada de strings. Com o preload do
+gunicorn as escadas de todos os problemas ativos são montadas no processo
+mestre (ver src/prefork.py) e compartilhadas pelos workers; problemas
+novos entram sob demanda e cada escada é relida após HINT_LADDER_TTL.
+Servir uma dica é só um acesso ao dicionário em memória.
+
+O progresso de cada estudante (quantas dicas já abriu) fica em
+hint_reveals: cada pedido com student_id revela a próxima dica da escada.
+"""
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from src.models.user import db
+from src.models.problem_of_day import HintReveal, ProblemOfDay
+
+HINT_LADDER_TTL = 3600
+
+DEFAULT_HINT = "Pense no problema passo a passo. Que informações você tem disponíveis?"
+
+# problem_id -> (carregada em, dicas em ordem)
+_ladders: Dict[int, Tuple[float, Tuple[str, ...]]] = {}
+
+
+def parse_hints(solution_hints: Optional[str]) -> Tuple[str, ...]:
+    """Dicas em ordem a partir do JSON (lista de strings); texto solto vira uma dica"""
+    if not solution_hints:
+        return ()
+    try:
+        hints = json.loads(solution_hints)
+    except (TypeError, ValueError):
+        hints = [solution_hints]
+    if isinstance(hints, str):
+        hints = [hints]
+    return tuple(str(hint).strip() for hint in hints if str(hint).strip())
+
+
+def load_hint_ladders() -> int:
+    """Monta as escadas de todos os problemas ativos (uma consulta); retorna quantas"""
+    now = time.monotonic()
+    rows = db.session.query(ProblemOfDay.id, ProblemOfDay.solution_hints)\
+        .filter(ProblemOfDay.is_active.is_(True)).all()
+    for problem_id, solution_hints in rows:
+        _ladders[problem_id] = (now, parse_hints(solution_hints))
+    return len(rows)
+
+
+def get_hint_ladder(problem_id: int) -> Optional[Tuple[str, ...]]:
+    """Dicas do problema em ordem; None se o problema não existe"""
+    entry = _ladders.get(problem_id)
+    if entry is not None and time.monotonic() - entry[0] < HINT_LADDER_TTL:
+        return entry[1]
+
+    row = db.session.query(ProblemOfDay.solution_hints).filter(ProblemOfDay.id == problem_id).first()
+    if row is None:
+        return None
+    ladder = parse_hints(row.solution_hints)
+    _ladders[problem_id] = (time.monotonic(), ladder)
+    return ladder
+
+
+def invalidate_hint_ladder(problem_id: Optional[int] = None) -> None:
+    """Descarta a escada de um problema (ou todas) após editar as dicas"""
+    if problem_id is None:
+        _ladders.clear()
+    else:
+        _ladders.pop(problem_id, None)
+
+
+def hint_payload(ladder: Tuple[str, ...], revealed: int) -> Dict:
+    """Dica atual e as já reveladas, para a resposta da API"""
+    total = len(ladder)
+    if not total:
+        return {'hint': DEFAULT_HINT, 'level': 0, 'total_hints': 0, 'remaining': 0, 'revealed_hints': []}
+    revealed = max(1, min(revealed, total))
+    return {
+        'hint': ladder[revealed - 1],
+        'level': revealed,
+        'total_hints': total,
+        'remaining': total - revealed,
+        'revealed_hints': list(ladder[:revealed])
+    }
+
+
+def reveal_next_hint(student_id: int, problem_id: int, total: int) -> int:
+    """Avança um degrau da escada do estudante (até `total`); retorna quantas dicas ele já abriu"""
+    # UPDATE atômico: pedidos simultâneos do mesmo estudante não perdem degraus nem passam de `total`
+    statement = update(HintReveal).where(
+        HintReveal.student_id == student_id,
+        HintReveal.problem_id == problem_id,
+        HintReveal.revealed < total
+    ).values(revealed=HintReveal.revealed + 1).execution_options(synchronize_session=False)
+    try:
+        if not db.session.execute(statement).rowcount \
+                and db.session.get(HintReveal, (student_id, problem_id)) is None:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(HintReveal(student_id=student_id, problem_id=problem_id, revealed=min(1, total)))
+            except IntegrityError:
+                # Pedido simultâneo do mesmo estudante criou a linha
+                db.session.execute(statement)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return revealed_count(student_id, problem_id)
+
+
+def revealed_count(student_id: int, problem_id: int) -> int:
+    return db.session.query(HintReveal.revealed).filter(
+        HintReveal.student_id == student_id,
+        HintReveal.problem_id == problem_id
+    ).scalar() or 0
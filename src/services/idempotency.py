@@ -0,0 +1,83 @@
+"""
+Deduplicação de submissões do problema do dia.
+
+Redes instáveis fazem o frontend reenviar a mesma resposta. Cada
+submissão recebe uma chave de idempotência:
+
+- com o header `Idempotency-Key`, um hash de (estudante, problema, chave),
+  válido por IDEMPOTENCY_KEY_TTL;
+- sem o header, um hash de (estudante, problema, resposta normalizada),
+  válido por SUBMISSION_DEDUP_WINDOW (reenvios logo em seguida).
+
+A chave tem índice único em problem_submissions: a submissão é inserida
+direto e, se a chave já existe (inclusive um reenvio simultâneo em outro
+worker), o INSERT falha e a linha gravada é devolvida, sem corrigir de
+novo. Uma chave fora da janela é liberada (`release_key`) para a nova
+submissão. O corpo das respostas corrigidas também fica em um cache curto
+por processo, que evita até a tentativa de INSERT.
+"""
+import hashlib
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import update
+
+from src.cache import TTLCache
+from src.models.user import db
+from src.models.problem_of_day import ProblemSubmission
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_KEY_TTL = int(os.environ.get('IDEMPOTENCY_KEY_TTL', '86400'))
+SUBMISSION_DEDUP_WINDOW = int(os.environ.get('SUBMISSION_DEDUP_WINDOW', '600'))
+
+_responses = TTLCache(ttl_seconds=SUBMISSION_DEDUP_WINDOW, maxsize=4096)
+
+
+def submission_key(student_id: int, problem_id: int, answer: str,
+                   client_key: Optional[str] = None) -> Tuple[str, int]:
+    """Chave de idempotência da submissão e a janela (segundos) em que ela vale"""
+    if client_key:
+        material, window = f'key:{student_id}:{problem_id}:{client_key.strip()}', IDEMPOTENCY_KEY_TTL
+    else:
+        normalized = ' '.join(answer.split())
+        material, window = f'answer:{student_id}:{problem_id}:{normalized}', SUBMISSION_DEDUP_WINDOW
+    return hashlib.sha256(material.encode('utf-8')).hexdigest(), window
+
+
+def within_window(submission: ProblemSubmission, window: int, now: Optional[datetime] = None) -> bool:
+    since = (now or datetime.utcnow()) - timedelta(seconds=window)
+    return submission.submitted_at is not None and submission.submitted_at >= since
+
+
+def find_submission(key: str, window: int, now: Optional[datetime] = None) -> Optional[ProblemSubmission]:
+    """Submissão com a chave, se ainda dentro da janela (busca pelo índice único)"""
+    submission = ProblemSubmission.query.filter(ProblemSubmission.idempotency_key == key).first()
+    if submission is None or not within_window(submission, window, now):
+        return None
+    return submission
+
+
+def release_key(key: str) -> None:
+    """Tira a chave (vencida) da submissão antiga para que uma nova possa usá-la"""
+    try:
+        db.session.execute(
+            update(ProblemSubmission)
+            .where(ProblemSubmission.idempotency_key == key)
+            .values(idempotency_key=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def remember_response(key: str, body: Dict, window: int) -> None:
+    """Guarda o corpo da resposta corrigida para repetições neste processo"""
+    _responses.set(key, body, ttl_seconds=min(window, SUBMISSION_DEDUP_WINDOW))
+
+
+def remembered_response(key: str) -> Optional[Dict]:
+    """Corpo guardado por `remember_response` (None se não está no cache deste processo)"""
+    return _responses.get(key)
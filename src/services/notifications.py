@@ -0,0 +1,224 @@
+"""
+Notificações dos estudantes.
+
+- Escritas mantêm NotificationCounter.unread_count na mesma transação
+  (UPDATE ... SET unread_count = unread_count + n), então o badge de não
+  lidas é uma leitura por chave primária.
+- Leituras são paginadas por keyset (id decrescente, cursor `before`).
+- fan_out cria o mesmo aviso para muitos estudantes em lotes: um INSERT
+  multi-linha de notificações e um UPDATE de contadores por lote (mais um
+  INSERT multi-linha para os contadores que ainda não existem).
+- Toda escrita avança a versão do dashboard dos estudantes afetados
+  (src/services/dashboard.py), para que a seção de notificações de
+  /dashboard/bootstrap em cache seja refeita em todos os workers.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+
+from src.models.user import db
+from src.models.student import Student
+from src.models.gamification import StudyStreak
+from src.models.notification import Notification, NotificationCounter
+from src.services.dashboard import bump_dashboard_version, bump_dashboard_versions
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+FAN_OUT_BATCH_SIZE = 1000
+
+# Ícone e cor padrão por tipo (usados pelo frontend)
+NOTIFICATION_STYLES = {
+    'achievement': ('trophy', 'yellow'),
+    'reminder': ('clock', 'blue'),
+    'problem_of_day': ('target', 'green'),
+    'tip': ('lightbulb', 'green'),
+}
+
+
+def _increment_counters(student_ids: List[int], amount: int = 1) -> None:
+    """Soma `amount` aos contadores, criando os que ainda não existem"""
+    result = db.session.execute(
+        update(NotificationCounter)
+        .where(NotificationCounter.student_id.in_(student_ids))
+        .values(unread_count=NotificationCounter.unread_count + amount, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == len(student_ids):
+        return
+
+    existing = {
+        student_id for (student_id,) in db.session.query(NotificationCounter.student_id)
+        .filter(NotificationCounter.student_id.in_(student_ids))
+    }
+    missing = [student_id for student_id in dict.fromkeys(student_ids) if student_id not in existing]
+    now = datetime.utcnow()
+    try:
+        # Primeiro fan_out para uma turma: todos os contadores novos em um INSERT
+        with db.session.begin_nested():
+            db.session.execute(insert(NotificationCounter), [
+                {'student_id': student_id, 'unread_count': amount, 'updated_at': now} for student_id in missing
+            ])
+        return
+    except IntegrityError:
+        pass
+
+    # Outra transação criou algum dos contadores no meio do caminho: um a um
+    for student_id in missing:
+        statement = update(NotificationCounter)\
+            .where(NotificationCounter.student_id == student_id)\
+            .values(unread_count=NotificationCounter.unread_count + amount)\
+            .execution_options(synchronize_session=False)
+        if db.session.execute(statement).rowcount:
+            continue
+        try:
+            with db.session.begin_nested():
+                db.session.add(NotificationCounter(student_id=student_id, unread_count=amount))
+        except IntegrityError:
+            db.session.execute(statement)
+
+
+def _row(student_id: int, type: str, title: str, message: str,
+         icon: Optional[str], color: Optional[str], created_at: datetime) -> Dict:
+    default_icon, default_color = NOTIFICATION_STYLES.get(type, ('bell', 'blue'))
+    return {
+        'student_id': student_id,
+        'type': type,
+        'title': title,
+        'message': message,
+        'icon': icon or default_icon,
+        'color': color or default_color,
+        'is_read': False,
+        'created_at': created_at,
+    }
+
+
+def create_notification(student_id: int, type: str, title: str, message: str,
+                        icon: Optional[str] = None, color: Optional[str] = None,
+                        commit: bool = True) -> Notification:
+    """Cria uma notificação e incrementa o contador do estudante"""
+    notification = Notification(**_row(student_id, type, title, message, icon, color, datetime.utcnow()))
+    db.session.add(notification)
+    _increment_counters([student_id])
+    bump_dashboard_version(student_id)
+    if commit:
+        db.session.commit()
+    return notification
+
+
+def fan_out(student_ids: Iterable[int], type: str, title: str, message: str,
+            icon: Optional[str] = None, color: Optional[str] = None,
+            batch_size: int = FAN_OUT_BATCH_SIZE) -> int:
+    """Cria a mesma notificação para vários estudantes, com um commit por lote"""
+    created = 0
+    batch = []
+
+    def flush_batch():
+        now = datetime.utcnow()
+        db.session.execute(insert(Notification), [
+            _row(student_id, type, title, message, icon, color, now) for student_id in batch
+        ])
+        _increment_counters(batch)
+        bump_dashboard_versions(batch)
+        db.session.commit()
+
+    try:
+        for student_id in student_ids:
+            batch.append(student_id)
+            if len(batch) >= batch_size:
+                flush_batch()
+                created += len(batch)
+                batch = []
+        if batch:
+            flush_batch()
+            created += len(batch)
+    except Exception:
+        db.session.rollback()
+        raise
+    return created
+
+
+def unread_count(student_id: int) -> int:
+    count = db.session.query(NotificationCounter.unread_count)\
+        .filter(NotificationCounter.student_id == student_id).scalar()
+    return max(count or 0, 0)
+
+
+def list_notifications(student_id: int, before: Optional[int] = None,
+                       limit: int = DEFAULT_PAGE_SIZE, unread_only: bool = False) -> Tuple[List[Dict], Optional[int]]:
+    """Página de notificações (mais recentes primeiro) e o cursor da próxima página"""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = Notification.query.filter(Notification.student_id == student_id)
+    if before is not None:
+        query = query.filter(Notification.id < before)
+    if unread_only:
+        query = query.filter(Notification.is_read.is_(False))
+
+    rows = query.order_by(Notification.id.desc()).limit(limit + 1).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return [row.to_dict() for row in rows[:limit]], next_cursor
+
+
+def mark_read(student_id: int, notification_ids: Optional[List[int]] = None) -> int:
+    """Marca como lidas (todas, ou só `notification_ids`); retorna quantas mudaram"""
+    statement = update(Notification).where(
+        Notification.student_id == student_id,
+        Notification.is_read.is_(False)
+    )
+    if notification_ids is not None:
+        statement = statement.where(Notification.id.in_(notification_ids))
+
+    try:
+        changed = db.session.execute(
+            statement.values(is_read=True, read_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if changed:
+            db.session.execute(
+                update(NotificationCounter)
+                .where(NotificationCounter.student_id == student_id)
+                .values(unread_count=NotificationCounter.unread_count - changed, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            bump_dashboard_version(student_id)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return changed
+
+
+def students_without_study_today(today=None, chunk_size: int = FAN_OUT_BATCH_SIZE):
+    """
+    IDs dos estudantes que ainda não estudaram hoje (lembretes de sequência).
+    Percorre por keyset em blocos, para que o fan_out possa comitar entre eles.
+    """
+    today = today or datetime.utcnow().date()
+    last_id = 0
+    while True:
+        ids = [
+            student_id for (student_id,) in db.session.query(Student.id)
+            .outerjoin(StudyStreak, StudyStreak.student_id == Student.id)
+            .filter(Student.id > last_id)
+            .filter((StudyStreak.last_study_date.is_(None)) | (StudyStreak.last_study_date < today))
+            .distinct().order_by(Student.id).limit(chunk_size)
+        ]
+        if not ids:
+            return
+        yield from ids
+        last_id = ids[-1]
+
+
+def all_student_ids(chunk_size: int = FAN_OUT_BATCH_SIZE):
+    """Todos os IDs de estudantes, em blocos por keyset"""
+    last_id = 0
+    while True:
+        ids = [
+            student_id for (student_id,) in db.session.query(Student.id)
+            .filter(Student.id > last_id).order_by(Student.id).limit(chunk_size)
+        ]
+        if not ids:
+            return
+        yield from ids
+        last_id = ids[-1]
@@ -0,0 +1,367 @@
+"""
+Agenda do problema do dia.
+
+Os problemas são atribuídos a datas com antecedência na tabela
+problem_schedule, e "o problema de hoje" é uma busca indexada pela data:
+a mesma resposta em todos os workers, sem depender do RNG global.
+
+A escolha é determinística e equilibrada: a cada dia entra a combinação
+categoria x dificuldade menos usada até então (evitando repetir a
+categoria do dia anterior quando há alternativa) e, dentro dela, o
+problema usado há mais tempo.
+
+Atribuições personalizadas (assign_daily_problems): um job diário escolhe
+um problema por faixa de série (dificuldades adequadas) e troca, por
+estudante, os que ele já resolveu ou recebeu recentemente. As atribuições
+são gravadas em lote em daily_problem_assignments, e
+`/problems/today?student_id=` vira uma busca pela chave (data, estudante).
+
+get_todays_problem monta a resposta de `/problems/today`: a do problema
+global fica em cache por dia; a de um estudante é a busca da atribuição.
+"Hoje" é sempre a data em UTC (utc_today), em todos os workers.
+"""
+import json
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, insert
+from sqlalchemy.exc import IntegrityError
+
+from src.cache import TTLCache
+from src.models.user import db
+from src.models.student import Student
+from src.models.problem_of_day import (
+    DailyProblemAssignment, ProblemOfDay, ProblemSchedule, ProblemSubmission
+)
+
+# Quantos dias agendar de uma vez quando a data pedida ainda não tem problema
+SCHEDULE_AHEAD_DAYS = 30
+
+# Faixas de série: (nome, série mínima, série máxima, dificuldades adequadas)
+GRADE_BANDS = (
+    ('early', 0, 3, ('beginner',)),
+    ('middle', 4, 6, ('beginner', 'intermediate')),
+    ('upper', 7, 12, ('intermediate', 'advanced')),
+)
+
+# Problemas atribuídos nos últimos N dias não voltam para o mesmo estudante
+REPEAT_WINDOW_DAYS = 30
+ASSIGNMENT_CHUNK_SIZE = 1000
+
+TODAY_CACHE_TTL = 3600
+
+# Tempo estimado base (minutos) e descrição de cada dificuldade
+DIFFICULTY_INFO = {
+    'beginner': (5, '🟢 Fácil - Conceitos básicos'),
+    'intermediate': (10, '🟡 Intermediário - Requer análise'),
+    'advanced': (20, '🔴 Difícil - Pensamento crítico'),
+}
+
+# Problema usado quando o banco ainda não tem nenhum cadastrado
+SAMPLE_PROBLEM = {
+    'title': "Orçamento Familiar Inteligente",
+    'description': """
+        A família Silva tem uma renda mensal de R$ 4.500. Eles querem organizar suas finanças de forma inteligente.
+        
+        📊 Informações atuais:
+        • Gastos fixos (aluguel, contas): R$ 2.200
+        • Alimentação: R$ 800
+        • Transporte: R$ 400
+        • Lazer: R$ 300
+        
+        🎯 Objetivos:
+        • Economizar 20% da renda para emergências
+        • Juntar R$ 3.600 para uma viagem em 8 meses
+        
+        💡 DESAFIO: Crie um plano financeiro completo. É possível atingir ambas as metas? Se não, que ajustes você sugere?
+        """,
+    'category': "personal_finance",
+    'difficulty': "intermediate",
+    'expected_answer': "Análise financeira com sugestões de ajustes no orçamento",
+    'solution_hints': json.dumps([
+        "💰 Calcule quanto sobra: R$ 4.500 - R$ 3.700 = R$ 800",
+        "🎯 Meta emergência: 20% de R$ 4.500 = R$ 900/mês",
+        "✈️ Meta viagem: R$ 3.600 ÷ 8 meses = R$ 450/mês",
+        "📊 Total necessário: R$ 900 + R$ 450 = R$ 1.350/mês",
+        "⚠️ Déficit: R$ 1.350 - R$ 800 = R$ 550/mês",
+        "🔧 Sugestão: Reduzir lazer para R$ 150 e otimizar outros gastos"
+    ]),
+    'resources': json.dumps([
+        "Calculadora de orçamento familiar",
+        "Dicas de economia doméstica",
+        "Planilha de controle financeiro"
+    ])
+}
+
+_today_cache = TTLCache(ttl_seconds=TODAY_CACHE_TTL, maxsize=8)
+
+
+def utc_today() -> date:
+    """Data de "hoje" do problema do dia: em UTC, como as demais datas gravadas"""
+    return datetime.utcnow().date()
+
+
+def _usage(before: date) -> Dict[int, tuple]:
+    """problem_id -> (vezes agendado, última data) considerando o histórico até `before`"""
+    return {
+        problem_id: (uses, last_date)
+        for problem_id, uses, last_date in db.session.query(
+            ProblemSchedule.problem_id,
+            func.count(ProblemSchedule.id),
+            func.max(ProblemSchedule.scheduled_date)
+        ).filter(ProblemSchedule.scheduled_date < before).group_by(ProblemSchedule.problem_id)
+    }
+
+
+def plan_schedule(problems: List[ProblemOfDay], dates: List[date],
+                  usage: Dict[int, tuple], previous_category: Optional[str] = None) -> Dict[date, int]:
+    """Distribui os problemas nas datas (função pura, sem acesso ao banco)"""
+    buckets = defaultdict(list)
+    for problem in problems:
+        buckets[(problem.category, problem.difficulty)].append(problem)
+
+    problem_uses = {p.id: usage.get(p.id, (0, None))[0] for p in problems}
+    last_used = {p.id: usage.get(p.id, (0, None))[1] or date.min for p in problems}
+    bucket_uses = {key: sum(problem_uses[p.id] for p in members) for key, members in buckets.items()}
+
+    # Em empate, categorias com mais combinações precisam de mais dias
+    category_buckets = defaultdict(int)
+    for category, _difficulty in buckets:
+        category_buckets[category] += 1
+
+    plan = {}
+    for day in dates:
+        candidates = sorted(buckets, key=lambda key: (bucket_uses[key], -category_buckets[key[0]], key))
+        different = [key for key in candidates if key[0] != previous_category]
+        bucket = (different or candidates)[0]
+
+        problem = min(buckets[bucket], key=lambda p: (problem_uses[p.id], last_used[p.id], p.id))
+        plan[day] = problem.id
+
+        problem_uses[problem.id] += 1
+        last_used[problem.id] = day
+        bucket_uses[bucket] += 1
+        previous_category = bucket[0]
+    return plan
+
+
+def schedule_problems(start: date, days: int = SCHEDULE_AHEAD_DAYS) -> int:
+    """Agenda as datas de [start, start + days) que ainda não têm problema; retorna quantas"""
+    end = start + timedelta(days=days)
+    taken = {
+        scheduled_date for (scheduled_date,) in db.session.query(ProblemSchedule.scheduled_date)
+        .filter(ProblemSchedule.scheduled_date >= start, ProblemSchedule.scheduled_date < end)
+    }
+    dates = [start + timedelta(days=i) for i in range(days) if start + timedelta(days=i) not in taken]
+    problems = ProblemOfDay.query.filter_by(is_active=True).order_by(ProblemOfDay.id).all()
+    if not dates or not problems:
+        return 0
+
+    previous = db.session.query(ProblemOfDay.category).join(
+        ProblemSchedule, ProblemSchedule.problem_id == ProblemOfDay.id
+    ).filter(ProblemSchedule.scheduled_date == dates[0] - timedelta(days=1)).scalar()
+
+    plan = plan_schedule(problems, dates, _usage(dates[0]), previous)
+    try:
+        db.session.add_all(ProblemSchedule(scheduled_date=day, problem_id=problem_id)
+                           for day, problem_id in plan.items())
+        db.session.commit()
+    except IntegrityError:
+        # Outro worker agendou as mesmas datas ao mesmo tempo: vale o que já foi gravado
+        db.session.rollback()
+        return 0
+    return len(plan)
+
+
+def get_scheduled_problem(day: date) -> Optional[ProblemOfDay]:
+    """Problema ativo agendado para a data (uma consulta indexada)"""
+    return db.session.query(ProblemOfDay).join(
+        ProblemSchedule, ProblemSchedule.problem_id == ProblemOfDay.id
+    ).filter(
+        ProblemSchedule.scheduled_date == day,
+        ProblemOfDay.is_active.is_(True)
+    ).first()
+
+
+def get_problem_for_date(day: Optional[date] = None) -> Optional[ProblemOfDay]:
+    """
+    Problema do dia; se a data ainda não foi agendada (ou o problema agendado
+    foi desativado depois), agenda de novo a partir dela. None se não há
+    problemas ativos.
+    """
+    day = day or utc_today()
+    problem = get_scheduled_problem(day)
+    if problem is None:
+        try:
+            # Agendamento de um problema desativado: a data volta a ficar livre
+            ProblemSchedule.query.filter_by(scheduled_date=day).delete(synchronize_session=False)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        schedule_problems(day)
+        problem = get_scheduled_problem(day)
+    return problem
+
+
+def grade_band(grade_level: Optional[str]) -> str:
+    """Faixa da série ('K', '5', '7º Ano'...); séries desconhecidas ficam em 'middle'"""
+    if grade_level and grade_level.strip().upper().startswith('K'):
+        return GRADE_BANDS[0][0]
+    match = re.match(r'\s*(\d+)', grade_level or '')
+    if match:
+        grade = int(match.group(1))
+        for name, low, high, _difficulties in GRADE_BANDS:
+            if low <= grade <= high:
+                return name
+    return 'middle'
+
+
+def _band_candidates(problems: List[ProblemOfDay]) -> Dict[str, List[int]]:
+    """IDs dos problemas de cada faixa (todos, se nenhum tem a dificuldade da faixa)"""
+    candidates = {}
+    for name, _low, _high, difficulties in GRADE_BANDS:
+        ids = [p.id for p in problems if p.difficulty in difficulties]
+        candidates[name] = ids or [p.id for p in problems]
+    return candidates
+
+
+def _choose(candidates: List[int], seen: set, day: date, student_id: int) -> int:
+    """Problema da faixa no dia; se o estudante já o viu, o próximo não visto na rotação"""
+    offset = day.toordinal() % len(candidates)
+    rotation = candidates[offset:] + candidates[:offset]
+    if rotation[0] not in seen:
+        return rotation[0]
+    unseen = [problem_id for problem_id in rotation if problem_id not in seen]
+    if not unseen:
+        return rotation[0]
+    # Espalha quem já viu o problema da faixa entre os demais, de forma estável
+    return unseen[student_id % len(unseen)]
+
+
+def assign_daily_problems(day: Optional[date] = None, chunk_size: int = ASSIGNMENT_CHUNK_SIZE) -> int:
+    """
+    Gera as atribuições do dia para todos os estudantes que ainda não têm
+    uma (idempotente). Um INSERT em lote e um commit por bloco de estudantes.
+    """
+    day = day or utc_today()
+    problems = ProblemOfDay.query.filter_by(is_active=True).order_by(ProblemOfDay.id).all()
+    if not problems:
+        return 0
+    candidates = _band_candidates(problems)
+    window_start = day - timedelta(days=REPEAT_WINDOW_DAYS)
+
+    created = 0
+    last_id = 0
+    try:
+        while True:
+            students = db.session.query(Student.id, Student.grade_level)\
+                .filter(Student.id > last_id).order_by(Student.id).limit(chunk_size).all()
+            if not students:
+                break
+            last_id = students[-1][0]
+            student_ids = [student_id for student_id, _grade in students]
+
+            assigned = {
+                student_id for (student_id,) in db.session.query(DailyProblemAssignment.student_id)
+                .filter(DailyProblemAssignment.assignment_date == day,
+                        DailyProblemAssignment.student_id.in_(student_ids))
+            }
+            seen = defaultdict(set)
+            for student_id, problem_id in db.session.query(
+                ProblemSubmission.student_id, ProblemSubmission.problem_id
+            ).filter(ProblemSubmission.student_id.in_(student_ids)).distinct():
+                seen[student_id].add(problem_id)
+            for student_id, problem_id in db.session.query(
+                DailyProblemAssignment.student_id, DailyProblemAssignment.problem_id
+            ).filter(DailyProblemAssignment.student_id.in_(student_ids),
+                     DailyProblemAssignment.assignment_date >= window_start,
+                     DailyProblemAssignment.assignment_date < day):
+                seen[student_id].add(problem_id)
+
+            rows = []
+            for student_id, grade_level in students:
+                if student_id in assigned:
+                    continue
+                band = grade_band(grade_level)
+                rows.append({
+                    'assignment_date': day,
+                    'student_id': student_id,
+                    'problem_id': _choose(candidates[band], seen[student_id], day, student_id),
+                    'grade_band': band
+                })
+            if rows:
+                db.session.execute(insert(DailyProblemAssignment), rows)
+                created += len(rows)
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return created
+
+
+def get_student_problem(student_id: int, day: Optional[date] = None) -> Optional[ProblemOfDay]:
+    """
+    Problema atribuído ao estudante (uma busca indexada); None se o job ainda
+    não o incluiu ou se o problema foi desativado (vale o agendamento global).
+    """
+    day = day or utc_today()
+    return db.session.query(ProblemOfDay).join(
+        DailyProblemAssignment, DailyProblemAssignment.problem_id == ProblemOfDay.id
+    ).filter(
+        DailyProblemAssignment.assignment_date == day,
+        DailyProblemAssignment.student_id == student_id,
+        ProblemOfDay.is_active.is_(True)
+    ).first()
+
+
+def create_sample_problem() -> ProblemOfDay:
+    """Cadastra o problema exemplo (banco sem nenhum problema)"""
+    problem = ProblemOfDay(**SAMPLE_PROBLEM)
+    db.session.add(problem)
+    db.session.commit()
+    return problem
+
+
+def estimate_problem_time(problem_data: Dict) -> str:
+    """Faixa de tempo estimada para resolver o problema"""
+    base_time = DIFFICULTY_INFO.get(problem_data.get('difficulty'), DIFFICULTY_INFO['intermediate'])[0]
+    if len(problem_data.get('description') or '') > 500:
+        base_time += 5
+    return f"{base_time}-{base_time + 5} minutos"
+
+
+def difficulty_description(difficulty: Optional[str]) -> str:
+    return DIFFICULTY_INFO.get(difficulty, DIFFICULTY_INFO['intermediate'])[1]
+
+
+def problem_payload(problem: ProblemOfDay) -> Dict:
+    """Problema serializado com as informações extras exibidas no frontend"""
+    data = problem.to_dict()
+    data['estimated_time'] = estimate_problem_time(data)
+    data['difficulty_level'] = difficulty_description(data.get('difficulty'))
+    return data
+
+
+def get_todays_problem(student_id: Optional[int] = None, day: Optional[date] = None) -> Dict:
+    """
+    Problema do dia serializado: o atribuído ao estudante, se houver; senão
+    o agendado para a data (em cache por dia), criando o exemplo em um banco vazio.
+    """
+    day = day or utc_today()
+    if student_id:
+        problem = get_student_problem(student_id, day)
+        if problem is not None:
+            return problem_payload(problem)
+
+    def load():
+        problem = get_problem_for_date(day)
+        return problem_payload(problem if problem is not None else create_sample_problem())
+
+    return _today_cache.get_or_set(day, load)
+
+
+def invalidate_todays_problem() -> None:
+    _today_cache.clear()
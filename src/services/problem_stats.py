@@ -0,0 +1,132 @@
+"""
+Estatísticas do problema do dia mantidas incrementalmente.
+
+Cada correção soma nos contadores do problema e no global (problem_id 0)
+dentro da mesma transação que grava o resultado da submissão, com
+`UPDATE ... SET x = x + 1`. Ler as estatísticas é uma busca pela chave
+primária, sem COUNT sobre problem_submissions.
+
+`rebuild_problem_stats` recalcula os contadores a partir das submissões
+já corrigidas (para bases anteriores aos contadores); a confiança dessas
+submissões não foi guardada, então elas não entram no histograma.
+"""
+from typing import Dict, Optional
+
+from sqlalchemy import case, func, update
+from sqlalchemy.exc import IntegrityError
+
+from src.models.user import db
+from src.models.problem_of_day import ProblemOfDay, ProblemStats, ProblemSubmission
+
+GLOBAL_STATS_ID = 0
+CONFIDENCE_BUCKETS = 5
+
+# Taxa de acerto observada -> dificuldade calibrada (mínimo de submissões para calibrar)
+CALIBRATION_MIN_SUBMISSIONS = 20
+CALIBRATION_THRESHOLDS = ((70, 'beginner'), (40, 'intermediate'), (0, 'advanced'))
+
+
+def confidence_bucket(confidence: Optional[float]) -> Optional[int]:
+    """Faixa do histograma (0..4) da confiança da avaliação"""
+    if confidence is None:
+        return None
+    return min(int(max(confidence, 0) * CONFIDENCE_BUCKETS), CONFIDENCE_BUCKETS - 1)
+
+
+def record_submission(problem_id: int, is_correct: bool, time_spent: Optional[int],
+                      confidence: Optional[float] = None) -> None:
+    """Soma uma submissão corrigida nos contadores (sem commit: vai junto com a submissão)"""
+    timed = bool(time_spent and time_spent > 0)
+    increments = {
+        'submissions': 1,
+        'correct': 1 if is_correct else 0,
+        'timed_submissions': 1 if timed else 0,
+        'total_time': time_spent if timed else 0
+    }
+    bucket = confidence_bucket(confidence)
+    if bucket is not None:
+        increments[f'confidence_{bucket}'] = 1
+
+    for stats_id in (problem_id, GLOBAL_STATS_ID):
+        _increment(stats_id, increments)
+
+
+def _increment(stats_id: int, increments: Dict[str, int]) -> None:
+    values = {
+        name: getattr(ProblemStats, name) + amount
+        for name, amount in increments.items()
+    }
+    statement = update(ProblemStats).where(ProblemStats.problem_id == stats_id)\
+        .values(**values).execution_options(synchronize_session=False)
+    if db.session.execute(statement).rowcount:
+        return
+    try:
+        with db.session.begin_nested():
+            db.session.add(_new_stats(stats_id, increments))
+    except IntegrityError:
+        # Outra transação criou a linha no meio do caminho
+        db.session.execute(statement)
+
+
+def _new_stats(stats_id: int, values: Dict[str, int]) -> ProblemStats:
+    stats = ProblemStats(problem_id=stats_id)
+    for column in ProblemStats.__table__.columns:
+        if column.name not in ('problem_id', 'updated_at'):
+            setattr(stats, column.name, values.get(column.name, 0))
+    return stats
+
+
+def calibrated_difficulty(stats: Dict) -> Optional[str]:
+    """Dificuldade sugerida pela taxa de acerto observada (None com poucas submissões)"""
+    if stats['total_submissions'] < CALIBRATION_MIN_SUBMISSIONS:
+        return None
+    for threshold, difficulty in CALIBRATION_THRESHOLDS:
+        if stats['success_rate'] >= threshold:
+            return difficulty
+    return None
+
+
+def get_problem_stats(problem_id: int = GLOBAL_STATS_ID) -> Dict:
+    """Estatísticas de um problema (ou globais, com problem_id 0)"""
+    stats = db.session.get(ProblemStats, problem_id)
+    data = (stats or _new_stats(problem_id, {})).to_dict()
+    data['problem_id'] = problem_id or None
+    if problem_id != GLOBAL_STATS_ID:
+        data['calibrated_difficulty'] = calibrated_difficulty(data)
+    return data
+
+
+def rebuild_problem_stats() -> int:
+    """Recalcula todos os contadores a partir das submissões corrigidas; retorna quantas linhas gravou"""
+    timed = ProblemSubmission.time_spent > 0
+    rows = db.session.query(
+        ProblemSubmission.problem_id,
+        func.count(ProblemSubmission.id),
+        func.sum(case((ProblemSubmission.is_correct.is_(True), 1), else_=0)),
+        func.sum(case((timed, 1), else_=0)),
+        func.sum(case((timed, ProblemSubmission.time_spent), else_=0))
+    ).filter(ProblemSubmission.is_correct.isnot(None)).group_by(ProblemSubmission.problem_id).all()
+
+    totals = {'submissions': 0, 'correct': 0, 'timed_submissions': 0, 'total_time': 0}
+    try:
+        ProblemStats.query.delete()
+        for problem_id, submissions, correct, timed_count, total_time in rows:
+            values = {
+                'submissions': submissions,
+                'correct': int(correct or 0),
+                'timed_submissions': int(timed_count or 0),
+                'total_time': int(total_time or 0)
+            }
+            for name, value in values.items():
+                totals[name] += value
+            db.session.add(_new_stats(problem_id, values))
+        db.session.add(_new_stats(GLOBAL_STATS_ID, totals))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return len(rows) + 1
+
+
+def count_active_problems() -> int:
+    return ProblemOfDay.query.filter_by(is_active=True).count()
@@ -0,0 +1,144 @@
+"""
+Submissão de respostas do problema do dia.
+
+Reúne o caminho completo de `POST /problems/<id>/submit`: deduplicação de
+reenvios (src/services/idempotency.py), fila de correção opcional
+(src/services/grading_queue.py), avaliação pela rubrica
+(src/services/answer_rubric.py) e contadores de estatísticas
+(src/services/problem_stats.py), tudo em uma transação por submissão.
+"""
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from src.models.user import db
+from src.models.problem_of_day import ProblemSubmission
+from src.services.answer_rubric import evaluate_answer, feedback_for, get_rubric
+from src.services.dashboard import bump_dashboard_version
+from src.services.grading_queue import enqueue_submission, queue_enabled, start_grading_workers
+from src.services.idempotency import (
+    find_submission, release_key, remember_response, remembered_response, submission_key
+)
+from src.services.problem_stats import record_submission
+
+
+def calculate_points(is_correct: bool, time_spent: int, confidence: float) -> int:
+    """Pontos da submissão: participação, ou base + bônus de confiança e de velocidade"""
+    if not is_correct:
+        return 10
+    confidence_bonus = int(confidence * 50)
+    speed_bonus = max(0, 30 - (time_spent // 60)) if time_spent < 600 else 0
+    return 100 + confidence_bonus + speed_bonus
+
+
+def next_suggestion(is_correct: bool) -> str:
+    if is_correct:
+        return "🚀 Parabéns! Que tal tentar um problema mais desafiador amanhã?"
+    return "📚 Revise os conceitos do problema, use as dicas e tente novamente!"
+
+
+def submission_response(submission: ProblemSubmission) -> Tuple[Dict, int]:
+    """
+    (corpo, status HTTP) da submissão, montado só a partir da linha gravada:
+    a mesma resposta na primeira vez e nos reenvios, em qualquer worker.
+    """
+    if submission.status in ('pending', 'grading', 'failed'):
+        body = {
+            'success': True,
+            'submission': submission.to_dict(),
+            'status': submission.status,
+            'status_url': f'/api/problems/submissions/{submission.id}'
+        }
+        return body, 200 if submission.status == 'failed' else 202
+
+    confidence = submission.confidence or 0.0
+    return {
+        'success': True,
+        'submission': submission.to_dict(),
+        'submission_id': submission.id,
+        'is_correct': submission.is_correct,
+        'confidence': confidence,
+        'feedback': submission.feedback,
+        'points_earned': calculate_points(bool(submission.is_correct), submission.time_spent or 0, confidence),
+        'next_suggestion': next_suggestion(bool(submission.is_correct))
+    }, 200
+
+
+def _insert_once(key: str, window: int,
+                 insert: Callable[[], ProblemSubmission]) -> Tuple[ProblemSubmission, bool]:
+    """
+    Grava a submissão com `insert`; se a chave já existe (índice único),
+    retorna (submissão gravada, True) para repetir a resposta. Uma chave
+    fora da janela é liberada e o INSERT é tentado mais uma vez.
+    """
+    try:
+        return insert(), False
+    except IntegrityError:
+        db.session.rollback()
+        existing = find_submission(key, window)
+        if existing is not None:
+            return existing, True
+        if ProblemSubmission.query.filter_by(idempotency_key=key).first() is None:
+            # Não foi a chave (ex.: estudante inexistente)
+            raise
+    release_key(key)
+    return insert(), False
+
+
+def submit_answer(app, problem_id: int, student_id: int, answer: str, time_spent: int = 0,
+                  client_key: Optional[str] = None, use_queue: Optional[bool] = None) -> Optional[Tuple[Dict, int]]:
+    """
+    Registra a resposta e retorna (corpo, status HTTP); None se o problema
+    não existe. Reenvios devolvem o resultado gravado com 'duplicate': True.
+    """
+    # A rubrica compilada (em cache por id) também confirma que o problema existe
+    if get_rubric(problem_id) is None:
+        return None
+
+    key, window = submission_key(student_id, problem_id, answer, client_key)
+    body = remembered_response(key)
+    if body is not None:
+        return {**body, 'duplicate': True}, 200
+
+    if queue_enabled(use_queue):
+        submission, duplicate = _insert_once(key, window, lambda: enqueue_submission(
+            student_id, problem_id, answer, time_spent, idempotency_key=key
+        ))
+        if not duplicate:
+            start_grading_workers(app)
+    else:
+        def insert():
+            submission = ProblemSubmission(
+                student_id=student_id,
+                problem_id=problem_id,
+                answer=answer,
+                time_spent=time_spent,
+                status='graded',
+                idempotency_key=key
+            )
+            try:
+                db.session.add(submission)
+                # Um reenvio esbarra no índice da chave aqui, antes de corrigir de novo
+                db.session.flush()
+                evaluation = evaluate_answer(problem_id, answer)
+                submission.is_correct = evaluation.is_correct
+                submission.confidence = evaluation.confidence
+                submission.feedback = feedback_for(evaluation)
+                submission.graded_at = datetime.utcnow()
+                record_submission(problem_id, evaluation.is_correct, time_spent, evaluation.confidence)
+                bump_dashboard_version(student_id)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            return submission
+
+        submission, duplicate = _insert_once(key, window, insert)
+
+    body, status_code = submission_response(submission)
+    if submission.status in (None, 'graded'):
+        remember_response(key, body, window)
+    if duplicate:
+        body = {**body, 'duplicate': True}
+    return body, status_code
@@ -0,0 +1,229 @@
+"""
+Cubo de relatórios para os painéis de professores e escolas.
+
+As fontes (Progress, ActivityLog e ProblemSubmission) são agregadas por
+semana x série x matéria x etapa do Método de Singapura na tabela
+report_cube, só com métricas aditivas (contagens e somas). Consultas de
+qualquer fatia são um SUM ... GROUP BY sobre essa tabela pequena.
+
+Atualização incremental (refresh_cube): a marca d'água em
+report_cube_state indica desde quando procurar alterações; as semanas que
+tiveram registros novos ou alterados são apagadas e recalculadas. O banco
+agrupa por dia (DATE() é portável entre SQLite e PostgreSQL) e o Python
+dobra os dias em semanas. Rode periodicamente:
+
+    flask --app src.main curio refresh-cube [--full]
+"""
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import case, func, insert, literal, or_
+
+from src.models.user import db
+from src.models.student import Student
+from src.models.content import Content
+from src.models.progress import Progress
+from src.models.gamification import ActivityLog
+from src.models.problem_of_day import ProblemSubmission
+from src.models.reporting import CUBE_DIMENSIONS, CUBE_METRICS, ReportCubeCell, ReportCubeState
+
+# Margem de segurança da marca d'água (transações que comitam durante o refresh)
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+COMPLETED_STATUSES = ('completed', 'mastered')
+
+
+def week_start(day) -> date:
+    """Segunda-feira da semana de `day` (date, datetime ou 'YYYY-MM-DD')"""
+    if isinstance(day, str):
+        day = date.fromisoformat(day[:10])
+    elif isinstance(day, datetime):
+        day = day.date()
+    return day - timedelta(days=day.weekday())
+
+
+def _dirty_weeks(since: datetime) -> Set[date]:
+    """Semanas com registros criados ou alterados desde `since`"""
+    sources = (
+        (func.date(Progress.created_at), Progress.updated_at >= since),
+        (func.date(ActivityLog.created_at), ActivityLog.created_at >= since),
+        (func.date(ProblemSubmission.submitted_at), ProblemSubmission.submitted_at >= since),
+        # A fila corrige depois do envio: a semana da submissão muda quando ela é corrigida
+        (func.date(ProblemSubmission.submitted_at), ProblemSubmission.graded_at >= since),
+    )
+    weeks = set()
+    for day_column, changed in sources:
+        for (day,) in db.session.query(day_column).filter(changed).distinct():
+            if day is not None:
+                weeks.add(week_start(day))
+    return weeks
+
+
+def _all_weeks() -> Set[date]:
+    weeks = set()
+    for column in (Progress.created_at, ActivityLog.created_at, ProblemSubmission.submitted_at):
+        for (day,) in db.session.query(func.date(column)).distinct():
+            if day is not None:
+                weeks.add(week_start(day))
+    return weeks
+
+
+def _aggregate_weeks(weeks: Set[date]) -> Dict[tuple, Dict[str, float]]:
+    """Células (semana, série, matéria, etapa) -> métricas, para as semanas pedidas"""
+    start = datetime.combine(min(weeks), datetime.min.time())
+    end = datetime.combine(max(weeks) + timedelta(days=7), datetime.min.time())
+    cells = defaultdict(lambda: dict.fromkeys(CUBE_METRICS, 0))
+
+    def fold(rows, metric_names):
+        for day, grade, subject, stage, *values in rows:
+            week = week_start(day)
+            if week not in weeks:
+                continue
+            cell = cells[(week, grade or '', subject or '', stage or '')]
+            for name, value in zip(metric_names, values):
+                cell[name] += value or 0
+
+    progress_day = func.date(Progress.created_at)
+    fold(
+        db.session.query(
+            progress_day, Student.grade_level, Content.subject, Content.singapore_method_stage,
+            func.count(Progress.id),
+            func.sum(case((Progress.status.in_(COMPLETED_STATUSES), 1), else_=0)),
+            func.sum(Progress.score),
+            func.count(Progress.score),
+            func.sum(Progress.time_spent)
+        ).select_from(Progress)
+        .outerjoin(Student, Student.id == Progress.student_id)
+        .outerjoin(Content, Content.id == Progress.content_id)
+        .filter(Progress.created_at >= start, Progress.created_at < end)
+        .group_by(progress_day, Student.grade_level, Content.subject, Content.singapore_method_stage),
+        ('progress_records', 'progress_completed', 'score_sum', 'score_count', 'progress_minutes')
+    )
+
+    activity_day = func.date(ActivityLog.created_at)
+    fold(
+        db.session.query(
+            activity_day, Student.grade_level, ActivityLog.subject, literal(''),
+            func.count(ActivityLog.id),
+            func.sum(ActivityLog.points_earned),
+            func.sum(ActivityLog.time_spent_minutes)
+        ).select_from(ActivityLog)
+        .outerjoin(Student, Student.id == ActivityLog.student_id)
+        .filter(ActivityLog.created_at >= start, ActivityLog.created_at < end)
+        .group_by(activity_day, Student.grade_level, ActivityLog.subject),
+        ('activities', 'activity_points', 'activity_minutes')
+    )
+
+    # Problemas do dia não têm matéria nem etapa: entram só na série. Só contam as
+    # submissões corrigidas (status NULL = corrigida na requisição, antes da fila)
+    submission_day = func.date(ProblemSubmission.submitted_at)
+    fold(
+        db.session.query(
+            submission_day, Student.grade_level, literal(''), literal(''),
+            func.count(ProblemSubmission.id),
+            func.sum(case((ProblemSubmission.is_correct.is_(True), 1), else_=0))
+        ).select_from(ProblemSubmission)
+        .outerjoin(Student, Student.id == ProblemSubmission.student_id)
+        .filter(ProblemSubmission.submitted_at >= start, ProblemSubmission.submitted_at < end,
+                or_(ProblemSubmission.status.is_(None), ProblemSubmission.status == 'graded'))
+        .group_by(submission_day, Student.grade_level),
+        ('submissions', 'correct_submissions')
+    )
+
+    return cells
+
+
+def _rebuild_weeks(weeks: Set[date]) -> int:
+    """Apaga e recalcula as células das semanas; retorna quantas células foram gravadas"""
+    if not weeks:
+        return 0
+    cells = _aggregate_weeks(weeks)
+    db.session.query(ReportCubeCell).filter(ReportCubeCell.week_start.in_(weeks)).delete(
+        synchronize_session=False
+    )
+    rows = [
+        dict(zip(CUBE_DIMENSIONS, key), **metrics)
+        for key, metrics in cells.items()
+    ]
+    if rows:
+        db.session.execute(insert(ReportCubeCell), rows)
+    return len(rows)
+
+
+def refresh_cube(full: bool = False, now: Optional[datetime] = None) -> Dict:
+    """
+    Atualiza o cubo. Sem marca d'água (primeira execução) ou com
+    `full=True`, reconstrói todas as semanas.
+    """
+    now = now or datetime.utcnow()
+    state = db.session.get(ReportCubeState, 1)
+    if state is None:
+        state = ReportCubeState(id=1)
+        db.session.add(state)
+
+    try:
+        if full or state.refreshed_at is None:
+            weeks = _all_weeks()
+            db.session.query(ReportCubeCell).delete(synchronize_session=False)
+        else:
+            weeks = _dirty_weeks(state.refreshed_at - REFRESH_OVERLAP)
+
+        cells = _rebuild_weeks(weeks)
+        state.refreshed_at = now
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {'weeks': len(weeks), 'cells': cells, 'refreshed_at': now.isoformat()}
+
+
+def _with_rates(row: Dict) -> Dict:
+    row['avg_score'] = round(row['score_sum'] / row['score_count'], 1) if row['score_count'] else None
+    row['completion_rate'] = (
+        round(row['progress_completed'] / row['progress_records'] * 100, 1) if row['progress_records'] else None
+    )
+    row['success_rate'] = (
+        round(row['correct_submissions'] / row['submissions'] * 100, 1) if row['submissions'] else None
+    )
+    return row
+
+
+def query_cube(group_by: Iterable[str] = (), filters: Optional[Dict[str, str]] = None,
+               date_from: Optional[date] = None, date_to: Optional[date] = None) -> List[Dict]:
+    """
+    Fatia do cubo: soma das métricas agrupada pelas dimensões de `group_by`,
+    restrita por `filters` (dimensão -> valor) e pelo intervalo de semanas.
+    """
+    group_by = list(group_by)
+    filters = filters or {}
+    unknown = [d for d in list(group_by) + list(filters) if d not in CUBE_DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Dimensões inválidas: {', '.join(unknown)}")
+
+    dimension_columns = [getattr(ReportCubeCell, d) for d in group_by]
+    query = db.session.query(
+        *dimension_columns,
+        *[func.sum(getattr(ReportCubeCell, m)) for m in CUBE_METRICS]
+    )
+    for dimension, value in filters.items():
+        query = query.filter(getattr(ReportCubeCell, dimension) == value)
+    if date_from:
+        query = query.filter(ReportCubeCell.week_start >= week_start(date_from))
+    if date_to:
+        query = query.filter(ReportCubeCell.week_start <= date_to)
+    if dimension_columns:
+        query = query.group_by(*dimension_columns).order_by(*dimension_columns)
+
+    results = []
+    for row in query:
+        values = list(row)
+        if not dimension_columns and values[0] is None:
+            return []  # cubo vazio
+        item = dict(zip(group_by, values[:len(group_by)]))
+        item.update({m: v or 0 for m, v in zip(CUBE_METRICS, values[len(group_by):])})
+        if 'week_start' in item:
+            item['week_start'] = item['week_start'].isoformat()
+        results.append(_with_rates(item))
+    return results
@@ -0,0 +1,79 @@
+"""
+Relatórios agregados da plataforma.
+
+Tudo é calculado no banco (COUNT/AVG com GROUP BY), então o custo em
+memória não depende do número de registros de progresso: o Python só vê
+uma linha por grupo.
+"""
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import distinct, func
+
+from src.models.user import db
+from src.models.student import Student
+from src.models.content import Content
+from src.models.progress import Progress
+from src.models.gamification import Achievement, StudentProgress
+
+
+def _round(value, digits=1):
+    return round(float(value), digits) if value is not None else None
+
+
+def _progress_breakdown(column, *joins) -> List[Dict]:
+    """Registros, estudantes distintos, score e tempo médios de Progress por `column`"""
+    query = db.session.query(
+        column.label('key'),
+        func.count(Progress.id),
+        func.count(distinct(Progress.student_id)),
+        func.avg(Progress.score),
+        func.avg(Progress.time_spent)
+    ).select_from(Progress)
+    for target, on in joins:
+        query = query.join(target, on)
+
+    return [
+        {
+            'key': key,
+            'records': records,
+            'students': students,
+            'avg_score': _round(avg_score),
+            'avg_time_minutes': _round(avg_time)
+        }
+        for key, records, students, avg_score, avg_time in query.group_by(column).order_by(column)
+    ]
+
+
+def _rename_key(rows: List[Dict], name: str) -> List[Dict]:
+    for row in rows:
+        row[name] = row.pop('key')
+    return rows
+
+
+def build_overview() -> Dict:
+    """Estatísticas gerais + quebras por status, matéria e série"""
+    total_students = db.session.query(func.count(Student.id)).scalar()
+    total_achievements = db.session.query(func.count(Achievement.id)).scalar()
+    total_progress_records, avg_score = db.session.query(
+        func.count(Progress.id), func.avg(Progress.score)
+    ).one()
+    avg_progress = db.session.query(func.avg(StudentProgress.progress_percentage)).scalar()
+
+    return {
+        'total_students': total_students,
+        'total_achievements': total_achievements,
+        'total_progress_records': total_progress_records,
+        'avg_progress_percentage': _round(avg_progress) or 0,
+        'avg_score': _round(avg_score),
+        'by_status': _rename_key(_progress_breakdown(Progress.status), 'status'),
+        'by_subject': _rename_key(
+            _progress_breakdown(Content.subject, (Content, Content.id == Progress.content_id)),
+            'subject'
+        ),
+        'by_grade': _rename_key(
+            _progress_breakdown(Student.grade_level, (Student, Student.id == Progress.student_id)),
+            'grade_level'
+        ),
+        'generated_at': datetime.utcnow().isoformat()
+    }
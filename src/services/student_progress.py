@@ -0,0 +1,109 @@
+"""
+Acesso aos registros de progresso dos estudantes para as análises de IA.
+
+Todas as leituras usam uma projeção colunar de Progress com LEFT JOIN em
+Content, de forma que os dados de uma análise chegam em uma única consulta,
+sem os lazy loads de `Progress.content` registro a registro.
+"""
+from itertools import groupby
+from typing import Dict, Iterator, List, Optional
+
+from src.models.user import db
+from src.models.progress import Progress
+from src.models.content import Content
+
+
+def progress_projection():
+    """Consulta base: colunas de Progress + colunas de Content usadas pelas análises"""
+    return db.session.query(
+        Progress.id,
+        Progress.student_id,
+        Progress.content_id,
+        Progress.status,
+        Progress.score,
+        Progress.time_spent,
+        Progress.created_at,
+        Content.title,
+        Content.subject,
+        Content.content_type,
+        Content.difficulty_level,
+        Content.singapore_method_stage
+    ).outerjoin(Content, Progress.content_id == Content.id)
+
+
+def has_content(row) -> bool:
+    """Indica se a linha da projeção tem conteúdo associado (content_type é obrigatório)"""
+    return row.content_type is not None
+
+
+def get_progress_rows(student_id: int, limit: Optional[int] = None, newest_first: bool = False) -> List:
+    """Registros de progresso de um estudante (com dados do conteúdo) em uma consulta"""
+    query = progress_projection().filter(Progress.student_id == student_id)
+    if newest_first:
+        query = query.order_by(Progress.created_at.desc(), Progress.id.desc())
+    else:
+        query = query.order_by(Progress.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def to_analysis_record(row) -> Dict:
+    """Converte uma linha da projeção no registro esperado pelo AIPersonalizationEngine"""
+    content_found = has_content(row)
+    return {
+        'content': {
+            'content_type': row.content_type if content_found else 'text',
+            'difficulty_level': row.difficulty_level if content_found else 'medium',
+            'subject': row.subject if content_found else 'General'
+        },
+        'score': row.score,
+        'time_spent': row.time_spent,
+        'status': row.status
+    }
+
+
+def load_analysis_input(student_id: int, interactions: Optional[List] = None) -> Dict:
+    """Monta a entrada de AIPersonalizationEngine.analyze_student_behavior em uma ida ao banco"""
+    rows = get_progress_rows(student_id)
+    return {
+        'student_id': student_id,
+        'progress_records': [to_analysis_record(row) for row in rows],
+        'interactions': interactions or []
+    }
+
+
+def iter_analysis_inputs(chunk_size: int = 500) -> Iterator[List[Dict]]:
+    """
+    Gera blocos de até `chunk_size` entradas de análise, uma por estudante.
+
+    Usa paginação por chave (student_id) para que nenhum cursor fique aberto
+    enquanto o chamador grava os resultados do bloco anterior.
+    """
+    last_student_id = 0
+
+    while True:
+        student_ids = [
+            row.student_id for row in db.session.query(Progress.student_id)
+            .filter(Progress.student_id > last_student_id)
+            .distinct()
+            .order_by(Progress.student_id)
+            .limit(chunk_size)
+        ]
+        if not student_ids:
+            return
+
+        rows = progress_projection()\
+            .filter(Progress.student_id.in_(student_ids))\
+            .order_by(Progress.student_id, Progress.id)\
+            .all()
+
+        yield [
+            {
+                'student_id': student_id,
+                'progress_records': [to_analysis_record(row) for row in student_rows],
+                'interactions': []
+            }
+            for student_id, student_rows in groupby(rows, key=lambda r: r.student_id)
+        ]
+        last_student_id = student_ids[-1]
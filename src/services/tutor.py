@@ -0,0 +1,258 @@
+"""
+Sessões de chat com o tutor de IA.
+
+Concentra o que as rotas de `/tutor/chat` fazem: criação de sessões,
+respostas do tutor (com cache de respostas para mensagens equivalentes no
+mesmo contexto), histórico paginado, resumo e métricas. O motor
+(AITutorEngine) é um só por processo; com o preload do gunicorn ele é
+criado no mestre e compartilhado pelos workers.
+"""
+import hashlib
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.ai_tutor_engine import AITutorEngine, CONVERSATION_STARTERS
+from src.cache import TTLCache
+from src.models.user import db
+from src.models.ai_tutor_chat import ChatMessage, ChatSession
+from src.models.problem_of_day import ProblemOfDay
+
+RESPONSE_CACHE_TTL = 300
+SUMMARY_CACHE_TTL = 600
+HISTORY_CONTEXT_MESSAGES = 10
+MAX_HISTORY_PAGE_SIZE = 50
+
+# Palavras que identificam o assunto das últimas mensagens (parte da chave do cache)
+CONTEXT_TOPICS = (
+    ('math', ('matemática', 'conta', 'número', 'somar')),
+    ('science', ('ciência', 'animal', 'planta', 'espaço')),
+    ('history', ('história', 'brasil', 'passado')),
+    ('portuguese', ('português', 'palavra', 'ler', 'escrever')),
+    ('geography', ('geografia', 'país', 'mapa')),
+)
+
+ai_tutor = AITutorEngine()
+
+_response_cache = TTLCache(ttl_seconds=RESPONSE_CACHE_TTL, maxsize=200)
+_summary_cache = TTLCache(ttl_seconds=SUMMARY_CACHE_TTL, maxsize=200)
+
+# Tempo de geração das respostas deste processo (para /tutor/performance)
+_timing = {'responses': 0, 'total_ms': 0.0}
+_timing_lock = threading.Lock()
+
+
+class SessionNotFound(LookupError):
+    pass
+
+
+class SessionClosed(ValueError):
+    pass
+
+
+def context_summary(history: List[Dict]) -> str:
+    """Assuntos das últimas 3 mensagens do estudante ('math_science', 'general', ...)"""
+    student_messages = [message for message in history if message.get('sender') == 'student']
+    if not student_messages:
+        return 'new_conversation'
+    topics = set()
+    for message in student_messages[-3:]:
+        text = message.get('message', '').lower()
+        for topic, words in CONTEXT_TOPICS:
+            if any(word in text for word in words):
+                topics.add(topic)
+                break
+    return '_'.join(sorted(topics)) if topics else 'general'
+
+
+def response_cache_key(message: str, summary: str, problem_id: Optional[int]) -> str:
+    normalized = re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', '', message.lower().strip()))
+    return hashlib.md5(f"{normalized}:{summary}:{problem_id}".encode()).hexdigest()
+
+
+def as_history(messages: List[ChatMessage]) -> List[Dict]:
+    """Mensagens no formato que o AITutorEngine espera (com 'type')"""
+    return [{**message.to_dict(), 'type': message.message_type} for message in messages]
+
+
+def start_session(student_id: int, problem_id: Optional[int] = None) -> Dict:
+    """Cria a sessão e a mensagem de boas-vindas (escolhida pelo id da sessão)"""
+    try:
+        session = ChatSession(student_id=student_id, problem_id=problem_id)
+        db.session.add(session)
+        db.session.flush()
+
+        welcome = ChatMessage(
+            session_id=session.id,
+            sender='tutor',
+            message=CONVERSATION_STARTERS[session.id % len(CONVERSATION_STARTERS)],
+            message_type='greeting'
+        )
+        db.session.add(welcome)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return {'session': session.to_dict(), 'welcome_message': welcome.to_dict()}
+
+
+def _problem_context(problem_id: Optional[int]) -> Optional[Dict]:
+    if not problem_id:
+        return None
+    problem = db.session.get(ProblemOfDay, problem_id)
+    if problem is None:
+        return None
+    return {'category': problem.category, 'difficulty': problem.difficulty, 'title': problem.title}
+
+
+def send_message(session_id: int, text: str) -> Dict:
+    """Grava a mensagem do estudante e a resposta do tutor (um commit)"""
+    started = time.perf_counter()
+    session = db.session.get(ChatSession, session_id)
+    if session is None:
+        raise SessionNotFound(session_id)
+    if session.is_active is False:
+        raise SessionClosed(session_id)
+
+    # Só as últimas mensagens entram no contexto do tutor
+    recent = ChatMessage.query.filter_by(session_id=session_id)\
+        .order_by(ChatMessage.timestamp.desc(), ChatMessage.id.desc())\
+        .limit(HISTORY_CONTEXT_MESSAGES).all()
+    history = as_history(list(reversed(recent)))
+
+    key = response_cache_key(text, context_summary(history), session.problem_id)
+    response = _response_cache.get(key)
+    cache_hit = response is not None
+    if not cache_hit:
+        response = ai_tutor.generate_response(text, history, _problem_context(session.problem_id))
+        _response_cache.set(key, response)
+
+    try:
+        student_message = ChatMessage(session_id=session_id, sender='student', message=text, message_type='text')
+        tutor_message = ChatMessage(session_id=session_id, sender='tutor',
+                                    message=response['message'], message_type=response['type'])
+        db.session.add_all([student_message, tutor_message])
+        session.last_activity = datetime.utcnow()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    _summary_cache.invalidate(session_id)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    with _timing_lock:
+        _timing['responses'] += 1
+        _timing['total_ms'] += elapsed_ms
+
+    return {
+        'student_message': student_message.to_dict(),
+        'tutor_response': tutor_message.to_dict(),
+        'performance': {
+            'processing_time_ms': round(elapsed_ms, 2),
+            'cache_hit': cache_hit,
+            'cache_size': len(_response_cache)
+        }
+    }
+
+
+def get_history(session_id: int, page: int = 1, per_page: int = 20) -> Dict:
+    """Mensagens da sessão em ordem cronológica, paginadas da mais recente para trás"""
+    session = db.session.get(ChatSession, session_id)
+    if session is None:
+        raise SessionNotFound(session_id)
+
+    per_page = max(1, min(per_page, MAX_HISTORY_PAGE_SIZE))
+    messages = ChatMessage.query.filter_by(session_id=session_id)\
+        .order_by(ChatMessage.timestamp.desc(), ChatMessage.id.desc())\
+        .paginate(page=page, per_page=per_page, error_out=False)
+    return {
+        'session': session.to_dict(),
+        'messages': [message.to_dict() for message in reversed(messages.items)],
+        'pagination': {
+            'page': page,
+            'per_page': per_page,
+            'total': messages.total,
+            'pages': messages.pages,
+            'has_next': messages.has_next,
+            'has_prev': messages.has_prev
+        }
+    }
+
+
+def _session_duration(messages: List[ChatMessage]) -> float:
+    """Duração da sessão em minutos"""
+    if len(messages) < 2:
+        return 0
+    return round((messages[-1].timestamp - messages[0].timestamp).total_seconds() / 60, 1)
+
+
+def _build_summary(session: ChatSession) -> Dict:
+    messages = session.messages
+    summary = ai_tutor.generate_summary(as_history(messages))
+    summary['session_duration'] = _session_duration(messages)
+    summary['last_activity'] = session.last_activity.isoformat() if session.last_activity else None
+    return summary
+
+
+def get_summary(session_id: int) -> Tuple[Dict, bool]:
+    """(resumo da sessão, veio do cache); o cache vale até a próxima mensagem"""
+    summary = _summary_cache.get(session_id)
+    if summary is not None:
+        return summary, True
+    session = db.session.get(ChatSession, session_id)
+    if session is None:
+        raise SessionNotFound(session_id)
+    summary = _build_summary(session)
+    _summary_cache.set(session_id, summary)
+    return summary, False
+
+
+def end_session(session_id: int) -> Dict:
+    """Encerra a sessão e retorna o resumo da conversa"""
+    session = db.session.get(ChatSession, session_id)
+    if session is None:
+        raise SessionNotFound(session_id)
+    try:
+        session.is_active = False
+        session.session_end = datetime.utcnow()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    _summary_cache.invalidate(session_id)
+    return {'session': session.to_dict(), 'summary': _build_summary(session)}
+
+
+def student_sessions(student_id: int) -> List[Dict]:
+    """Sessões do estudante, da mais recente para a mais antiga, com o título do problema"""
+    sessions = ChatSession.query.filter_by(student_id=student_id)\
+        .order_by(ChatSession.session_start.desc()).all()
+    problem_ids = {session.problem_id for session in sessions if session.problem_id}
+    titles = dict(
+        db.session.query(ProblemOfDay.id, ProblemOfDay.title).filter(ProblemOfDay.id.in_(problem_ids))
+    ) if problem_ids else {}
+
+    result = []
+    for session in sessions:
+        data = session.to_dict()
+        if session.problem_id in titles:
+            data['problem_title'] = titles[session.problem_id]
+        result.append(data)
+    return result
+
+
+def performance_metrics() -> Dict:
+    """Cache de respostas e tempo médio de resposta deste processo, e sessões ativas na última hora"""
+    lookups = _response_cache.hits + _response_cache.misses
+    with _timing_lock:
+        responses, total_ms = _timing['responses'], _timing['total_ms']
+    return {
+        'total_cached_responses': len(_response_cache),
+        'cache_hit_ratio': round(_response_cache.hits / lookups, 3) if lookups else 0,
+        'avg_response_time': round(total_ms / responses, 1) if responses else 0,
+        'active_sessions': ChatSession.query.filter(
+            ChatSession.last_activity >= datetime.utcnow() - timedelta(hours=1)
+        ).count()
+    }
@@ -0,0 +1,251 @@
+"""
+Arquivos estáticos do frontend (build do Vite em src/static).
+
+No build (build_frontend.py), `compress_assets` grava ao lado de cada
+arquivo de texto as versões .gz (e .br, se o pacote `brotli` estiver
+instalado) e um manifesto com o ETag e as codificações de cada arquivo.
+No servidor, `StaticAssets` lê o manifesto uma vez e monta um índice em
+memória caminho -> arquivo: cada requisição é uma busca no dicionário,
+sem testar o disco e sem comprimir nada em Python. A codificação sai do
+Accept-Encoding e o ETag responde 304 para quem já tem o arquivo.
+
+Sem manifesto (ex.: src/static copiado à mão), o índice é montado
+varrendo a pasta uma vez, aproveitando os .gz/.br que existirem.
+
+O index.html (a resposta de toda rota da SPA, como /dashboard) fica em
+memória já lido, com as versões comprimidas, guardadas no próprio Asset.
+Um novo build é percebido pela mudança do manifesto (verificada no máximo
+a cada ASSET_RELOAD_INTERVAL segundos) e então um índice novo é montado e
+trocado de uma vez: uma requisição que pegou o Asset do build anterior
+responde com os bytes desse mesmo build.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, send_file
+
+MANIFEST_NAME = 'asset-manifest.json'
+INDEX_NAME = 'index.html'
+MANIFEST_VERSION = 1
+
+# Só vale comprimir texto; imagens e fontes já vêm comprimidas
+COMPRESSIBLE_EXTENSIONS = {'.html', '.js', '.mjs', '.css', '.svg', '.json', '.txt', '.xml', '.map', '.wasm'}
+MIN_COMPRESS_SIZE = 1024
+
+# Codificações em ordem de preferência -> sufixo do arquivo irmão
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+ASSET_RELOAD_INTERVAL = 2.0
+
+
+@dataclass(frozen=True)
+class Asset:
+    path: str
+    etag: str
+    mimetype: str
+    encodings: Tuple[str, ...] = ()
+    # Arquivos servidos da memória (o index.html): codificação -> bytes
+    bodies: Optional[Dict[Optional[str], bytes]] = field(default=None, compare=False, repr=False)
+
+
+def content_etag(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def _guess_mimetype(path: str) -> str:
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def _is_sibling(path: str, paths) -> bool:
+    """Arquivo .gz/.br gerado a partir de outro arquivo da pasta"""
+    return any(path.endswith(suffix) and path[:-len(suffix)] in paths for suffix in ENCODING_SUFFIXES.values())
+
+
+def _static_files(static_dir: str):
+    """Caminhos relativos (com '/') de todos os arquivos da pasta, exceto o manifesto"""
+    paths = set()
+    for root, _, files in os.walk(static_dir):
+        for name in files:
+            path = os.path.relpath(os.path.join(root, name), static_dir).replace(os.sep, '/')
+            if path != MANIFEST_NAME:
+                paths.add(path)
+    return paths
+
+
+def _compressors():
+    compressors = {'gzip': lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        print("⚠️  Pacote brotli não instalado: gerando só as versões .gz")
+    else:
+        compressors['br'] = lambda data: brotli.compress(data, quality=11)
+    return compressors
+
+
+def compress_assets(static_dir: str) -> Dict[str, Dict]:
+    """
+    Gera as versões comprimidas (só quando ficam menores) e grava o
+    manifesto. Executado no build; retorna as entradas do manifesto.
+    """
+    compressors = _compressors()
+    paths = _static_files(static_dir)
+    assets = {}
+    for path in sorted(paths):
+        if _is_sibling(path, paths):
+            continue
+        full_path = os.path.join(static_dir, path)
+        with open(full_path, 'rb') as f:
+            data = f.read()
+
+        encodings = {}
+        if os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS and len(data) >= MIN_COMPRESS_SIZE:
+            for encoding in ENCODING_SUFFIXES:
+                if encoding not in compressors:
+                    continue
+                compressed = compressors[encoding](data)
+                if len(compressed) < len(data):
+                    with open(full_path + ENCODING_SUFFIXES[encoding], 'wb') as f:
+                        f.write(compressed)
+                    encodings[encoding] = len(compressed)
+
+        assets[path] = {'etag': content_etag(data), 'size': len(data), 'encodings': encodings}
+
+    with open(os.path.join(static_dir, MANIFEST_NAME), 'w') as f:
+        json.dump({'version': MANIFEST_VERSION, 'assets': assets}, f, indent=2, sort_keys=True)
+    return assets
+
+
+def load_asset_index(static_dir: str) -> Dict[str, Asset]:
+    """Índice caminho -> Asset, do manifesto ou (sem ele) varrendo a pasta"""
+    if not os.path.isdir(static_dir):
+        return {}
+
+    manifest_path = os.path.join(static_dir, MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        return {
+            path: Asset(
+                path=path,
+                etag=entry['etag'],
+                mimetype=_guess_mimetype(path),
+                encodings=tuple(e for e in ENCODING_SUFFIXES if e in entry.get('encodings', {}))
+            )
+            for path, entry in manifest.get('assets', {}).items()
+        }
+
+    paths = _static_files(static_dir)
+    index = {}
+    for path in paths:
+        if _is_sibling(path, paths):
+            continue
+        with open(os.path.join(static_dir, path), 'rb') as f:
+            etag = content_etag(f.read())
+        index[path] = Asset(
+            path=path,
+            etag=etag,
+            mimetype=_guess_mimetype(path),
+            encodings=tuple(e for e, suffix in ENCODING_SUFFIXES.items() if path + suffix in paths)
+        )
+    return index
+
+
+class StaticAssets:
+    """Índice em memória de uma pasta de estáticos e as respostas dos arquivos"""
+
+    def __init__(self, static_dir: str):
+        self.static_dir = static_dir
+        self.index: Dict[str, Asset] = {}
+        self._signature = None
+        self._checked_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.reload()
+
+    def _build_signature(self) -> Optional[Tuple[str, int, int]]:
+        """Identifica o build atual pelo manifesto (ou pelo index.html, sem manifesto)"""
+        for name in (MANIFEST_NAME, INDEX_NAME):
+            try:
+                stat = os.stat(os.path.join(self.static_dir, name))
+            except OSError:
+                continue
+            return name, stat.st_mtime_ns, stat.st_size
+        return None
+
+    def _read_variants(self, asset: Asset) -> Dict[Optional[str], bytes]:
+        bodies = {}
+        for encoding in (None,) + asset.encodings:
+            suffix = ENCODING_SUFFIXES[encoding] if encoding else ''
+            with open(os.path.join(self.static_dir, asset.path + suffix), 'rb') as f:
+                bodies[encoding] = f.read()
+        return bodies
+
+    def reload(self) -> None:
+        """Relê o índice e o index.html do build atual e troca o índice de uma vez"""
+        signature = self._build_signature()
+        index = load_asset_index(self.static_dir)
+        page = index.get(INDEX_NAME)
+        if page:
+            index[INDEX_NAME] = replace(page, bodies=self._read_variants(page))
+        self.index = index
+        self._signature = signature
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < ASSET_RELOAD_INTERVAL:
+            return
+        with self._lock:
+            if now - self._checked_at < ASSET_RELOAD_INTERVAL:
+                return
+            self._checked_at = now
+            signature = self._build_signature()
+            # Sem assinatura a pasta está sendo trocada pelo build: mantém o anterior
+            if signature is not None and signature != self._signature:
+                try:
+                    self.reload()
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Build do frontend incompleto, mantendo o anterior: {e}")
+
+    def get(self, path: str) -> Optional[Asset]:
+        self._refresh()
+        return self.index.get(path)
+
+    def negotiate(self, asset: Asset, accept_encodings) -> Optional[str]:
+        """Melhor versão comprimida aceita pelo cliente (None = arquivo original)"""
+        for encoding in asset.encodings:
+            if accept_encodings.quality(encoding) > 0:
+                return encoding
+        return None
+
+    def response(self, asset: Asset, request):
+        """Resposta do arquivo (ou 304) com ETag por codificação e Vary: Accept-Encoding"""
+        encoding = self.negotiate(asset, request.accept_encodings)
+        etag = asset.etag if encoding is None else f'{asset.etag}-{encoding}'
+
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+        elif asset.bodies is not None:
+            response = current_app.response_class(asset.bodies[encoding], mimetype=asset.mimetype)
+        else:
+            suffix = ENCODING_SUFFIXES[encoding] if encoding else ''
+            response = send_file(
+                os.path.join(self.static_dir, asset.path + suffix),
+                mimetype=asset.mimetype,
+                etag=False,
+                conditional=False,
+                last_modified=None
+            )
+        if encoding and response.status_code != 304:
+            response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        if asset.encodings:
+            response.vary.add('Accept-Encoding')
+        return response
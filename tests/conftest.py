@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Banco SQLite isolado para os testes (não toca em src/database)
+_TEST_DB_DIR = tempfile.mkdtemp(prefix='curio-tests-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(_TEST_DB_DIR, 'curio_test.db')}")
+os.environ.setdefault('CURIO_MODEL_DIR', os.path.join(_TEST_DB_DIR, 'ml_models'))
+
+
+@pytest.fixture(scope='session')
+def _bootstrapped_app():
+    from src.bootstrap import bootstrap_database
+    from src.main import app
+    app.config['TESTING'] = True
+    bootstrap_database(app)
+    return app
+
+
+@pytest.fixture
+def app(_bootstrapped_app):
+    return _bootstrapped_app
+
+
+@pytest.fixture
+def clean_db(app):
+    """Recria todas as tabelas e entrega o `db` dentro de um app context"""
+    from src.models.user import db
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        yield db
+        db.session.remove()
+
+
+@pytest.fixture
+def count_queries():
+    """Context manager que coleta os SQLs executados em um engine"""
+    @contextmanager
+    def counter(engine):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return counter
@@ -0,0 +1,59 @@
+import json
+
+from src.ai_bulk_analysis import run_bulk_analysis
+from src.ai_engine import AIPersonalizationEngine
+from src.services.student_progress import iter_analysis_inputs
+
+
+def _seed(db, num_students=5):
+    from src.models.user import User
+    from src.models.student import Student
+    from src.models.content import Content
+    from src.models.progress import Progress
+
+    contents = [
+        Content(title='Vídeo', subject='Mathematics', grade_level='5',
+                content_type='video', difficulty_level='easy'),
+        Content(title='Jogo', subject='Science', grade_level='5',
+                content_type='game', difficulty_level='hard'),
+    ]
+    db.session.add_all(contents)
+    for i in range(num_students):
+        user = User(username=f'aluno{i}', email=f'aluno{i}@curio.test')
+        db.session.add(user)
+        db.session.flush()
+        student = Student(user_id=user.id, grade_level='5')
+        db.session.add(student)
+        db.session.flush()
+        for j, content in enumerate(contents):
+            db.session.add(Progress(student_id=student.id, content_id=content.id, status='completed',
+                                    score=50 + 10 * i + 20 * j, time_spent=10 + 5 * j))
+    db.session.commit()
+
+
+def test_chunks_cover_every_student_once(clean_db):
+    _seed(clean_db, num_students=5)
+    chunks = list(iter_analysis_inputs(chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(len(s['progress_records']) == 2 for chunk in chunks for s in chunk)
+
+
+def test_bulk_analysis_upserts_profiles(clean_db):
+    from src.models.ai_personalization import AIPersonalization
+
+    _seed(clean_db, num_students=3)
+    report = run_bulk_analysis(chunk_size=2, workers=1)
+    assert report.students == 3
+    assert report.progress_records == 6
+    assert AIPersonalization.query.count() == 3
+
+    # Uma segunda execução atualiza as linhas existentes em vez de duplicar
+    run_bulk_analysis(chunk_size=2, workers=1)
+    assert AIPersonalization.query.count() == 3
+
+    engine = AIPersonalizationEngine()
+    student_data = next(iter_analysis_inputs(chunk_size=1))[0]
+    expected = engine.analyze_student_behavior(student_data)
+    stored = AIPersonalization.query.filter_by(student_id=student_data['student_id']).first()
+    assert stored.learning_style_detected == expected.learning_style
+    assert json.loads(stored.strengths) == expected.strong_subjects
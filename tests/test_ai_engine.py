@@ -0,0 +1,68 @@
+from src.ai_engine import AIPersonalizationEngine, extract_progress_features
+
+
+def _record(content_type, subject, score, time_spent=20, difficulty='medium'):
+    return {
+        'content': {'content_type': content_type, 'difficulty_level': difficulty, 'subject': subject},
+        'score': score,
+        'time_spent': time_spent
+    }
+
+
+def test_features_keep_first_appearance_order():
+    features = extract_progress_features([
+        _record('game', 'Science', 80),
+        {'content': None, 'score': 90, 'time_spent': None},
+        _record('video', 'Mathematics', None),
+    ])
+    assert features.content_types == ['game', 'video']
+    assert features.subjects == ['Science', 'Mathematics']
+    assert features.scored.tolist() == [True, False, False]
+    assert features.timed.tolist() == [True, False, True]
+
+
+def test_profile_from_grouped_reductions():
+    records = [
+        _record('video', 'Mathematics', 90, time_spent=30, difficulty='hard'),
+        _record('video', 'Mathematics', 85, time_spent=30, difficulty='hard'),
+        _record('game', 'Science', 50, time_spent=10),
+        _record('text', 'History', 70, time_spent=5),
+    ]
+    profile = AIPersonalizationEngine().analyze_student_behavior(
+        {'student_id': 7, 'progress_records': records, 'interactions': []}
+    )
+    assert profile.learning_style == 'visual'
+    assert profile.difficulty_preference == 'hard'
+    assert profile.pace_preference == 'normal'
+    assert profile.preferred_content_types == ['video']
+    assert profile.strong_subjects == ['Mathematics']
+    assert profile.weak_subjects == ['Science']
+
+
+def test_learning_style_model_roundtrip(tmp_path):
+    import numpy as np
+    from src.ai_models import LearningStyleModel
+
+    rng = np.random.default_rng(0)
+    visual = np.hstack([rng.uniform(0.8, 1.0, (20, 1)), rng.uniform(0.2, 0.4, (20, 3)),
+                        np.tile([0.7, 0.1, 0.1, 0.1], (20, 1)), np.full((20, 1), 0.5)])
+    kinesthetic = np.hstack([rng.uniform(0.2, 0.4, (20, 2)), rng.uniform(0.8, 1.0, (20, 1)),
+                             rng.uniform(0.2, 0.4, (20, 1)), np.tile([0.1, 0.1, 0.7, 0.1], (20, 1)),
+                             np.full((20, 1), 0.5)])
+    model = LearningStyleModel.fit(np.vstack([visual, kinesthetic]), n_clusters=2)
+    model.save(str(tmp_path))
+
+    loaded = LearningStyleModel.load(str(tmp_path))
+    assert isinstance(loaded.centers, np.memmap)
+    assert loaded.predict(visual[0]) == 'visual'
+    assert loaded.predict(kinesthetic[0]) == 'kinesthetic'
+
+    engine = AIPersonalizationEngine(model_dir=str(tmp_path))
+    records = [_record('game', 'Science', 95), _record('game', 'Science', 90),
+               _record('video', 'Mathematics', 30), _record('video', 'Mathematics', 25)]
+    profile = engine.analyze_student_behavior({'student_id': 1, 'progress_records': records, 'interactions': []})
+    assert profile.learning_style == 'kinesthetic'
+
+
+def test_engine_without_trained_model_uses_heuristic(tmp_path):
+    assert AIPersonalizationEngine(model_dir=str(tmp_path)).learning_style_classifier is None
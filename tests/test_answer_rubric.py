@@ -0,0 +1,87 @@
+import json
+
+from sqlalchemy import create_engine, inspect, text
+
+from src.bootstrap import add_missing_columns
+from src.models.problem_of_day import ProblemOfDay
+from src.services import answer_rubric
+from src.services.answer_rubric import CompiledRubric, evaluate_answer, parse_number
+
+
+def test_parse_number_formats():
+    assert [parse_number(t) for t in ('1.350,50', '1,5', '1350.5', '1.350', '900')] == \
+        [1350.5, 1.5, 1350.5, 1350.0, 900.0]
+    # Separador de milhar internacional
+    assert [parse_number(t) for t in ('1,350', '1,350,000', '1,350.50', '0,350')] == \
+        [1350.0, 1350000.0, 1350.5, 0.35]
+    assert CompiledRubric({'groups': [{'numbers': [1350]}]}).evaluate('Faltam 1,350 reais').score == 1.0
+
+
+def test_terms_fold_accents_and_match_prefixes():
+    rubric = CompiledRubric({'groups': [{'terms': ['deficit', 'econom*', 'orçamento']}], 'pass_score': 1})
+    result = rubric.evaluate('Há DÉFICIT; economizando dá para fechar o Orcamento')
+    assert result.is_correct and result.score == 1.0
+    # Sem '*' a palavra precisa terminar ali
+    assert CompiledRubric({'groups': [{'terms': ['cortar']}]}).evaluate('cortaria').score == 0
+
+
+def test_overlapping_terms_match_the_same_word():
+    rubric = CompiledRubric({'groups': [{'terms': ['econom*', 'economia', 'plano de corte', 'plano']}]})
+    assert rubric.evaluate('A economia vem do plano de corte').score == 1.0
+    assert rubric.evaluate('Economizar com um plano').score == 0.5
+
+
+def test_numbers_with_tolerance_and_weights():
+    rubric = CompiledRubric({
+        'groups': [
+            {'name': 'total', 'numbers': [1350], 'tolerance': 0.01, 'weight': 3},
+            {'name': 'parcela', 'numbers': [450]}
+        ],
+        'pass_score': 0.7
+    })
+    result = rubric.evaluate('Precisam de R$ 1.355,00 por mês; 4500 não é a parcela')
+    assert result.groups == {'total': 1.0, 'parcela': 0.0}
+    assert result.score == 0.75 and result.is_correct
+    assert not rubric.evaluate('Precisam de 1400').is_correct
+
+
+def test_problem_rubric_is_cached_and_used_by_submit(app, clean_db):
+    problem = ProblemOfDay(title='Área', description='-', category='geometry', difficulty='beginner',
+                           rubric=json.dumps({'groups': [{'numbers': [12]}], 'pass_score': 1}))
+    clean_db.session.add(problem)
+    clean_db.session.commit()
+    answer_rubric._rubric_cache.clear()
+
+    assert evaluate_answer(problem.id, 'A área é 12 m²').is_correct
+    assert answer_rubric.get_rubric(problem.id) is answer_rubric.get_rubric(problem.id)
+
+    client = app.test_client()
+    wrong = client.post(f'/api/problems/{problem.id}/submit', json={'student_id': 1, 'answer': 'Dá 14'})
+    assert wrong.get_json()['is_correct'] is False
+    right = client.post(f'/api/problems/{problem.id}/submit', json={'student_id': 1, 'answer': 'Dá 12'})
+    assert right.get_json()['is_correct'] is True
+
+
+def test_category_and_default_rubrics(clean_db):
+    finance = ProblemOfDay(title='F', description='-', category='personal_finance', difficulty='beginner')
+    essay = ProblemOfDay(title='E', description='-', category='logic', difficulty='beginner')
+    clean_db.session.add_all([finance, essay])
+    clean_db.session.commit()
+    answer_rubric._rubric_cache.clear()
+
+    assert evaluate_answer(finance.id, 'Poupar 900 + 450 = 1350 gera déficit: ajustar o orçamento e cortar lazer').is_correct
+    assert not evaluate_answer(essay.id, 'curta demais').is_correct
+    assert evaluate_answer(essay.id, ' '.join(['palavra'] * 25)).is_correct
+
+
+def test_add_missing_columns_upgrades_existing_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            'CREATE TABLE problems_of_day (id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, '
+            'description TEXT NOT NULL, category VARCHAR(100) NOT NULL, difficulty VARCHAR(50) NOT NULL, '
+            'expected_answer TEXT, solution_hints TEXT, resources TEXT, date_created DATETIME, is_active BOOLEAN)'
+        ))
+    assert add_missing_columns(engine) == 1
+    assert 'rubric' in {column['name'] for column in inspect(engine).get_columns('problems_of_day')}
+    assert add_missing_columns(engine) == 0
@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.main import create_app
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _routes(app):
+    return {rule.rule for rule in app.url_map.iter_rules()}
+
+
+def test_profiles_register_only_their_blueprints():
+    chat = create_app('api-chat')
+    assert '/api/tutor/chat/start' in _routes(chat)
+    assert '/api/problems/today' not in _routes(chat)
+    assert '/<path:path>' not in _routes(chat)
+    assert chat.test_client().get('/health').status_code == 200
+
+    core = create_app('api-core')
+    assert '/api/problems/today' in _routes(core)
+    assert '/api/tutor/chat/start' not in _routes(core)
+
+    static = create_app('static')
+    assert {'/health', '/', '/<path:path>'} <= _routes(static)
+    assert not any(rule.startswith('/api') for rule in _routes(static))
+    assert static.test_client().get('/api/users').status_code == 404
+
+    with pytest.raises(ValueError):
+        create_app('nope')
+
+
+def test_lean_profiles_skip_unrelated_modules():
+    script = (
+        "import json, sys\n"
+        "from src.main import app\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith(('src.', 'numpy', 'openai', 'sklearn')))))\n"
+    )
+
+    def loaded(profile):
+        env = {**os.environ, 'CURIO_APP_PROFILE': profile}
+        output = subprocess.run([sys.executable, '-c', script], cwd=ROOT, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        return set(json.loads(output.strip().splitlines()[-1]))
+
+    static = loaded('static')
+    assert not any(m.startswith(('src.routes', 'src.services', 'numpy', 'openai', 'sklearn')) for m in static)
+
+    chat = loaded('api-chat')
+    assert 'src.routes.ai_tutor_chat' in chat
+    assert 'src.routes.problem_of_day' not in chat and 'numpy' not in chat
@@ -0,0 +1,82 @@
+from src.bootstrap import DEFAULT_ACHIEVEMENTS, bootstrap_database
+from src.models.gamification import Achievement
+
+
+def test_import_does_not_touch_database():
+    import os
+    import subprocess
+    import sys
+
+    # Importar a aplicação contra um banco inexistente não cria o arquivo
+    code = ("import os, tempfile; path = os.path.join(tempfile.mkdtemp(), 'x.db'); "
+            "os.environ['DATABASE_URL'] = 'sqlite:///' + path; import src.main; "
+            "assert not os.path.exists(path)")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=root)
+
+
+def test_bootstrap_command_is_idempotent(app, clean_db):
+    runner = app.test_cli_runner()
+
+    first = runner.invoke(args=['curio', 'bootstrap'])
+    assert first.exit_code == 0, first.output
+    assert f'{len(DEFAULT_ACHIEVEMENTS)} conquistas criadas' in first.output
+
+    assert bootstrap_database(app) == {'achievements_created': 0, 'columns_added': 0}
+    assert Achievement.query.count() == len(DEFAULT_ACHIEVEMENTS)
+
+
+def test_bootstrap_leaves_no_pooled_connections(app, clean_db):
+    bootstrap_database(app)
+    # O mestre do gunicorn não pode levar conexões abertas para o fork
+    assert all(engine.pool.checkedin() == 0 and engine.pool.checkedout() == 0
+               for engine in clean_db.engines.values())
+
+
+def test_add_missing_columns_quotes_string_defaults(tmp_path):
+    from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, inspect, text
+    from src.bootstrap import add_missing_columns
+    from src.models.user import db
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE legacy_queue (id INTEGER PRIMARY KEY)'))
+        conn.execute(text('INSERT INTO legacy_queue (id) VALUES (1)'))
+
+    table = Table('legacy_queue', db.metadata,
+                  Column('id', Integer, primary_key=True),
+                  Column('status', String(20), nullable=False, server_default="pending"),
+                  Column('note', String(20), server_default="it's"))
+    try:
+        assert add_missing_columns(engine) == 2
+        with engine.connect() as conn:
+            assert conn.execute(text('SELECT status, note FROM legacy_queue')).one() == ('pending', "it's")
+        assert {c['name'] for c in inspect(engine).get_columns('legacy_queue')} == {'id', 'status', 'note'}
+    finally:
+        db.metadata.remove(table)
+        engine.dispose()
+
+
+def test_idempotency_keys_become_unique_on_existing_databases(tmp_path):
+    from sqlalchemy import create_engine, inspect, text
+    from src.bootstrap import add_missing_columns, release_duplicate_idempotency_keys
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text('CREATE TABLE problem_submissions (id INTEGER PRIMARY KEY, student_id INTEGER, '
+                          'problem_id INTEGER, answer TEXT, idempotency_key VARCHAR(64))'))
+        conn.execute(text('CREATE INDEX ix_problem_submissions_idempotency_key '
+                          'ON problem_submissions (idempotency_key)'))
+        conn.execute(text("INSERT INTO problem_submissions (id, student_id, problem_id, answer, idempotency_key) "
+                          "VALUES (1, 1, 1, 'a', 'k'), (2, 1, 1, 'a', 'k'), (3, 1, 1, 'b', 'j')"))
+    try:
+        assert release_duplicate_idempotency_keys(engine) == 1
+        add_missing_columns(engine)
+        with engine.connect() as conn:
+            keys = conn.execute(text('SELECT id, idempotency_key FROM problem_submissions ORDER BY id')).all()
+        assert keys == [(1, None), (2, 'k'), (3, 'j')]
+        indexes = {index['name']: index['unique'] for index in inspect(engine).get_indexes('problem_submissions')}
+        assert 'ix_problem_submissions_idempotency_key' not in indexes
+        assert indexes['uq_problem_submissions_idempotency_key']
+    finally:
+        engine.dispose()
@@ -0,0 +1,92 @@
+from datetime import date, datetime
+
+from src.models.user import User
+from src.models.student import Student
+from src.models.gamification import ActivityLog
+from src.services import dashboard
+from src.services.dashboard import build_student_dashboard
+
+
+def _student(db):
+    user = User(username='Victor Pires', email='victor@curio.test')
+    db.session.add(user)
+    db.session.flush()
+    student = Student(user_id=user.id, grade_level='7')
+    db.session.add(student)
+    db.session.commit()
+    return student.id
+
+
+def test_dashboard_from_summary_tables(clean_db, count_queries):
+    student_id = _student(clean_db)
+    clean_db.session.add_all([
+        ActivityLog(student_id=student_id, activity_type='exercise', subject='Matemática', topic='Frações',
+                    points_earned=15, time_spent_minutes=90, created_at=datetime(2026, 3, 3, 10)),
+        ActivityLog(student_id=student_id, activity_type='chat', subject='Ciências', topic='Fotossíntese',
+                    points_earned=5, time_spent_minutes=30, created_at=datetime(2026, 3, 3, 11)),
+        ActivityLog(student_id=student_id, activity_type='exercise', subject='Matemática', topic='Antiga',
+                    points_earned=5, time_spent_minutes=60, created_at=datetime(2026, 2, 20, 11)),
+    ])
+    clean_db.session.commit()
+
+    with count_queries(clean_db.engine) as statements:
+        data = build_student_dashboard(student_id, today=date(2026, 3, 5))
+
+    assert len(statements) == 5
+    assert data['user'] == {'name': 'Victor Pires', 'grade': '7', 'level': 1, 'points': 0, 'streak': 0}
+    assert data['weekly_chart'][1] == {'day': 'Ter', 'hours': 2.0, 'exercises': 2}
+    assert data['progress']['weekly_progress'] == 2.0
+    assert [a['title'] for a in data['recent_activities']] == ['Fotossíntese', 'Frações', 'Antiga']
+    assert build_student_dashboard(9999) is None
+
+
+def test_progress_write_invalidates_cached_dashboard(app, clean_db):
+    dashboard._dashboard_cache.clear()
+    student_id = _student(clean_db)
+    client = app.test_client()
+
+    first = client.get(f'/api/dashboard/stats?student_id={student_id}').get_json()['data']
+    assert first['progress']['exercises_completed'] == 0
+
+    response = client.post(f'/api/gamification/students/{student_id}/progress', json={
+        'subject': 'Matemática', 'topic': 'Frações', 'progress_percentage': 40,
+        'exercises_completed': 3, 'exercises_correct': 2, 'time_spent_minutes': 20
+    })
+    assert response.get_json()['success']
+
+    data = client.get(f'/api/dashboard/students/{student_id}/stats').get_json()['data']
+    assert data['progress']['exercises_completed'] == 3
+    assert data['subjects']['matemática']['progress'] == 40
+    assert data['user']['streak'] == 1
+    assert client.get('/api/dashboard/stats').status_code == 400
+    assert client.get('/api/dashboard/students/9999/stats').status_code == 404
+
+
+def test_writes_in_other_workers_reach_cached_dashboard(app, clean_db, count_queries):
+    from src.models.problem_of_day import ProblemOfDay
+
+    dashboard._dashboard_cache.clear()
+    student_id = _student(clean_db)
+    assert dashboard.get_student_dashboard(student_id)['progress']['exercises_completed'] == 0
+
+    # Leitura em cache: só a versão é consultada
+    with count_queries(clean_db.engine) as statements:
+        dashboard.get_student_dashboard(student_id)
+    assert len(statements) == 1
+
+    # Escrita feita por outro worker: sem invalidação neste processo, só a versão muda
+    clean_db.session.add(ActivityLog(student_id=student_id, activity_type='exercise', subject='Matemática',
+                                     topic='Frações', points_earned=10, time_spent_minutes=5))
+    dashboard.bump_dashboard_version(student_id)
+    clean_db.session.commit()
+    dashboard._dashboard_cache.set(student_id, (0, {'stale': True}))
+    assert dashboard.get_student_dashboard(student_id)['recent_activities'][0]['title'] == 'Frações'
+
+    # Submissões do problema do dia também avançam a versão
+    problem = ProblemOfDay(title='P', description='-', category='logic', difficulty='beginner')
+    clean_db.session.add(problem)
+    clean_db.session.commit()
+    version = dashboard.dashboard_version(student_id)
+    client = app.test_client()
+    client.post(f'/api/problems/{problem.id}/submit', json={'student_id': student_id, 'answer': 'quatro'})
+    assert dashboard.dashboard_version(student_id) == version + 1
@@ -0,0 +1,86 @@
+from src.models.problem_of_day import DailyProblemAssignment, ProblemOfDay
+from src.models.user import User
+from src.models.student import Student
+from src.services import dashboard_bootstrap
+from src.services.problem_of_day import assign_daily_problems, invalidate_todays_problem, utc_today
+
+
+def _student(db):
+    user = User(username='ana', email='ana@curio.test')
+    db.session.add(user)
+    db.session.flush()
+    student = Student(user_id=user.id, grade_level='5')
+    db.session.add(student)
+    db.session.commit()
+    return student.id
+
+
+def _clear_sections():
+    for section in dashboard_bootstrap.SECTIONS.values():
+        section.cache.clear()
+
+
+def test_bootstrap_returns_every_section_with_metadata(app, clean_db):
+    _clear_sections()
+    student_id = _student(clean_db)
+    client = app.test_client()
+
+    body = client.get(f'/api/dashboard/bootstrap?student_id={student_id}').get_json()
+    assert body['status'] == 'success'
+    assert set(body['sections']) == set(dashboard_bootstrap.SECTIONS)
+    assert body['sections']['stats']['data']['user']['name'] == 'ana'
+    assert body['sections']['stats']['cached'] is False
+    assert body['sections']['quick_actions']['ttl_seconds'] == 3600
+
+    again = client.get(f'/api/dashboard/bootstrap?student_id={student_id}&sections=stats').get_json()
+    assert list(again['sections']) == ['stats']
+    assert again['sections']['stats']['cached'] is True
+    _clear_sections()
+
+
+def test_progress_write_refreshes_student_sections(app, clean_db):
+    _clear_sections()
+    student_id = _student(clean_db)
+    client = app.test_client()
+    url = f'/api/dashboard/bootstrap?student_id={student_id}&sections=progress,activities'
+    client.get(url)
+
+    client.post(f'/api/gamification/students/{student_id}/progress',
+                json={'subject': 'Ciências', 'topic': 'Plantas', 'exercises_completed': 2})
+
+    sections = client.get(url).get_json()['sections']
+    assert sections['progress']['cached'] is False
+    assert sections['progress']['data']['total_exercises'] == 2
+    assert len(sections['activities']['data']) == 1
+    _clear_sections()
+
+
+def test_problem_of_day_section_is_the_students_assignment(app, clean_db):
+    _clear_sections()
+    invalidate_todays_problem()
+    for i, difficulty in enumerate(['beginner', 'intermediate', 'advanced']):
+        clean_db.session.add(ProblemOfDay(title=f'P{i}', description='-', category='logic', difficulty=difficulty))
+    clean_db.session.commit()
+    student_id = _student(clean_db)
+    assign_daily_problems()
+    expected = DailyProblemAssignment.query.filter_by(student_id=student_id).one().problem_id
+
+    client = app.test_client()
+    url = f'/api/dashboard/bootstrap?student_id={student_id}&sections=problem_of_day'
+    section = client.get(url).get_json()['sections']['problem_of_day']
+    assert section['data']['id'] == expected
+    # Mesma resposta de /problems/today?student_id=
+    assert section['data'] == client.get(f'/api/problems/today?student_id={student_id}').get_json()['problem']
+    assert client.get(url).get_json()['sections']['problem_of_day']['cached'] is True
+    # Mesmo dia (UTC) da atribuição, em qualquer fuso do servidor
+    assert dashboard_bootstrap.SECTIONS['problem_of_day'].cache.get((utc_today(), student_id)) is not None
+    _clear_sections()
+    invalidate_todays_problem()
+
+
+def test_bootstrap_validation(app, clean_db):
+    client = app.test_client()
+    assert client.get('/api/dashboard/bootstrap').status_code == 400
+    assert client.get('/api/dashboard/bootstrap?student_id=999').status_code == 404
+    student_id = _student(clean_db)
+    assert client.get(f'/api/dashboard/bootstrap?student_id={student_id}&sections=x').status_code == 400
@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+from src.db_config import engine_options, normalize_database_url
+
+
+def test_sqlite_connections_use_wal(app, clean_db):
+    with clean_db.engine.connect() as conn:
+        assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+        assert conn.execute(text('PRAGMA synchronous')).scalar() == 1  # NORMAL
+        assert conn.execute(text('PRAGMA busy_timeout')).scalar() == 5000
+
+
+def test_server_database_pool_options(monkeypatch):
+    monkeypatch.setenv('WEB_THREADS', '4')
+    monkeypatch.setenv('DASHBOARD_SECTION_WORKERS', '3')
+    monkeypatch.setenv('GRADING_WORKERS', '2')
+    monkeypatch.setenv('DB_POOL_RECYCLE', '600')
+    url = normalize_database_url('postgres://curio:senha@db:5432/curio')
+    assert url == 'postgresql://curio:senha@db:5432/curio'
+
+    options = engine_options(url)
+    # Requisições + seções do dashboard + correção em fila
+    assert options['pool_size'] == 9
+    assert options['pool_recycle'] == 600
+    assert options['pool_pre_ping'] is True
@@ -0,0 +1,64 @@
+import pytest
+from flask import Flask
+
+from src.db_config import configure_database, install_engine_events
+from src.db_routing import REPLICA_BIND, read_replica
+from src.models.user import db
+from src.models.student import Student
+from src.models.user import User
+from src.routes import reports
+from src.routes.reports import reports_bp
+
+
+@pytest.fixture
+def replica_app(monkeypatch, tmp_path):
+    """App com primário e "réplica" em dois arquivos SQLite independentes"""
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setenv('DATABASE_READ_URL', f"sqlite:///{tmp_path / 'replica.db'}")
+
+    app = Flask(__name__)
+    configure_database(app)
+    db.init_app(app)
+    install_engine_events(app, db)
+    app.register_blueprint(reports_bp, url_prefix='/api')
+
+    with app.app_context():
+        for engine in db.engines.values():
+            db.metadata.create_all(bind=engine)
+        # Só a réplica tem um estudante
+        with db.engines[REPLICA_BIND].begin() as conn:
+            conn.execute(User.__table__.insert(), {'id': 1, 'username': 'r', 'email': 'r@curio.test'})
+            conn.execute(Student.__table__.insert(), {'id': 1, 'user_id': 1, 'grade_level': '5'})
+    yield app
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registra um metadata vazio para cada bind no `db` compartilhado
+    db.metadatas.pop(REPLICA_BIND, None)
+
+
+def test_read_only_blueprint_reads_from_replica(replica_app):
+    reports._reports_cache.clear()
+    response = replica_app.test_client().get('/api/reports/overview')
+    assert response.get_json()['total_students'] == 1
+    reports._reports_cache.clear()
+
+
+def test_unmarked_queries_use_primary(replica_app):
+    with replica_app.app_context():
+        assert Student.query.count() == 0
+        with read_replica():
+            assert Student.query.count() == 1
+
+
+def test_writes_pin_the_request_to_primary(replica_app):
+    with replica_app.app_context():
+        with read_replica():
+            user = User(username='p', email='p@curio.test')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Student(user_id=user.id, grade_level='4'))
+            db.session.commit()
+            # Read-your-writes: a leitura vê o que acabou de ser gravado no primário
+            assert Student.query.filter_by(grade_level='4').count() == 1
+            assert Student.query.count() == 1
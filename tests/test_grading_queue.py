@@ -0,0 +1,107 @@
+import time
+from datetime import datetime, timedelta
+
+from src.models.problem_of_day import ProblemOfDay, ProblemSubmission
+from src.services import grading_queue
+from src.services import answer_rubric
+
+RUBRIC = '{"groups": [{"numbers": [12]}], "pass_score": 1}'
+
+
+def _problem(db):
+    problem = ProblemOfDay(title='Área', description='-', category='geometry',
+                           difficulty='beginner', rubric=RUBRIC)
+    db.session.add(problem)
+    db.session.commit()
+    answer_rubric._rubric_cache.clear()
+    return problem.id
+
+
+def test_claim_process_and_metrics(clean_db):
+    problem_id = _problem(clean_db)
+    right = grading_queue.enqueue_submission(1, problem_id, 'A área é 12')
+    wrong = grading_queue.enqueue_submission(1, problem_id, 'A área é 14')
+    stuck = grading_queue.enqueue_submission(1, problem_id, 'Dá 12')
+    stuck.status, stuck.claimed_at = 'grading', datetime.utcnow() - timedelta(hours=1)
+    clean_db.session.commit()
+
+    metrics = grading_queue.queue_metrics()
+    assert (metrics['pending'], metrics['grading']) == (2, 1)
+
+    # Uma segunda reivindicação não pega o que já foi reivindicado
+    claimed = grading_queue.claim_pending(limit=10)
+    assert sorted(claimed) == sorted([right.id, wrong.id, stuck.id])
+    assert grading_queue.claim_pending(limit=10) == []
+
+    for submission in ProblemSubmission.query:
+        submission.status = 'pending'
+    clean_db.session.commit()
+    assert grading_queue.drain() == {'graded': 3, 'failed': 0}
+
+    results = {s.id: s for s in ProblemSubmission.query}
+    assert results[right.id].is_correct and not results[wrong.id].is_correct
+    assert all(s.status == 'graded' and s.feedback for s in results.values())
+    metrics = grading_queue.queue_metrics()
+    assert metrics['pending'] == 0 and metrics['latency_seconds']['samples'] == 3
+
+
+def test_failures_are_retried_then_marked_failed(clean_db, monkeypatch):
+    problem_id = _problem(clean_db)
+    submission_id = grading_queue.enqueue_submission(1, problem_id, 'Dá 12').id
+
+    def broken(problem_id, answer):
+        raise RuntimeError('avaliador indisponível')
+
+    monkeypatch.setattr(grading_queue, 'evaluate_answer', broken)
+    for _ in range(grading_queue.GRADING_MAX_ATTEMPTS):
+        assert grading_queue.process_pending() == {'graded': 0, 'failed': 1}
+
+    submission = clean_db.session.get(ProblemSubmission, submission_id)
+    assert submission.status == 'failed' and submission.attempts == grading_queue.GRADING_MAX_ATTEMPTS
+    assert 'indisponível' in submission.grading_error
+
+
+def test_async_submit_is_graded_in_background(app, clean_db):
+    problem_id = _problem(clean_db)
+    client = app.test_client()
+
+    # Padrão continua síncrono
+    inline = client.post(f'/api/problems/{problem_id}/submit', json={'student_id': 1, 'answer': 'Dá 12'})
+    assert inline.status_code == 200 and inline.get_json()['is_correct'] is True
+
+    try:
+        response = client.post(f'/api/problems/{problem_id}/submit',
+                               json={'student_id': 1, 'answer': 'A área é 12', 'async': True})
+        assert response.status_code == 202
+        status_url = response.get_json()['status_url']
+
+        deadline = time.monotonic() + 5
+        while True:
+            data = client.get(status_url).get_json()
+            if data['status'] == 'graded' or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        assert data['status'] == 'graded' and data['submission']['is_correct'] is True
+    finally:
+        grading_queue.stop_grading_workers()
+
+    metrics = client.get('/api/problems/grading/metrics').get_json()['metrics']
+    assert metrics['pending'] == 0 and metrics['latency_seconds']['samples'] == 1
+    assert client.get('/api/problems/submissions/999').status_code == 404
+
+
+def test_stale_claim_does_not_overwrite_or_double_count(clean_db):
+    from src.models.problem_of_day import ProblemStats
+
+    problem_id = _problem(clean_db)
+    submission_id = grading_queue.enqueue_submission(1, problem_id, 'Dá 12').id
+    first_claim = datetime.utcnow() - timedelta(seconds=grading_queue.GRADING_CLAIM_TIMEOUT + 1)
+    assert grading_queue.claim_pending(now=first_claim) == [submission_id]
+
+    # O primeiro worker demorou; outro reivindica de novo e corrige
+    assert grading_queue.process_pending() == {'graded': 1, 'failed': 0}
+    submission = clean_db.session.get(ProblemSubmission, submission_id)
+    assert not grading_queue.grade(submission, first_claim)
+    clean_db.session.commit()
+
+    assert ProblemStats.query.filter_by(problem_id=problem_id).one().submissions == 1
@@ -0,0 +1,75 @@
+import json
+
+from src.models.problem_of_day import HintReveal, ProblemOfDay
+from src.prefork import warm_up
+from src.services import hints
+from src.services.hints import get_hint_ladder, parse_hints
+
+LADDER = ['Leia o enunciado', 'Calcule a área de cada parte', 'Some as áreas']
+
+
+def _problem(db, solution_hints=json.dumps(LADDER)):
+    problem = ProblemOfDay(title='Área', description='-', category='geometry', difficulty='beginner',
+                           solution_hints=solution_hints)
+    db.session.add(problem)
+    db.session.commit()
+    hints.invalidate_hint_ladder()
+    return problem.id
+
+
+def test_parse_hints():
+    assert parse_hints(json.dumps(LADDER)) == tuple(LADDER)
+    assert parse_hints('Só um texto') == ('Só um texto',)
+    assert parse_hints(None) == () and parse_hints('["", " "]') == ()
+
+
+def test_ladders_are_warmed_prefork_and_served_without_queries(app, clean_db, count_queries):
+    problem_id = _problem(clean_db)
+    warm_up(app, freeze_gc=False)
+    client = app.test_client()
+
+    with count_queries(clean_db.engine) as statements:
+        for _ in range(5):
+            data = client.get(f'/api/problems/{problem_id}/hint').get_json()
+    assert statements == []
+    assert data == {'success': True, 'hint': LADDER[0], 'level': 1, 'total_hints': 3,
+                    'remaining': 2, 'revealed_hints': LADDER[:1]}
+    assert client.get(f'/api/problems/{problem_id}/hint?level=9').get_json()['hint'] == LADDER[-1]
+
+
+def test_progressive_reveal_per_student(app, clean_db):
+    problem_id = _problem(clean_db)
+    client = app.test_client()
+    url = f'/api/problems/{problem_id}/hint?student_id=7'
+
+    assert client.get(f'/api/problems/{problem_id}/hints?student_id=7').get_json()['level'] == 0
+    levels = [client.get(url).get_json()['level'] for _ in range(4)]
+    assert levels == [1, 2, 3, 3]
+    assert client.get(f'/api/problems/{problem_id}/hint?student_id=8').get_json()['hint'] == LADDER[0]
+
+    revealed = client.get(f'/api/problems/{problem_id}/hints?student_id=7').get_json()
+    assert revealed['revealed_hints'] == LADDER and revealed['remaining'] == 0
+    assert clean_db.session.get(HintReveal, (7, problem_id)).revealed == 3
+
+
+def test_reveal_increments_in_the_database(app, clean_db, count_queries):
+    problem_id = _problem(clean_db)
+    assert hints.reveal_next_hint(7, problem_id, len(LADDER)) == 1
+
+    # O avanço é um UPDATE revealed = revealed + 1 no banco, não ler-somar-gravar
+    with count_queries(clean_db.engine) as statements:
+        assert hints.reveal_next_hint(7, problem_id, len(LADDER)) == 2
+    assert any('revealed + ' in statement for statement in statements)
+    assert hints.reveal_next_hint(7, problem_id, len(LADDER)) == 3
+    assert hints.reveal_next_hint(7, problem_id, len(LADDER)) == 3
+    assert hints.reveal_next_hint(8, problem_id, 0) == 0
+    assert hints.reveal_next_hint(8, problem_id, 0) == 0
+
+
+def test_default_hint_and_missing_problem(app, clean_db):
+    problem_id = _problem(clean_db, solution_hints=None)
+    client = app.test_client()
+    data = client.get(f'/api/problems/{problem_id}/hint?student_id=1').get_json()
+    assert data['hint'] == hints.DEFAULT_HINT and data['total_hints'] == 0
+    assert client.get('/api/problems/999/hint').status_code == 404
+    assert get_hint_ladder(999) is None
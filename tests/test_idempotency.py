@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+from src.models.problem_of_day import ProblemOfDay, ProblemSubmission
+from src.services import answer_rubric, idempotency
+from src.services.idempotency import find_submission, submission_key
+
+
+def _problem(db):
+    problem = ProblemOfDay(title='Área', description='-', category='geometry', difficulty='beginner',
+                           rubric='{"groups": [{"numbers": [12]}], "pass_score": 1}')
+    db.session.add(problem)
+    db.session.commit()
+    answer_rubric._rubric_cache.clear()
+    idempotency._responses.clear()
+    return problem.id
+
+
+def test_keys_scope_and_normalization():
+    key, window = submission_key(1, 2, 'A  área é\n12')
+    assert (key, window) == submission_key(1, 2, 'A área é 12')
+    assert window == idempotency.SUBMISSION_DEDUP_WINDOW
+    assert key != submission_key(2, 2, 'A área é 12')[0]
+
+    client_key, client_window = submission_key(1, 2, 'qualquer', 'abc-123')
+    assert client_key == submission_key(1, 2, 'outra resposta', 'abc-123')[0]
+    assert client_window == idempotency.IDEMPOTENCY_KEY_TTL
+
+
+def test_retry_returns_stored_result_without_new_row(app, clean_db, monkeypatch):
+    problem_id = _problem(clean_db)
+    client = app.test_client()
+    url = f'/api/problems/{problem_id}/submit'
+
+    first = client.post(url, json={'student_id': 1, 'answer': 'Dá 12'})
+    assert first.status_code == 200
+
+    calls = []
+    monkeypatch.setattr('src.services.problem_submissions.evaluate_answer',
+                        lambda *args: calls.append(args))
+    retry = client.post(url, json={'student_id': 1, 'answer': ' Dá   12 '})
+    assert retry.status_code == 200 and retry.headers['Idempotent-Replayed'] == 'true'
+    assert retry.get_json()['duplicate'] and retry.get_json()['is_correct'] is True
+    assert retry.get_json()['submission']['id'] == first.get_json()['submission']['id']
+
+    # Outro worker (sem o cache do processo) esbarra no índice único e devolve a linha gravada
+    idempotency._responses.clear()
+    again = client.post(url, json={'student_id': 1, 'answer': 'Dá 12'})
+    assert again.headers['Idempotent-Replayed'] == 'true'
+    replayed = again.get_json()
+    assert replayed.pop('duplicate') is True
+    assert replayed == first.get_json()  # pontos, confiança e sugestão incluídos
+
+    assert calls == []
+    assert ProblemSubmission.query.count() == 1
+
+
+def test_client_key_and_window(app, clean_db, monkeypatch):
+    problem_id = _problem(clean_db)
+    # Sem threads de correção: a submissão fica pendente
+    monkeypatch.setattr('src.services.problem_submissions.start_grading_workers', lambda app: None)
+    client = app.test_client()
+    url = f'/api/problems/{problem_id}/submit'
+    headers = {'Idempotency-Key': 'envio-1'}
+
+    queued = client.post(url, json={'student_id': 1, 'answer': 'Dá 12', 'async': True}, headers=headers)
+    assert queued.status_code == 202
+    # Mesmo com outro texto, a mesma chave devolve a submissão na fila
+    retry = client.post(url, json={'student_id': 1, 'answer': 'Dá 13', 'async': True}, headers=headers)
+    assert retry.status_code == 202 and retry.get_json()['status'] == 'pending'
+    assert ProblemSubmission.query.count() == 1
+
+    # Fora da janela a chave não vale mais
+    key, window = submission_key(1, problem_id, 'Dá 12', 'envio-1')
+    assert find_submission(key, window) is not None
+    assert find_submission(key, window, now=datetime.utcnow() + timedelta(seconds=window + 1)) is None
+
+
+def test_expired_key_is_released_for_a_new_submission(app, clean_db):
+    problem_id = _problem(clean_db)
+    client = app.test_client()
+    url = f'/api/problems/{problem_id}/submit'
+
+    first = client.post(url, json={'student_id': 1, 'answer': 'Dá 12'}).get_json()
+    key, window = submission_key(1, problem_id, 'Dá 12')
+    old = clean_db.session.get(ProblemSubmission, first['submission_id'])
+    old.submitted_at = datetime.utcnow() - timedelta(seconds=window + 1)
+    clean_db.session.commit()
+    idempotency._responses.clear()
+
+    again = client.post(url, json={'student_id': 1, 'answer': 'Dá 12'})
+    assert again.status_code == 200 and 'Idempotent-Replayed' not in again.headers
+    assert again.get_json()['submission_id'] != first['submission_id']
+    assert ProblemSubmission.query.filter_by(idempotency_key=key).one().id == again.get_json()['submission_id']
+    assert ProblemSubmission.query.count() == 2
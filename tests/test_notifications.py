@@ -0,0 +1,87 @@
+from datetime import date
+
+from src.models.user import User
+from src.models.student import Student
+from src.models.gamification import StudyStreak
+from src.models.notification import Notification
+from src.services.dashboard import dashboard_version
+from src.services.notifications import (
+    create_notification, fan_out, list_notifications, mark_read, students_without_study_today, unread_count
+)
+
+
+def _students(db, count):
+    ids = []
+    for i in range(count):
+        user = User(username=f'n{i}', email=f'n{i}@curio.test')
+        db.session.add(user)
+        db.session.flush()
+        student = Student(user_id=user.id, grade_level='3')
+        db.session.add(student)
+        db.session.flush()
+        ids.append(student.id)
+    db.session.commit()
+    return ids
+
+
+def test_counter_and_keyset_pages(clean_db):
+    student_id, = _students(clean_db, 1)
+    for i in range(5):
+        create_notification(student_id, 'tip', f'Dica {i}', 'Estude um pouco todo dia')
+    assert unread_count(student_id) == 5
+
+    first, cursor = list_notifications(student_id, limit=2)
+    assert [n['title'] for n in first] == ['Dica 4', 'Dica 3']
+    assert first[0]['icon'] == 'lightbulb'
+    second, cursor = list_notifications(student_id, before=cursor, limit=2)
+    assert [n['title'] for n in second] == ['Dica 2', 'Dica 1']
+    last, cursor = list_notifications(student_id, before=cursor, limit=2)
+    assert [n['title'] for n in last] == ['Dica 0'] and cursor is None
+
+    assert mark_read(student_id, [first[0]['id'], first[0]['id'], second[0]['id']]) == 2
+    assert mark_read(student_id, [first[0]['id']]) == 0
+    assert unread_count(student_id) == 3
+    assert mark_read(student_id) == 3
+    assert unread_count(student_id) == 0
+
+
+def test_fan_out_in_batches(clean_db, count_queries):
+    ids = _students(clean_db, 5)
+    clean_db.session.add(StudyStreak(student_id=ids[0], last_study_date=date(2026, 3, 2)))
+    clean_db.session.commit()
+    create_notification(ids[1], 'tip', 'Antes', '-')
+
+    selected = list(students_without_study_today(today=date(2026, 3, 2), chunk_size=2))
+    assert selected == ids[1:]
+
+    with count_queries(clean_db.engine) as statements:
+        assert fan_out(selected, 'reminder', 'Hora de estudar!', '-', batch_size=2) == 4
+    inserts = [s for s in statements if s.startswith('INSERT INTO notifications')]
+    assert len(inserts) == 2
+    # Contadores novos: um INSERT multi-linha por lote, não um SAVEPOINT por estudante
+    assert len([s for s in statements if s.startswith('INSERT INTO notification_counters')]) == 2
+    assert len([s for s in statements if s.startswith('SAVEPOINT')]) <= 4
+
+    # A seção de notificações do dashboard em cache é refeita em qualquer worker
+    assert [dashboard_version(i) for i in ids] == [0, 2, 1, 1, 1]
+
+    assert [unread_count(i) for i in ids] == [0, 2, 1, 1, 1]
+    assert Notification.query.filter_by(type='reminder').count() == 4
+
+
+def test_notification_endpoints_and_cli(app, clean_db):
+    ids = _students(clean_db, 3)
+    result = app.test_cli_runner().invoke(args=['curio', 'notify', 'problem_of_day', '--batch-size', '2'])
+    assert result.exit_code == 0, result.output
+    assert '3 notificações criadas' in result.output
+
+    client = app.test_client()
+    body = client.get(f'/api/dashboard/notifications?student_id={ids[0]}').get_json()
+    assert body['unread_count'] == 1
+    assert body['data'][0]['type'] == 'problem_of_day'
+    assert body['next_cursor'] is None
+
+    response = client.post('/api/dashboard/notifications/read', json={'student_id': ids[0]})
+    assert response.get_json()['marked_read'] == 1
+    assert client.get(f'/api/dashboard/notifications/unread-count?student_id={ids[0]}').get_json()['unread_count'] == 0
+    assert client.get('/api/dashboard/notifications').status_code == 400
@@ -0,0 +1,29 @@
+from src.models.gamification import Achievement
+from src.prefork import after_fork, warm_up
+from src.services import achievement_catalog
+
+
+def test_warm_up_loads_shared_state_and_leaves_no_connections(app, clean_db):
+    clean_db.session.add(Achievement(name='Primeiro Passo', description='-', category='progress',
+                                     requirement_type='exercises_completed', requirement_value=1))
+    clean_db.session.commit()
+    achievement_catalog.invalidate_achievement_catalog()
+
+    warm_up(app, freeze_gc=False)
+
+    from src.routes import ai_advanced
+    assert ai_advanced._ai_engine is not None
+    assert [a['name'] for a in achievement_catalog.get_achievement_catalog()] == ['Primeiro Passo']
+    assert all(engine.pool.checkedout() == 0 for engine in clean_db.engines.values())
+
+    after_fork(app)
+    assert Achievement.query.count() == 1
+
+
+def test_seed_invalidates_catalog(app, clean_db):
+    achievement_catalog.invalidate_achievement_catalog()
+    client = app.test_client()
+    assert client.get('/api/gamification/achievements').get_json()['achievements'] == []
+
+    assert client.post('/api/gamification/achievements/seed').get_json()['success']
+    assert len(client.get('/api/gamification/achievements').get_json()['achievements']) > 0
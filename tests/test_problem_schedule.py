@@ -0,0 +1,130 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+from src.models.problem_of_day import DailyProblemAssignment, ProblemOfDay, ProblemSchedule, ProblemSubmission
+from src.models.student import Student
+from src.models.user import User
+from src.services.problem_of_day import (
+    assign_daily_problems, get_problem_for_date, get_student_problem, grade_band, invalidate_todays_problem,
+    schedule_problems
+)
+
+START = date(2026, 3, 1)
+
+
+def _problems(db):
+    combos = [('logic', 'beginner'), ('logic', 'advanced'), ('finance', 'beginner'), ('data', 'intermediate')]
+    for i, (category, difficulty) in enumerate(combos * 2):
+        db.session.add(ProblemOfDay(title=f'P{i}', description='-', category=category, difficulty=difficulty))
+    db.session.commit()
+
+
+def test_schedule_is_balanced_and_deterministic(clean_db):
+    _problems(clean_db)
+    state = random.getstate()
+    assert schedule_problems(START, days=16) == 16
+    assert random.getstate() == state  # nenhum efeito no RNG global
+
+    rows = ProblemSchedule.query.order_by(ProblemSchedule.scheduled_date).all()
+    problems = [row.problem for row in rows]
+    assert Counter(p.id for p in problems) == {p.id: 2 for p in ProblemOfDay.query}
+    assert set(Counter((p.category, p.difficulty) for p in problems).values()) == {4}
+    assert all(a.category != b.category for a, b in zip(problems, problems[1:]))
+
+    # Datas já agendadas são mantidas
+    assert schedule_problems(START, days=20) == 4
+    assert ProblemSchedule.query.filter_by(scheduled_date=START).one().problem_id == problems[0].id
+
+
+def test_today_schedules_on_demand(app, clean_db):
+    _problems(clean_db)
+    invalidate_todays_problem()
+    problem = get_problem_for_date(START + timedelta(days=3))
+    assert problem is not None
+    assert ProblemSchedule.query.count() == 30
+
+    today = app.test_client().get('/api/problems/today').get_json()
+    assert today['success']
+    again = app.test_client().get('/api/problems/today').get_json()
+    assert today['problem']['id'] == again['problem']['id']
+
+
+def test_deactivated_scheduled_problem_is_replaced(clean_db):
+    _problems(clean_db)
+    day = START + timedelta(days=2)
+    scheduled = get_problem_for_date(day)
+    scheduled.is_active = False
+    clean_db.session.commit()
+
+    replacement = get_problem_for_date(day)
+    assert replacement is not None and replacement.is_active and replacement.id != scheduled.id
+    assert ProblemSchedule.query.filter_by(scheduled_date=day).one().problem_id == replacement.id
+    # As demais datas agendadas continuam como estavam
+    assert ProblemSchedule.query.count() == 30
+
+
+def _students(db, grades):
+    ids = []
+    for i, grade in enumerate(grades):
+        user = User(username=f'aluno{i}', email=f'aluno{i}@curio.test')
+        db.session.add(user)
+        db.session.flush()
+        student = Student(user_id=user.id, grade_level=grade)
+        db.session.add(student)
+        db.session.flush()
+        ids.append(student.id)
+    db.session.commit()
+    return ids
+
+
+def test_grade_bands():
+    assert [grade_band(g) for g in ('K', '2', '5', '8', '12', None)] == \
+        ['early', 'early', 'middle', 'upper', 'upper', 'middle']
+
+
+def test_daily_assignments_follow_band_and_avoid_repeats(clean_db):
+    _problems(clean_db)
+    early, upper, solver = _students(clean_db, ['1', '9', '1'])
+    by_id = {p.id: p for p in ProblemOfDay.query}
+
+    for day_offset in range(3):
+        assign_daily_problems(START + timedelta(days=day_offset), chunk_size=2)
+    assert DailyProblemAssignment.query.count() == 9
+
+    early_problems = [get_student_problem(early, START + timedelta(days=d)) for d in range(3)]
+    assert all(p.difficulty == 'beginner' for p in early_problems)
+    assert len({p.id for p in early_problems}) == 3  # sem repetir dentro da janela
+    assert get_student_problem(upper, START).difficulty in ('intermediate', 'advanced')
+
+    # Quem já resolveu o problema da faixa recebe outro
+    day = START + timedelta(days=10)
+    band_problem = None
+    assign_daily_problems(day)
+    band_problem = get_student_problem(early, day).id
+    clean_db.session.add(ProblemSubmission(student_id=solver, problem_id=band_problem, answer='x'))
+    DailyProblemAssignment.query.filter_by(assignment_date=day).delete()
+    clean_db.session.commit()
+    assert assign_daily_problems(day) == 3
+    assert assign_daily_problems(day) == 0  # idempotente
+    solver_problem = by_id[get_student_problem(solver, day).id]
+    assert solver_problem.id != band_problem
+    assert solver_problem.difficulty == 'beginner'
+
+
+def test_today_uses_student_assignment(app, clean_db, count_queries):
+    _problems(clean_db)
+    invalidate_todays_problem()
+    (student_id,) = _students(clean_db, ['10'])
+    assign_daily_problems()
+    expected = DailyProblemAssignment.query.filter_by(student_id=student_id).one().problem_id
+
+    client = app.test_client()
+    with count_queries(clean_db.engine) as statements:
+        data = client.get(f'/api/problems/today?student_id={student_id}').get_json()
+    assert data['problem']['id'] == expected
+    assert len(statements) == 1
+
+    # Estudante sem atribuição cai no agendamento global
+    fallback = client.get('/api/problems/today?student_id=999').get_json()
+    assert fallback['success'] and fallback['problem']['id'] == get_problem_for_date().id
@@ -0,0 +1,70 @@
+from src.models.problem_of_day import ProblemOfDay, ProblemStats, ProblemSubmission
+from src.services import answer_rubric, grading_queue, idempotency
+from src.services.problem_stats import (
+    CALIBRATION_MIN_SUBMISSIONS, confidence_bucket, get_problem_stats, rebuild_problem_stats, record_submission
+)
+
+
+def _problem(db, title='Área'):
+    problem = ProblemOfDay(title=title, description='-', category='geometry', difficulty='beginner',
+                           rubric='{"groups": [{"numbers": [12]}], "pass_score": 1}')
+    db.session.add(problem)
+    db.session.commit()
+    answer_rubric._rubric_cache.clear()
+    idempotency._responses.clear()
+    return problem.id
+
+
+def test_confidence_buckets():
+    assert [confidence_bucket(c) for c in (0, 0.19, 0.2, 0.99, 1.0, None)] == [0, 0, 1, 4, 4, None]
+
+
+def test_submissions_update_counters_in_the_same_transaction(app, clean_db, count_queries):
+    problem_id = _problem(clean_db)
+    other_id = _problem(clean_db, 'Perímetro')
+    client = app.test_client()
+
+    client.post(f'/api/problems/{problem_id}/submit', json={'student_id': 1, 'answer': 'Dá 12', 'time_spent': 4})
+    client.post(f'/api/problems/{problem_id}/submit', json={'student_id': 2, 'answer': 'Dá 14', 'time_spent': 6})
+    grading_queue.enqueue_submission(3, other_id, 'Dá 12')
+    grading_queue.drain()
+
+    stats = get_problem_stats(problem_id)
+    assert (stats['total_submissions'], stats['correct_submissions'], stats['success_rate']) == (2, 1, 50.0)
+    assert stats['avg_time_spent'] == 5.0
+    assert stats['confidence_histogram'] == [1, 0, 0, 0, 1]
+    assert stats['calibrated_difficulty'] is None
+
+    with count_queries(clean_db.engine) as statements:
+        data = client.get('/api/problems/stats').get_json()['stats']
+    assert (data['total_submissions'], data['correct_submissions'], data['total_problems']) == (3, 2, 2)
+    assert len(statements) == 2
+    assert client.get(f'/api/problems/{other_id}/stats').get_json()['stats']['total_submissions'] == 1
+
+    # Recalcular a partir das submissões chega aos mesmos contadores (sem o histograma)
+    assert rebuild_problem_stats() == 3
+    rebuilt = get_problem_stats(problem_id)
+    assert (rebuilt['total_submissions'], rebuilt['correct_submissions'], rebuilt['avg_time_spent']) == (2, 1, 5.0)
+    assert get_problem_stats()['total_submissions'] == 3
+
+
+def test_failed_grading_does_not_count(clean_db, monkeypatch):
+    problem_id = _problem(clean_db)
+    grading_queue.enqueue_submission(1, problem_id, 'Dá 12')
+
+    def broken(submission_problem_id, is_correct, time_spent, confidence):
+        record_submission(submission_problem_id, is_correct, time_spent, confidence)
+        raise RuntimeError('falhou depois de contar')
+
+    monkeypatch.setattr(grading_queue, 'record_submission', broken)
+    assert grading_queue.process_pending() == {'graded': 0, 'failed': 1}
+    assert ProblemStats.query.count() == 0
+
+
+def test_calibrated_difficulty(clean_db):
+    problem_id = _problem(clean_db)
+    for i in range(CALIBRATION_MIN_SUBMISSIONS):
+        record_submission(problem_id, is_correct=i < 5, time_spent=0, confidence=0.5)
+    clean_db.session.commit()
+    assert get_problem_stats(problem_id)['calibrated_difficulty'] == 'advanced'
+    assert ProblemSubmission.query.count() == 0
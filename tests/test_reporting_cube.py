@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+from src.models.user import User
+from src.models.student import Student
+from src.models.content import Content
+from src.models.progress import Progress
+from src.models.gamification import ActivityLog
+from src.models.problem_of_day import ProblemOfDay, ProblemSubmission
+from src.models.reporting import ReportCubeCell
+from src.services.reporting_cube import query_cube, refresh_cube
+
+MONDAY = datetime(2026, 3, 2, 10, 0)
+NEXT_MONDAY = MONDAY + timedelta(days=7)
+
+
+def _student(db, name, grade):
+    user = User(username=name, email=f'{name}@curio.test')
+    db.session.add(user)
+    db.session.flush()
+    student = Student(user_id=user.id, grade_level=grade)
+    db.session.add(student)
+    db.session.flush()
+    return student
+
+
+def _seed(db):
+    concrete = Content(title='Blocos', subject='Mathematics', grade_level='4', content_type='game',
+                       difficulty_level='easy', singapore_method_stage='concrete')
+    reading = Content(title='Leitura', subject='Portuguese', grade_level='4', content_type='text',
+                      difficulty_level='easy')
+    problem = ProblemOfDay(title='Troco', description='-', category='personal_finance', difficulty='beginner')
+    db.session.add_all([concrete, reading, problem])
+    ana, bia = _student(db, 'ana', '4'), _student(db, 'bia', '5')
+    db.session.flush()
+
+    db.session.add_all([
+        Progress(student_id=ana.id, content_id=concrete.id, status='completed', score=90, time_spent=10,
+                 created_at=MONDAY, updated_at=MONDAY),
+        Progress(student_id=bia.id, content_id=concrete.id, status='in_progress', score=70, time_spent=20,
+                 created_at=MONDAY + timedelta(days=3), updated_at=MONDAY),
+        Progress(student_id=ana.id, content_id=reading.id, status='completed', score=80, time_spent=5,
+                 created_at=NEXT_MONDAY, updated_at=NEXT_MONDAY),
+        ActivityLog(student_id=ana.id, activity_type='exercise', subject='Mathematics', points_earned=10,
+                    time_spent_minutes=10, created_at=MONDAY + timedelta(days=1)),
+        ProblemSubmission(student_id=bia.id, problem_id=problem.id, answer='5', is_correct=True,
+                          submitted_at=MONDAY + timedelta(days=2)),
+        ProblemSubmission(student_id=bia.id, problem_id=problem.id, answer='4', is_correct=False,
+                          submitted_at=MONDAY + timedelta(days=2)),
+    ])
+    db.session.commit()
+    return ana, concrete
+
+
+def test_full_refresh_and_slices(clean_db):
+    _seed(clean_db)
+    assert refresh_cube(now=NEXT_MONDAY + timedelta(days=1))['weeks'] == 2
+
+    by_week = query_cube(group_by=['week_start'])
+    assert [(r['week_start'], r['progress_records'], r['submissions']) for r in by_week] == [
+        ('2026-03-02', 2, 2), ('2026-03-09', 1, 0)
+    ]
+
+    concrete = query_cube(group_by=['grade_level'], filters={'singapore_stage': 'concrete'})
+    assert [(r['grade_level'], r['avg_score'], r['completion_rate']) for r in concrete] == [
+        ('4', 90, 100), ('5', 70, 0)
+    ]
+
+    totals = query_cube(filters={'grade_level': '5'}, date_to=MONDAY.date())
+    assert totals[0]['success_rate'] == 50
+    assert query_cube(filters={'subject': 'History'}) == []
+
+
+def test_incremental_refresh_only_rebuilds_changed_weeks(clean_db):
+    ana, concrete = _seed(clean_db)
+    refreshed_at = NEXT_MONDAY + timedelta(days=1)
+    refresh_cube(now=refreshed_at)
+    cells_before = {c.week_start: c.id for c in ReportCubeCell.query.filter_by(grade_level='4')}
+
+    late = refreshed_at + timedelta(hours=1)
+    clean_db.session.add(Progress(student_id=ana.id, content_id=concrete.id, status='completed', score=100,
+                                  time_spent=15, created_at=NEXT_MONDAY, updated_at=late))
+    clean_db.session.commit()
+
+    assert refresh_cube(now=late + timedelta(minutes=1))['weeks'] == 1
+    cells_after = {c.week_start: c.id for c in ReportCubeCell.query.filter_by(grade_level='4')}
+    assert cells_after[MONDAY.date()] == cells_before[MONDAY.date()]
+    assert query_cube(filters={'grade_level': '4'}, date_from=NEXT_MONDAY.date())[0]['progress_records'] == 2
+
+
+def test_late_grading_refreshes_submission_week(clean_db):
+    _seed(clean_db)
+    bia = Student.query.filter_by(grade_level='5').one()
+    queued = ProblemSubmission(student_id=bia.id, problem_id=ProblemOfDay.query.one().id, answer='5',
+                               status='pending', submitted_at=MONDAY + timedelta(days=2))
+    clean_db.session.add(queued)
+    clean_db.session.commit()
+    refreshed_at = NEXT_MONDAY + timedelta(days=1)
+    refresh_cube(now=refreshed_at)
+    # Pendente não conta como submissão errada
+    assert query_cube(filters={'grade_level': '5'}, date_to=MONDAY.date())[0]['submissions'] == 2
+
+    # A fila corrige bem depois do envio (e da última atualização do cubo)
+    graded_at = refreshed_at + timedelta(hours=2)
+    queued.status, queued.is_correct, queued.graded_at = 'graded', True, graded_at
+    clean_db.session.commit()
+
+    assert refresh_cube(now=graded_at + timedelta(minutes=1))['weeks'] == 1
+    week = query_cube(filters={'grade_level': '5'}, date_to=MONDAY.date())[0]
+    assert (week['submissions'], week['correct_submissions']) == (3, 2)
+
+
+def test_cube_endpoint(app, clean_db):
+    _seed(clean_db)
+    refresh_cube()
+    client = app.test_client()
+
+    response = client.get('/api/reports/cube?group_by=subject&grade_level=4')
+    assert [row['subject'] for row in response.get_json()['rows']] == ['Mathematics', 'Portuguese']
+    assert client.get('/api/reports/cube?group_by=teacher').status_code == 400
@@ -0,0 +1,63 @@
+from src.models.user import User
+from src.models.student import Student
+from src.models.content import Content
+from src.models.progress import Progress
+from src.models.gamification import StudentProgress
+from src.routes import reports
+from src.services.reports import build_overview
+
+
+def _seed(db, num_students):
+    math = Content(title='Frações', subject='Mathematics', grade_level='4',
+                   content_type='video', difficulty_level='easy')
+    science = Content(title='Plantas', subject='Science', grade_level='5',
+                      content_type='text', difficulty_level='easy')
+    db.session.add_all([math, science])
+    for i in range(num_students):
+        user = User(username=f'r{i}', email=f'r{i}@curio.test')
+        db.session.add(user)
+        db.session.flush()
+        student = Student(user_id=user.id, grade_level='4' if i % 2 == 0 else '5')
+        db.session.add(student)
+        db.session.flush()
+        db.session.add_all([
+            Progress(student_id=student.id, content_id=math.id, status='completed', score=80, time_spent=10),
+            Progress(student_id=student.id, content_id=science.id, status='in_progress', score=60, time_spent=30),
+            StudentProgress(student_id=student.id, subject='mathematics', topic='frações',
+                            progress_percentage=50),
+        ])
+    db.session.commit()
+
+
+def test_overview_aggregates_in_sql(clean_db, count_queries):
+    _seed(clean_db, num_students=4)
+
+    with count_queries(clean_db.engine) as statements:
+        overview = build_overview()
+
+    assert len(statements) == 7  # independe do número de registros
+    assert overview['total_students'] == 4
+    assert overview['total_progress_records'] == 8
+    assert overview['avg_progress_percentage'] == 50
+    assert overview['avg_score'] == 70
+    assert overview['by_status'] == [
+        {'status': 'completed', 'records': 4, 'students': 4, 'avg_score': 80, 'avg_time_minutes': 10},
+        {'status': 'in_progress', 'records': 4, 'students': 4, 'avg_score': 60, 'avg_time_minutes': 30},
+    ]
+    assert [row['subject'] for row in overview['by_subject']] == ['Mathematics', 'Science']
+    assert [(row['grade_level'], row['students']) for row in overview['by_grade']] == [('4', 2), ('5', 2)]
+
+
+def test_overview_endpoint_serves_cached_snapshot(app, clean_db):
+    reports._reports_cache.clear()
+    client = app.test_client()
+    _seed(clean_db, num_students=1)
+    assert client.get('/api/reports/overview').get_json()['total_students'] == 1
+
+    user = User(username='novo', email='novo@curio.test')
+    clean_db.session.add(user)
+    clean_db.session.flush()
+    clean_db.session.add(Student(user_id=user.id, grade_level='4'))
+    clean_db.session.commit()
+    assert client.get('/api/reports/overview').get_json()['total_students'] == 1
+    reports._reports_cache.clear()
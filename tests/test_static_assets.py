@@ -0,0 +1,119 @@
+import gzip
+import json
+
+from flask import Flask, request
+
+from src.main import create_app
+from src.static_assets import MANIFEST_NAME, StaticAssets, compress_assets, load_asset_index
+
+
+def _build(tmp_path):
+    (tmp_path / 'assets').mkdir()
+    (tmp_path / 'index.html').write_text('<html>' + 'curió ' * 400 + '</html>')
+    (tmp_path / 'assets' / 'app-abc123.js').write_text('console.log("oi");\n' * 200)
+    (tmp_path / 'assets' / 'logo.png').write_bytes(b'\x89PNG' + bytes(2048))
+    (tmp_path / 'favicon.svg').write_text('<svg/>')
+    return tmp_path
+
+
+def test_compress_assets_writes_siblings_and_manifest(tmp_path):
+    static_dir = _build(tmp_path)
+    assets = compress_assets(str(static_dir))
+
+    script = assets['assets/app-abc123.js']
+    assert 'gzip' in script['encodings']
+    original = (static_dir / 'assets' / 'app-abc123.js').read_bytes()
+    assert gzip.decompress((static_dir / 'assets' / 'app-abc123.js.gz').read_bytes()) == original
+    # Binários e arquivos pequenos ficam sem versão comprimida
+    assert assets['assets/logo.png']['encodings'] == {}
+    assert assets['favicon.svg']['encodings'] == {}
+
+    manifest = json.loads((static_dir / MANIFEST_NAME).read_text())
+    assert manifest['assets'] == assets
+    # O índice do manifesto e o da varredura da pasta são iguais
+    index = load_asset_index(str(static_dir))
+    (static_dir / MANIFEST_NAME).unlink()
+    assert load_asset_index(str(static_dir)) == index
+    assert 'assets/app-abc123.js.gz' not in index
+
+
+def test_response_negotiates_encoding_and_etag(tmp_path):
+    static_dir = _build(tmp_path)
+    compress_assets(str(static_dir))
+    assets = StaticAssets(str(static_dir))
+    asset = assets.get('assets/app-abc123.js')
+    app = Flask(__name__)
+
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip, deflate'}):
+        response = assets.response(asset, request)
+        response.direct_passthrough = False
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert gzip.decompress(response.get_data()).startswith(b'console.log')
+        etag = response.headers['ETag']
+
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag}):
+        assert assets.response(asset, request).status_code == 304
+
+    with app.test_request_context(headers={'Accept-Encoding': 'identity', 'If-None-Match': etag}):
+        response = assets.response(asset, request)
+        assert response.status_code == 200 and 'Content-Encoding' not in response.headers
+
+
+def test_spa_serves_build_from_index():
+    client = create_app('static').test_client()
+
+    index = client.get('/')
+    assert index.status_code == 200 and index.headers['Cache-Control'].startswith('no-cache')
+    assert client.get('/', headers={'If-None-Match': index.headers['ETag']}).status_code == 304
+
+    # Rotas da SPA caem no index.html; arquivos do build têm cache longo
+    assert client.get('/dashboard').get_data() == index.get_data()
+    favicon = client.get('/favicon.svg')
+    assert favicon.status_code == 200 and 'immutable' in favicon.headers['Cache-Control']
+    assert client.get('/api/nada').status_code == 404
+
+
+def test_index_html_served_from_memory_and_reloaded(tmp_path, monkeypatch):
+    static_dir = _build(tmp_path)
+    compress_assets(str(static_dir))
+    assets = StaticAssets(str(static_dir))
+    app = Flask(__name__)
+
+    def no_disk(*args, **kwargs):
+        raise AssertionError('index.html não deveria ser lido do disco')
+
+    monkeypatch.setattr('src.static_assets.send_file', no_disk)
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = assets.response(assets.get('index.html'), request)
+        assert gzip.decompress(response.get_data()).startswith(b'<html>curi')
+        old_etag = response.headers['ETag']
+
+    # Novo build: percebido pela mudança do manifesto
+    (static_dir / 'index.html').write_text('<html>novo build ' + 'x' * 2000 + '</html>')
+    compress_assets(str(static_dir))
+    monkeypatch.setattr('src.static_assets.ASSET_RELOAD_INTERVAL', 0)
+    with app.test_request_context():
+        response = assets.response(assets.get('index.html'), request)
+        assert response.get_data().startswith(b'<html>novo build')
+        assert response.headers['ETag'] != old_etag
+
+
+def test_asset_from_previous_build_keeps_its_own_bytes(tmp_path):
+    static_dir = _build(tmp_path)
+    compress_assets(str(static_dir))
+    assets = StaticAssets(str(static_dir))
+    app = Flask(__name__)
+    old = assets.get('index.html')
+    assert 'gzip' in old.encodings
+
+    # Novo build, pequeno demais para ter .gz, trocado enquanto a requisição antiga está em andamento
+    (static_dir / 'index.html').write_text('<html>novo</html>')
+    compress_assets(str(static_dir))
+    assets.reload()
+    assert assets.get('index.html').encodings == ()
+
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = assets.response(old, request)
+        assert response.headers['ETag'] == f'"{old.etag}-gzip"'
+        assert gzip.decompress(response.get_data()).startswith(b'<html>curi')
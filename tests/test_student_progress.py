@@ -0,0 +1,64 @@
+from src.services.student_progress import get_progress_rows, load_analysis_input
+
+
+def _seed_student(db, num_contents=8):
+    from src.models.user import User
+    from src.models.student import Student
+    from src.models.content import Content
+    from src.models.progress import Progress
+
+    user = User(username='aluna', email='aluna@curio.test')
+    db.session.add(user)
+    db.session.flush()
+    student = Student(user_id=user.id, grade_level='4')
+    db.session.add(student)
+    db.session.flush()
+    for i in range(num_contents):
+        content = Content(title=f'Conteúdo {i}', subject='Mathematics' if i % 2 else 'Science',
+                          grade_level='4', content_type='video' if i % 3 else 'game',
+                          difficulty_level='easy')
+        db.session.add(content)
+        db.session.flush()
+        db.session.add(Progress(student_id=student.id, content_id=content.id,
+                                status='completed', score=60 + i, time_spent=20))
+    db.session.commit()
+    student_id = student.id
+    db.session.expunge_all()
+    return student_id
+
+
+def test_analysis_input_is_a_single_query(clean_db, count_queries):
+    student_id = _seed_student(clean_db, num_contents=8)
+
+    with count_queries(clean_db.engine) as statements:
+        student_data = load_analysis_input(student_id)
+
+    assert len(statements) == 1
+    assert len(student_data['progress_records']) == 8
+    assert student_data['progress_records'][0]['content'] == {
+        'content_type': 'game', 'difficulty_level': 'easy', 'subject': 'Science'
+    }
+
+
+def test_recent_rows_carry_content_columns(clean_db, count_queries):
+    student_id = _seed_student(clean_db, num_contents=4)
+
+    with count_queries(clean_db.engine) as statements:
+        rows = get_progress_rows(student_id, limit=3, newest_first=True)
+        subjects = [row.subject for row in rows]
+
+    assert len(statements) == 1
+    assert len(subjects) == 3
+
+
+def test_personalization_analysis_loads_content_in_one_query(app, clean_db, count_queries):
+    student_id = _seed_student(clean_db, num_contents=6)
+
+    with count_queries(clean_db.engine) as statements:
+        response = app.test_client().post(f'/api/simple/analyze/{student_id}')
+
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()['analysis_summary']['strengths'] == []
+    # Progresso e conteúdo vêm juntos: nenhum SELECT de content por registro
+    assert len([s for s in statements if 'FROM content' in s]) == 0
+    assert len([s for s in statements if 'FROM progress' in s]) == 1
@@ -0,0 +1,81 @@
+from src.ai_tutor_engine import CONVERSATION_STARTERS
+from src.models.ai_tutor_chat import ChatSession
+from src.models.problem_of_day import ProblemOfDay
+from src.models.student import Student
+from src.models.user import User
+from src.services import tutor
+
+
+def _student(db):
+    user = User(username='aluno', email='aluno@curio.test')
+    db.session.add(user)
+    db.session.flush()
+    student = Student(user_id=user.id, grade_level='5')
+    db.session.add(student)
+    db.session.commit()
+    return student.id
+
+
+def test_chat_flow_uses_response_cache(app, clean_db, monkeypatch):
+    student_id = _student(clean_db)
+    tutor._response_cache.clear()
+    calls = []
+
+    def generate_response(message, history, context):
+        calls.append(message)
+        return {'message': f'Resposta para {message}', 'type': 'educational'}
+
+    monkeypatch.setattr(tutor.ai_tutor, 'generate_response', generate_response)
+    client = app.test_client()
+
+    started = client.post('/api/tutor/chat/start', json={'student_id': student_id}).get_json()
+    session_id = started['session']['id']
+    assert started['welcome_message']['message'] in CONVERSATION_STARTERS
+
+    url = f'/api/tutor/chat/{session_id}/message'
+    first = client.post(url, json={'message': 'Como somar números?'}).get_json()
+    assert first['tutor_response']['message'] == 'Resposta para Como somar números?'
+    assert first['performance']['cache_hit'] is False
+
+    # Mesma pergunta em outra sessão do mesmo contexto: resposta do cache
+    other = client.post('/api/tutor/chat/start', json={'student_id': student_id}).get_json()
+    second = client.post(f"/api/tutor/chat/{other['session']['id']}/message",
+                         json={'message': 'como somar números'}).get_json()
+    assert second['performance']['cache_hit'] is True
+    assert calls == ['Como somar números?']
+
+    history = client.get(f'{url[:-len("/message")]}/history?per_page=2').get_json()
+    assert [m['sender'] for m in history['messages']] == ['student', 'tutor']
+    assert history['pagination']['total'] == 3 and history['session']['id'] == session_id
+
+    summary = client.get(f'/api/tutor/chat/{session_id}/summary').get_json()
+    assert summary['summary']['educational_responses'] == 1 and summary['cached'] is False
+    assert client.get(f'/api/tutor/chat/{session_id}/summary').get_json()['cached'] is True
+
+    ended = client.post(f'/api/tutor/chat/{session_id}/end').get_json()
+    assert ended['session']['is_active'] is False
+    closed = client.post(url, json={'message': 'oi'})
+    assert closed.status_code == 400
+    assert client.post('/api/tutor/chat/999/message', json={'message': 'oi'}).status_code == 404
+
+    performance = client.get('/api/tutor/performance').get_json()['performance']
+    assert performance['cache_hit_ratio'] == 0.5
+
+
+def test_student_sessions_load_titles_in_one_query(app, clean_db, count_queries):
+    student_id = _student(clean_db)
+    problems = [ProblemOfDay(title=f'P{i}', description='-', category='logic', difficulty='beginner')
+                for i in range(3)]
+    clean_db.session.add_all(problems)
+    clean_db.session.flush()
+    for problem in problems:
+        clean_db.session.add(ChatSession(student_id=student_id, problem_id=problem.id))
+    clean_db.session.add(ChatSession(student_id=student_id))
+    clean_db.session.commit()
+    clean_db.session.expunge_all()
+
+    with count_queries(clean_db.engine) as statements:
+        sessions = tutor.student_sessions(student_id)
+    assert {s.get('problem_title') for s in sessions} == {'P0', 'P1', 'P2', None}
+    titles = [s for s in statements if 'problems_of_day' in s]
+    assert len(titles) == 1